@@ -0,0 +1,67 @@
+# --- PROGRESS AGGREGATES ---
+# Counts shown in the sidebar and on the Dashboard (topics done overall and
+# per module, and the self-assessment confidence histogram). The index is
+# built once when a study store is created and then kept up to date one
+# topic at a time, so reading any count is O(1) however big the syllabus.
+
+CONFIDENCE_LEVELS = ("Not Confident", "Somewhat Confident", "Very Confident")
+
+
+def confidence_level(survey):
+    """Maps a saved survey answer to its confidence level, or None."""
+    if not survey:
+        return None
+    for level in CONFIDENCE_LEVELS:
+        if survey.startswith(level):
+            return level
+    return None
+
+
+class ProgressIndex:
+    """Incrementally maintained progress counts for one user's study data."""
+
+    def __init__(self, study_data):
+        self.rebuild(study_data)
+
+    def rebuild(self, study_data):
+        """Recomputes every count from scratch (used when the data is replaced)."""
+        self.total = 0
+        self.completed = 0
+        self.modules = {}
+        self.confidence = {level: 0 for level in CONFIDENCE_LEVELS}
+        self._topics = {}
+        for module_key, topics in study_data["modules"].items():
+            self.modules[module_key] = [0, len(topics)]
+            self.total += len(topics)
+            for topic_name, topic_data in topics.items():
+                self._topics[(module_key, topic_name)] = (False, None)
+                self.update_topic(module_key, topic_name, topic_data)
+
+    def update_topic(self, module_key, topic_name, topic_data):
+        """Refreshes the counts for one topic after its done flag or survey changed."""
+        done = bool(topic_data.get("done"))
+        level = confidence_level(topic_data.get("survey")) if done else None
+        old_done, old_level = self._topics[(module_key, topic_name)]
+        if done != old_done:
+            step = 1 if done else -1
+            self.completed += step
+            self.modules[module_key][0] += step
+        if level != old_level:
+            if old_level:
+                self.confidence[old_level] -= 1
+            if level:
+                self.confidence[level] += 1
+        self._topics[(module_key, topic_name)] = (done, level)
+
+    def progress(self):
+        """Returns (completed, total) topics."""
+        return self.completed, self.total
+
+    def module_progress(self, module_key):
+        """Returns (completed, total) topics in one module."""
+        completed, total = self.modules[module_key]
+        return completed, total
+
+    def confidence_counts(self):
+        """Returns the number of done topics at each confidence level."""
+        return dict(self.confidence)
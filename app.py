@@ -0,0 +1,904 @@
+import streamlit as st
+import copy
+import datetime
+import heapq
+import itertools
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from streamlit.errors import StreamlitAPIException
+
+from content import discover_courses, load_course, new_study_data
+from labs.views import LABS
+from media_ingest import DEFAULT_SETTINGS, FORMATS, MAX_DIMENSIONS, QUALITY_TIERS, submit_ingest
+from media_store import MediaStore
+from progress_io import ExportCache, ProgressFormatError, export_progress_json, export_progress_zip, load_progress
+from search import build_content_index, snippet
+from srs import review, survey_grade
+from study_store import DEFAULT_DB_PATH, SessionStudyStore, SQLitePool, SQLiteStudyStore
+
+# --- STUDY TRACKER ENGINE ---
+# One app serves every course content pack under courses/. Run it directly
+# (`streamlit run app.py`) to get a course selector in the sidebar, or from
+# a per-course entry point (CN.py, FLAT.py) that pins a single course.
+# Course content, the media store and the SQLite pool are loaded once per
+# process and shared by all sessions and courses.
+
+APP_TITLE = "KTU S5 Study Tracker"
+
+# Streamlit serves <main script dir>/static at app/static/ when static serving
+# is on (see .streamlit/config.toml). PDFs are published there by hash.
+STATIC_MEDIA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "media")
+STATIC_MEDIA_URL = "app/static/media"
+
+# The PYQ Practice view lists this many questions per page.
+PYQS_PER_PAGE = 10
+
+# Worker threads shared by every session for processing uploads.
+INGEST_WORKERS = min(4, os.cpu_count() or 1)
+
+# Number of results the sidebar search shows.
+SEARCH_RESULTS = 8
+
+# Number of upcoming reviews listed under the current card in Due Today.
+DUE_LIST_LENGTH = 10
+
+PYQ_VIEW = "✍️ PYQ Practice"
+DUE_VIEW = "🗓️ Due Today"
+
+SURVEY_OPTIONS = ["---", "Not Confident (Need Review)", "Somewhat Confident", "Very Confident (Ready for Exam)"]
+
+# --- (1) DATA INITIALIZATION ---
+# The syllabus content (definitions, tips and PYQs) of each course lives in
+# courses/<course_id>/course.json; each user's study data only holds what
+# they edit.
+
+@st.cache_resource
+def get_courses():
+    """Returns every course content pack by id. Shared between sessions, so read-only."""
+    return {course_id: load_course(course_id) for course_id in discover_courses()}
+
+@st.cache_resource
+def get_search_index():
+    """Returns the process-wide search index over every course pack's syllabus text."""
+    return build_content_index(get_courses())
+
+def get_initial_data(course):
+    """
+    Fresh study data for one user: done flags, notes, links, media, survey
+    and PYQ answers for every topic and question in the course.
+    """
+    return new_study_data(course)
+
+# --- (2) HELPER FUNCTIONS ---
+# These handle file/data conversions
+
+@st.cache_resource
+def get_media_store():
+    """Returns the process-wide media store (shared by every session)."""
+    return MediaStore()
+
+@st.cache_resource
+def get_ingest_pool():
+    """Returns the process-wide thread pool that processes uploaded files."""
+    return ThreadPoolExecutor(max_workers=INGEST_WORKERS, thread_name_prefix="ingest")
+
+@st.cache_resource
+def get_sqlite_pool():
+    """Returns the process-wide SQLite connection pool, or None if no database is configured."""
+    return SQLitePool(DEFAULT_DB_PATH) if DEFAULT_DB_PATH else None
+
+# --- Study store ---
+# Every write to study_data goes through the session's StudyStore for the
+# course, which gives the data a new version (anything derived from the whole
+# state, like the save file, is cached against it) and, with a database
+# configured and a profile chosen, saves the changed field to SQLite.
+
+def get_store(course):
+    """Returns this session's StudyStore for a course, switching stores when the profile changes."""
+    pool = get_sqlite_pool()
+    profile = st.session_state.get("profile", "").strip() if pool else ""
+    stores = st.session_state.setdefault("study_stores", {})
+    store = stores.get(course["id"])
+    if store is not None and getattr(store, "profile", "") == profile:
+        return store
+    if profile:
+        new_store = SQLiteStudyStore(pool, profile, course["code"], get_initial_data(course))
+        if store is not None and not store.persistent:
+            # Keep what was done before the profile was entered
+            new_store.merge(store.data)
+    else:
+        new_store = SessionStudyStore(get_initial_data(course))
+    stores[course["id"]] = new_store
+    return new_store
+
+def export_snapshot(course, store):
+    """
+    Returns a copy of the study data as of the store's current version. The
+    export is built off the script thread, so it works from this copy while
+    the page goes on editing the live data.
+    """
+    snapshots = st.session_state.setdefault("export_snapshots", {})
+    snapshot = snapshots.get(course["id"])
+    if snapshot is None or snapshot[0] != store.version:
+        snapshot = snapshots[course["id"]] = (store.version, copy.deepcopy(store.data))
+    return snapshot[1]
+
+def progress_download(course, store, fmt="json"):
+    """
+    Returns a callable for st.download_button that builds the progress file
+    ("json" or "zip") only when the user clicks it. The file is reused until
+    the data changes. Building it is memory-flat, but Streamlit holds the
+    finished file in memory while sending it.
+    """
+    media_store = get_media_store()
+    version = store.version
+    study_data = export_snapshot(course, store)
+    if "export_cache" not in st.session_state:
+        st.session_state.export_cache = ExportCache()
+    cache = st.session_state.export_cache
+
+    def build():
+        # Runs on a separate thread, so only the captured objects are used.
+        export = export_progress_zip if fmt == "zip" else export_progress_json
+        path = cache.get((course["id"], fmt), version, lambda: export(study_data, media_store))
+        with open(path, "rb") as f:
+            return f.read()
+
+    return build
+
+def ingest_settings():
+    """Returns the upload settings chosen in the sidebar (or the defaults)."""
+    return {name: st.session_state.get(f"ingest_{name}", default) for name, default in DEFAULT_SETTINGS.items()}
+
+def pending_uploads(course, kind, module_key, item):
+    """Returns this session's in-progress ingest jobs for one topic's or PYQ's media list."""
+    jobs = st.session_state.setdefault("ingest_jobs", {})
+    return jobs.setdefault((course["id"], kind, module_key, item), [])
+
+def start_ingest(course, kind, module_key, item, files):
+    """Queues uploaded files for background processing; they show as placeholders until done."""
+    jobs = pending_uploads(course, kind, module_key, item)
+    settings = ingest_settings()
+    for file in files:
+        jobs.append(submit_ingest(get_ingest_pool(), get_media_store(), file, settings))
+
+def attach_finished_uploads(course, store):
+    """
+    Moves every finished ingest job of this course out of the pending lists
+    and attaches its files to the store. Runs on every script run, so files
+    are saved even when their progress placeholders aren't on screen.
+    """
+    for (course_id, job_kind, job_module, job_item), jobs in st.session_state.get("ingest_jobs", {}).items():
+        if course_id != course["id"]:
+            continue
+        refs = []
+        for job in [job for job in jobs if job.done()]:
+            jobs.remove(job)
+            if job.future.exception() is not None:
+                st.toast(f"Couldn't add {job.name}: {job.future.exception()}")
+            else:
+                refs.extend(job.future.result())
+        if not refs:
+            continue
+        if job_kind == "topic":
+            media_list = store.data["modules"][job_module][job_item]["my_photos_bytes"]
+            store.set_topic_field(job_module, job_item, "my_photos_bytes", add_media_refs(media_list, refs))
+        else:
+            media_list = store.data["pyqs"][job_module][job_item]["my_files"]
+            store.set_pyq_field(job_module, job_item, "my_files", add_media_refs(media_list, refs))
+
+@st.fragment(run_every=1)
+def render_pending_uploads(course, store, kind, module_key, item):
+    """
+    Shows per-file progress for uploads still being processed, polling once
+    a second. When one finishes the app reruns, which attaches its files
+    and shows them.
+    """
+    jobs = pending_uploads(course, kind, module_key, item)
+    for job in jobs:
+        st.progress(job.progress, text=f"{job.name}: {job.status}")
+    if any(job.done() for job in jobs):
+        st.rerun()
+
+def add_media_refs(media_list, refs):
+    """Returns the media list with new references appended, skipping files already attached (same hash)."""
+    media_list = list(media_list)
+    known = {entry["hash"] for entry in media_list}
+    for ref in refs:
+        if ref["hash"] not in known:
+            media_list.append(ref)
+            known.add(ref["hash"])
+    return media_list
+
+def rerun_fragment():
+    """
+    Reruns only the fragment being run. A fragment also runs as part of a
+    full script run (e.g. the first render), where Streamlit only allows a
+    full rerun.
+    """
+    try:
+        st.rerun(scope="fragment")
+    except StreamlitAPIException:
+        st.rerun()
+
+def reset_uploader(key):
+    """Gives a file uploader a fresh key so it forgets the files it holds."""
+    st.session_state[f"{key}_nonce"] = st.session_state.get(f"{key}_nonce", 0) + 1
+
+def uploader_key(key):
+    return f"{key}_{st.session_state.get(f'{key}_nonce', 0)}"
+
+def display_media(ref, key):
+    """
+    Displays a stored media file (image or PDF) in Streamlit. Images show as
+    a thumbnail; the full-resolution file is only sent when toggled open.
+    PDFs show a first-page preview and are embedded by URL, so the browser
+    fetches (and caches) the file itself instead of it riding every rerun.
+    """
+    file_name = ref["name"]
+    try:
+        store = get_media_store()
+        if not store.exists(ref["hash"]):
+            st.warning(f"File {file_name} is missing from the media store.")
+        elif ref["mime"].startswith("image/"):
+            thumb = store.thumbnail(ref["hash"])
+            if thumb is None or st.toggle("Full size", key=f"{key}_full"):
+                st.image(store.path(ref["hash"]), caption=file_name, width="stretch")
+            else:
+                st.image(thumb, caption=file_name)
+        elif ref["mime"] == "application/pdf":
+            preview = store.thumbnail(ref["hash"])
+            if preview is not None:
+                st.image(preview, caption=file_name)
+            if st.get_option("server.enableStaticServing"):
+                url = f"{STATIC_MEDIA_URL}/{store.publish(ref['hash'], STATIC_MEDIA_DIR, '.pdf')}"
+                if st.toggle("Show PDF", key=f"{key}_full"):
+                    pdf_display = f'<iframe src="{url}" width="700" height="500" type="application/pdf"></iframe>'
+                    st.markdown(pdf_display, unsafe_allow_html=True)
+                st.markdown(f"[Open {file_name} in a new tab]({url})")
+            else:
+                # Without static serving, only send the file when it's asked for
+                st.download_button(f"Download {file_name}", lambda: store.open(ref["hash"]),
+                                   file_name=file_name, mime="application/pdf", key=f"{key}_download")
+        else:
+            st.warning(f"Can't preview file type: {file_name}")
+    except Exception as e:
+        st.error(f"Error displaying file {file_name}: {e}")
+
+# --- Search ---
+# Syllabus text is searched in the shared index; notes and typed answers in
+# the search index of each study store opened in this session.
+
+def search_study(query, course_ids):
+    """Returns the best (score, (course_id, kind, module, item), source) hits for a query."""
+    best = {}
+    for score, doc_id in get_search_index().search(query, SEARCH_RESULTS, where=lambda doc_id: doc_id[0] in course_ids):
+        best[doc_id] = (score, doc_id, "syllabus")
+    stores = st.session_state.get("study_stores", {})
+    for course_id in course_ids:
+        if course_id not in stores:
+            continue
+        for score, user_doc_id in stores[course_id].text_index.search(query, SEARCH_RESULTS):
+            doc_id = (course_id,) + user_doc_id
+            if doc_id not in best or best[doc_id][0] < score:
+                best[doc_id] = (score, doc_id, "notes")
+    return sorted(best.values(), key=lambda hit: hit[0], reverse=True)[:SEARCH_RESULTS]
+
+def search_hit_text(doc_id, source):
+    """The text a search hit matched, for its snippet."""
+    course_id, kind, module_key, item = doc_id
+    if source == "notes":
+        study_data = st.session_state["study_stores"][course_id].data
+        return study_data["modules"][module_key][item]["my_notes"] if kind == "topic" else study_data["pyqs"][module_key][item]["my_text"]
+    course = get_courses()[course_id]
+    return course["modules"][module_key][item]["definition"] if kind == "topic" else course["pyqs"][module_key][item]["q"]
+
+def open_search_hit(doc_id, switch_course):
+    """Navigates to a search hit's topic, or opens its PYQ (runs as a button callback)."""
+    course_id, kind, module_key, item = doc_id
+    if switch_course:
+        st.session_state["course"] = course_id
+    if kind == "topic":
+        open_topic(course_id, module_key, item)
+    else:
+        open_pyq(course_id, module_key, item)
+
+# These set the navigation widgets' state, so they must run as button
+# callbacks (before the widgets are drawn).
+
+def open_topic(course_id, module_key, topic_name):
+    st.session_state[f"{course_id}_view"] = module_key
+    st.session_state[f"{course_id}_{module_key}_topic"] = topic_name
+
+def open_pyq(course_id, module_key, index):
+    st.session_state[f"{course_id}_view"] = PYQ_VIEW
+    st.session_state[f"{course_id}_pyq_module"] = module_key
+    st.session_state[f"{course_id}_{module_key}_pyq_page"] = index // PYQS_PER_PAGE + 1
+    st.session_state[f"{course_id}_{module_key}_pyq_open"] = index
+
+def render_search(course_ids, switch_course):
+    query = st.sidebar.text_input("🔎 Search", key="search_query", placeholder="Topics, PYQs and your notes")
+    if not query.strip():
+        return
+    hits = search_study(query, course_ids)
+    if not hits:
+        st.sidebar.caption("No matches.")
+    courses = get_courses()
+    for n, (score, doc_id, source) in enumerate(hits):
+        course_id, kind, module_key, item = doc_id
+        label = item if kind == "topic" else f"PYQ {item + 1} · {module_key}"
+        if switch_course:
+            label = f"{courses[course_id]['code']} · {label}"
+        st.sidebar.button(label, key=f"search_hit_{n}", on_click=open_search_hit, args=(doc_id, switch_course), width="stretch")
+        st.sidebar.caption(("📝 " if source == "notes" else "") + snippet(search_hit_text(doc_id, source), query))
+
+# --- Reviews ---
+# Each study store keeps a ReviewQueue (see srs.py). Due Today merges the
+# queues of the stores opened in this session, so the next card is found
+# without scanning any course's topics.
+
+def end_of_today():
+    tomorrow = datetime.date.today() + datetime.timedelta(days=1)
+    return time.mktime(tomorrow.timetuple())
+
+def due_reviews(course_ids, until):
+    """Yields (due, course_id, item) for every review due by ``until``, soonest first."""
+    stores = st.session_state.get("study_stores", {})
+    return heapq.merge(*(
+        ((due, course_id, item) for due, item in stores[course_id].reviews.iter_due(until))
+        for course_id in course_ids if course_id in stores
+    ))
+
+def record_review(store, kind, module_key, item, grade):
+    """Reschedules a topic or PYQ after a review with an SM-2 grade."""
+    if kind == "topic":
+        card = store.data["modules"][module_key][item].get("srs")
+        store.set_topic_field(module_key, item, "srs", review(card, grade, time.time()))
+    else:
+        card = store.data["pyqs"][module_key][item].get("srs")
+        store.set_pyq_field(module_key, item, "srs", review(card, grade, time.time()))
+
+def grade_due_item(course_id, item, survey):
+    """Grades a Due Today card with a confidence answer (runs as a button callback)."""
+    store = st.session_state["study_stores"][course_id]
+    kind, module_key, name = item
+    record_review(store, kind, module_key, name, survey_grade(survey))
+    if kind == "topic":
+        # A topic's review is also its new self-assessment
+        store.set_topic_field(module_key, name, "survey", survey)
+        st.session_state.pop(f"{course_id}_{module_key}_{name}_survey", None)
+
+# --- (3) VIEWS ---
+
+# --- View 1: Progress Dashboard ---
+def render_dashboard(course, store):
+    cid = course["id"]
+    completed_topics, total_topics = store.index.progress()
+
+    st.title(f"📈 {course['code']} Progress Dashboard")
+    st.markdown("Welcome to your study tracker! Use the sidebar to navigate to a module or practice PYQs.")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.header("Overall Progress")
+        if total_topics > 0:
+            st.progress(completed_topics / total_topics)
+            st.metric(label="Topics Completed", value=f"{completed_topics} / {total_topics}")
+        else:
+            st.info("No topics found.")
+
+    with col2:
+        st.header("Self-Assessment")
+        st.bar_chart(store.index.confidence_counts())
+
+    st.header("Module Progress")
+    for module_key in store.index.modules:
+        completed, total = store.index.module_progress(module_key)
+        st.progress(completed / total if total else 0, text=f"{module_key}: {completed} / {total}")
+
+    # Courses opened in this session (when the app serves several)
+    other_stores = {
+        other_id: other for other_id, other in st.session_state.get("study_stores", {}).items() if other_id != cid
+    }
+    if other_stores:
+        st.header("Other Courses")
+        for other_id, other in other_stores.items():
+            completed, total = other.index.progress()
+            st.progress(completed / total if total else 0, text=f"{get_courses()[other_id]['code']}: {completed} / {total} topics")
+
+
+    st.divider()
+
+    # --- Save/Load Section ---
+    st.header("Save & Load Your Progress")
+    if store.persistent:
+        st.success(f"✅ Your progress is saved automatically to the profile **{store.profile}**. You can still download a copy to keep or to move to another device.")
+    elif get_sqlite_pool() is not None:
+        st.warning("🚨 **IMPORTANT:** You haven't entered a profile name, so your progress is lost when you close this tab. **Enter a profile name in the sidebar** to save automatically, or download a file below and load it when you return.")
+    else:
+        st.warning("🚨 **IMPORTANT:** This app does not have a database. Your progress is lost when you close this tab. **Save your progress by downloading the JSON file** and load it when you return.")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.subheader("Save Progress")
+        st.download_button(
+            "Save My Progress",
+            data=progress_download(course, store),
+            file_name=f"{cid}_progress.json",
+            mime="application/json",
+            type="primary",
+            key=f"{cid}_save_json"
+        )
+        st.download_button(
+            "Save Compact (.zip)",
+            data=progress_download(course, store, "zip"),
+            file_name=f"{cid}_progress.zip",
+            mime="application/zip",
+            key=f"{cid}_save_zip"
+        )
+        st.info("Click a button above to save a file of all your notes, links, and progress. The compact .zip keeps your photos and PDFs as raw files, so it is much smaller for media-heavy progress.")
+
+    with col2:
+        st.subheader("Load Progress")
+        load_warnings = st.session_state.get(f"{cid}_load_warnings")
+        if load_warnings:
+            with st.expander(f"⚠️ {len(load_warnings)} entries were skipped in the last loaded file"):
+                for warning in load_warnings:
+                    st.write(f"- {warning}")
+        load_mode = st.radio(
+            "When loading a file:",
+            ["Merge with my current progress", "Replace my current progress"],
+            help="Merging keeps the most recently edited notes, done flags and answers from either side, and combines links and files from both.",
+            key=f"{cid}_load_mode"
+        )
+        uploaded_file = st.file_uploader(
+            f"Upload your `{cid}_progress.json` or `.zip` file",
+            type=["json", "zip"],
+            key=uploader_key(f"{cid}_progress_uploader")
+        )
+        if uploaded_file is not None:
+            try:
+                # Media goes into the media store; the syllabus content comes
+                # from the course pack, only the user's own fields are taken from the file
+                loaded_data, load_warnings = load_progress(uploaded_file, get_media_store(), get_initial_data(course))
+                if load_mode.startswith("Merge"):
+                    store.merge(loaded_data)
+                else:
+                    store.replace(loaded_data)
+                st.session_state[f"{cid}_load_warnings"] = load_warnings
+                reset_uploader(f"{cid}_progress_uploader")
+                st.success("Progress loaded successfully!")
+                st.info("The page will now reload to reflect your data.")
+                st.rerun()
+            except ProgressFormatError as e:
+                st.error(str(e))
+            except Exception as e:
+                st.error(f"Error loading file: {e}")
+
+# --- View 2: Module Study View ---
+def render_definition(course, topic_content):
+    """Draws a topic's definition from the text and diagram blocks prepared when the course pack was loaded."""
+    for block in topic_content["definition_blocks"]:
+        if block["type"] == "diagram":
+            st.image(block["svg"], caption=block["caption"])
+        else:
+            st.markdown(block["text"], unsafe_allow_html=course.get("allow_html", False))
+
+def render_module_view(course, store, module_key):
+    cid = course["id"]
+    module_data = store.data["modules"][module_key]
+    module_content = course["modules"][module_key]
+    st.title(f"📚 {module_key}")
+    completed, total = store.index.module_progress(module_key)
+    st.caption(f"{completed} / {total} topics done in this module")
+
+    # Topic selection
+    topic_name = st.selectbox("Select a topic to study:", module_data.keys(), key=f"{cid}_{module_key}_topic")
+
+    # Get the content for the selected topic
+    topic_content = module_content[topic_name]
+
+    st.divider()
+
+    # Each part of the topic the user edits is a fragment: typing notes,
+    # adding a link or deleting a file only reruns that part, not the page.
+    render_topic_status(course, store, module_key, topic_name)
+
+    # --- Pre-filled Content ---
+    st.header("🎓 Core Content")
+    labs = [lab for lab in topic_content.get("labs", []) if lab in LABS]
+    tab_def, tab_pyq, tab_strat, *tab_labs = st.tabs(
+        ["📜 Definition", "🎯 PYQ Focus", "💡 Strategy"] + [f"🧪 {LABS[lab][0]}" for lab in labs]
+    )
+    with tab_def:
+        render_definition(course, topic_content)
+    with tab_pyq:
+        st.info(topic_content["pyq_focus"])
+        if topic_content["related_pyqs"]:
+            st.markdown("**Questions from the PYQ bank that hit this topic:**")
+        for link in topic_content["related_pyqs"]:
+            question = course["pyqs"][link["module"]][link["index"]]["q"]
+            st.button(
+                f"{link['module']} · Q{link['index'] + 1}: {question}",
+                key=f"{cid}_{module_key}_{topic_name}_pyq_{link['module']}_{link['index']}",
+                on_click=open_pyq,
+                args=(cid, link["module"], link["index"]),
+                type="tertiary"
+            )
+    with tab_strat:
+        st.success(topic_content["strategy"])
+    for tab, lab in zip(tab_labs, labs):
+        with tab:
+            render_topic_lab(lab, f"{cid}_{module_key}_{topic_name}")
+
+    # --- User's Study Hub ---
+    st.divider()
+    st.header("My Study Hub")
+    tab_notes, tab_links, tab_media = st.tabs(["My Notes", "My Links", "My Media (Photos/Diagrams)"])
+
+    with tab_notes:
+        render_topic_notes(course, store, module_key, topic_name)
+    with tab_links:
+        render_topic_links(course, store, module_key, topic_name)
+    with tab_media:
+        render_topic_media(course, store, module_key, topic_name)
+
+@st.fragment
+def render_topic_status(course, store, module_key, topic_name):
+    """The "Mark as Done" checkbox and, once done, the confidence self-assessment."""
+    topic_data = store.data["modules"][module_key][topic_name]
+    key = f"{course['id']}_{module_key}_{topic_name}"
+
+    # --- Checkbox to mark as done ---
+    # This is the "production-level" way to handle state updates in Streamlit.
+    # The widget's value is set *from* the state.
+    # When the widget is changed by the user, the script reruns.
+    # *After* the widget is rendered, we update the state with the new value.
+    is_done = st.checkbox(
+        "Mark as Done",
+        value=topic_data["done"],
+        key=f"{key}_done"
+    )
+    if store.set_topic_field(module_key, topic_name, "done", is_done):
+        st.rerun()  # The progress counts outside this fragment changed
+
+    # --- Survey (as requested) ---
+    if is_done:
+        st.subheader("🧠 Self-Assessment")
+        st.write("Now that you've marked this topic as done, how confident do you feel?")
+
+        # Find index for radio button
+        current_survey_val = topic_data.get("survey") # Use .get for safety
+        if current_survey_val in SURVEY_OPTIONS:
+            survey_index = SURVEY_OPTIONS.index(current_survey_val)
+        else:
+            survey_index = 0
+
+        response = st.radio(
+            "Confidence Level:",
+            SURVEY_OPTIONS,
+            index=survey_index,
+            horizontal=True,
+            key=f"{key}_survey"
+        )
+
+        survey = response if response != "---" else None
+        if store.set_topic_field(module_key, topic_name, "survey", survey) and survey is not None:
+            # Each new answer counts as a review and reschedules the topic
+            record_review(store, "topic", module_key, topic_name, survey_grade(survey))
+
+@st.fragment
+def render_topic_lab(lab, key):
+    """One of the topic's interactive labs (see labs/)."""
+    LABS[lab][1](key)
+
+@st.fragment
+def render_topic_notes(course, store, module_key, topic_name):
+    topic_data = store.data["modules"][module_key][topic_name]
+    notes = st.text_area(
+        "Add your personal notes, summaries, and questions here...",
+        value=topic_data["my_notes"],
+        height=300,
+        key=f"{course['id']}_{module_key}_{topic_name}_notes"
+    )
+    store.set_topic_field(module_key, topic_name, "my_notes", notes)
+
+@st.fragment
+def render_topic_links(course, store, module_key, topic_name):
+    topic_data = store.data["modules"][module_key][topic_name]
+    key = f"{course['id']}_{module_key}_{topic_name}"
+    st.markdown("Add links to useful YouTube videos, articles, or tutorials.")
+    new_link = st.text_input("Paste a URL:", key=f"{key}_link_input")
+
+    if st.button("Add Link", key=f"{key}_link_btn"):
+        if new_link and new_link.startswith("http"):
+            store.set_topic_field(module_key, topic_name, "my_links", topic_data["my_links"] + [new_link])
+            rerun_fragment() # Refresh to clear input and show new link
+        else:
+            st.warning("Please enter a valid URL (starting with http).")
+
+    st.subheader("My Saved Links:")
+    for i, link in enumerate(topic_data["my_links"]):
+        col1, col2 = st.columns([0.9, 0.1])
+        col1.markdown(f"- [{link}]({link})")
+        if col2.button("X", key=f"{key}_link_del_{i}", help="Delete this link"):
+            store.set_topic_field(module_key, topic_name, "my_links", topic_data["my_links"][:i] + topic_data["my_links"][i + 1:])
+            rerun_fragment()
+
+@st.fragment
+def render_topic_media(course, store, module_key, topic_name):
+    topic_data = store.data["modules"][module_key][topic_name]
+    key = f"{course['id']}_{module_key}_{topic_name}"
+    st.markdown("Upload your own diagrams, mind maps, or photos of handwritten notes.")
+
+    # File uploader for adding new media
+    uploaded_files = st.file_uploader(
+        "Upload files (PNG, JPG, PDF)",
+        accept_multiple_files=True,
+        type=["png", "jpg", "jpeg", "pdf"],
+        key=uploader_key(f"{key}_photos_uploader")
+    )
+
+    if uploaded_files:
+        start_ingest(course, "topic", module_key, topic_name, uploaded_files)
+        # We must reset the file uploader and rerun to show the new files
+        reset_uploader(f"{key}_photos_uploader")
+        rerun_fragment()
+
+    st.subheader("My Saved Media:")
+    if pending_uploads(course, "topic", module_key, topic_name):
+        render_pending_uploads(course, store, "topic", module_key, topic_name)
+    elif not topic_data["my_photos_bytes"]:
+        st.info("No media uploaded for this topic yet.")
+
+    # Display saved media with delete buttons
+    for i, file_data in enumerate(topic_data["my_photos_bytes"]):
+        st.markdown(f"**{file_data['name']}**")
+        display_media(file_data, f"{key}_media_{file_data['hash'][:12]}")
+
+        if st.button(f"Delete {file_data['name']}", key=f"{key}_media_del_{i}"):
+            store.set_topic_field(module_key, topic_name, "my_photos_bytes", topic_data["my_photos_bytes"][:i] + topic_data["my_photos_bytes"][i + 1:])
+            rerun_fragment()
+        st.divider()
+
+# --- View 3: PYQ Practice ---
+def render_pyq_practice(course, store):
+    cid = course["id"]
+    st.title("✍️ PYQ Practice Portal")
+    st.info("Test your knowledge with questions from previous years. Your answers are saved with your progress file.")
+
+    pyq_module = st.selectbox("Select Module:", store.data["pyqs"].keys(), key=f"{cid}_pyq_module")
+
+    st.divider()
+
+    questions = store.data["pyqs"][pyq_module]
+    question_bank = course["pyqs"][pyq_module]
+
+    # Only one page of questions is listed, and only the question whose
+    # answer is open renders its text box, uploader and saved files, so a
+    # rerun costs the same however many questions the module has.
+    page_count = max(1, -(-len(questions) // PYQS_PER_PAGE))
+    page = 1
+    if page_count > 1:
+        page = st.number_input(f"Page (of {page_count})", min_value=1, max_value=page_count, step=1, key=f"{cid}_{pyq_module}_pyq_page")
+    open_key = f"{cid}_{pyq_module}_pyq_open"
+    first = (page - 1) * PYQS_PER_PAGE
+
+    for i in range(first, min(first + PYQS_PER_PAGE, len(questions))):
+        key = f"{cid}_{pyq_module}_q{i}"
+        st.header(f"Question {i+1}")
+        st.markdown(f"**{question_bank[i]['q']}**")
+        related_topics = question_bank[i]["related_topics"]
+        if related_topics:
+            st.caption("📚 Topics to revise: " + " · ".join(link["topic"] for link in related_topics))
+
+        is_open = st.session_state.get(open_key) == i
+        st.button(
+            f"Hide My Answer for Q{i+1}" if is_open else f"Show My Answer for Q{i+1}",
+            key=f"{key}_toggle",
+            on_click=toggle_open_pyq,
+            args=(open_key, i)
+        )
+        if is_open:
+            # Outside the answer fragment: opening a topic reruns the whole app
+            for link in related_topics:
+                st.button(
+                    f"📚 Revise: {link['topic']}",
+                    key=f"{key}_topic_{link['module']}_{link['topic']}",
+                    on_click=open_topic,
+                    args=(cid, link["module"], link["topic"]),
+                    type="tertiary"
+                )
+            with st.container(border=True):
+                render_pyq_answer(course, store, pyq_module, i)
+
+def toggle_open_pyq(open_key, i):
+    """Opens a question's answer panel (closing any other), or closes it if open."""
+    st.session_state[open_key] = None if st.session_state.get(open_key) == i else i
+
+@st.fragment
+def render_pyq_answer(course, store, pyq_module, i):
+    """The answer panel of one PYQ: typed answer, uploader and saved solution files."""
+    key = f"{course['id']}_{pyq_module}_q{i}"
+    q_data = store.data["pyqs"][pyq_module][i]
+
+    # Text Answer
+    answer_text = st.text_area(
+        "Type your answer, notes, or solution plan:",
+        value=q_data["my_text"],
+        key=f"{key}_text"
+    )
+    store.set_pyq_field(pyq_module, i, "my_text", answer_text)
+
+    # File Answer
+    st.subheader("My Solution Files")
+
+    # File uploader for adding new files
+    uploaded_solution = st.file_uploader(
+        "Upload your handwritten solution (PDF, PNG, JPG)",
+        type=["pdf", "png", "jpg", "jpeg"],
+        key=uploader_key(f"{key}_file_uploader")
+    )
+
+    if uploaded_solution:
+        start_ingest(course, "pyq", pyq_module, i, [uploaded_solution])
+        reset_uploader(f"{key}_file_uploader")
+        rerun_fragment()
+
+    # Display saved files
+    if pending_uploads(course, "pyq", pyq_module, i):
+        render_pending_uploads(course, store, "pyq", pyq_module, i)
+    elif not q_data["my_files"]:
+        st.info("No solution files uploaded for this question yet.")
+
+    for file_index, file_data in enumerate(q_data["my_files"]):
+        st.markdown(f"**{file_data['name']}**")
+        display_media(file_data, f"{key}_file_{file_data['hash'][:12]}")
+
+        if st.button(f"Delete {file_data['name']}", key=f"{key}_file_del_{file_index}"):
+            store.set_pyq_field(pyq_module, i, "my_files", q_data["my_files"][:file_index] + q_data["my_files"][file_index + 1:])
+            rerun_fragment()
+        st.divider()
+
+# --- View 4: Due Today ---
+def render_due_today(course_ids, switch_course):
+    st.title("🗓️ Due Today")
+    st.info("Topics come up for review a day after you finish them and PYQs a day after you answer them. Each confidence answer schedules the next review further out, or sooner if you're unsure.")
+    if switch_course:
+        st.caption("Reviews of every course opened in this session are included.")
+
+    courses = get_courses()
+    due = due_reviews(course_ids, end_of_today())
+    upcoming = list(itertools.islice(due, DUE_LIST_LENGTH + 1))
+    if not upcoming:
+        stores = st.session_state.get("study_stores", {})
+        nexts = [stores[cid].reviews.peek() for cid in course_ids if cid in stores]
+        nexts = [entry for entry in nexts if entry]
+        if nexts:
+            next_due = min(entry[0] for entry in nexts)
+            st.success(f"Nothing due today. Your next review is on {datetime.date.fromtimestamp(next_due):%d %b}.")
+        else:
+            st.success("Nothing to review yet. Mark topics as done or answer PYQs to start scheduling reviews.")
+        return
+    total = len(upcoming) + sum(1 for _ in due)
+    st.metric("Reviews due", total)
+
+    due_at, course_id, item = upcoming[0]
+    course = courses[course_id]
+    study_data = st.session_state["study_stores"][course_id].data
+    kind, module_key, name = item
+    card_key = f"due_{course_id}_{kind}_{module_key}_{name}"
+    with st.container(border=True):
+        if kind == "topic":
+            st.caption(f"{course['code']} · {module_key}")
+            st.header(name)
+            with st.expander("Show definition"):
+                render_definition(course, course["modules"][module_key][name])
+        else:
+            st.caption(f"{course['code']} · {module_key} · PYQ {name + 1}")
+            st.markdown(f"**{course['pyqs'][module_key][name]['q']}**")
+            with st.expander("Show my answer"):
+                st.markdown(study_data["pyqs"][module_key][name]["my_text"] or "_No typed answer; see your solution files._")
+        st.write("How confident are you?")
+        columns = st.columns(len(SURVEY_OPTIONS) - 1)
+        for column, survey in zip(columns, SURVEY_OPTIONS[1:]):
+            column.button(survey, key=f"{card_key}_{survey}", on_click=grade_due_item, args=(course_id, item, survey), width="stretch")
+        st.button(
+            "Open topic" if kind == "topic" else "Open in PYQ Practice",
+            key=f"{card_key}_open",
+            on_click=open_search_hit,
+            args=((course_id, kind, module_key, name), switch_course),
+            type="tertiary"
+        )
+
+    if len(upcoming) > 1:
+        st.subheader("Up next")
+        for due_at, course_id, (kind, module_key, name) in upcoming[1:DUE_LIST_LENGTH + 1]:
+            label = name if kind == "topic" else f"PYQ {name + 1} · {module_key}"
+            if switch_course:
+                label = f"{courses[course_id]['code']} · {label}"
+            st.markdown(f"- {label}")
+        if total > len(upcoming):
+            st.caption(f"…and {total - len(upcoming)} more.")
+
+# --- (4) MAIN APP LOGIC ---
+
+def main(course_id=None):
+    """
+    Runs the study tracker. With a course_id only that course is served;
+    otherwise the sidebar offers every course pack found under courses/.
+    """
+    courses = get_courses()
+    pinned = courses.get(course_id) if course_id else None
+
+    # Set wide mode and a title
+    st.set_page_config(layout="wide", page_title=f"{pinned['code']} Study Tracker" if pinned else APP_TITLE)
+
+    if not courses or (course_id and pinned is None):
+        st.error(f"No course content pack was found in the courses/ folder{f' for {course_id}' if course_id else ''}.")
+        return
+    if course_id is None:
+        course_id = st.sidebar.selectbox(
+            "Course:",
+            list(courses),
+            format_func=lambda cid: f"{courses[cid]['code']} · {courses[cid]['title']}",
+            key="course"
+        )
+
+    # Get the course content and the master data object (the study store is
+    # created on first use)
+    course = courses[course_id]
+    store = get_store(course)
+    attach_finished_uploads(course, store)
+    study_data = store.data
+
+    # --- Sidebar Navigation ---
+    st.sidebar.title(f"{course.get('icon', '')} {course['code']} {course['title']}".strip())
+    st.sidebar.header("Navigation")
+
+    # Progress for the sidebar comes from the store's incrementally updated index
+    completed_topics, total_topics = store.index.progress()
+    if total_topics > 0:
+        st.sidebar.progress(completed_topics / total_topics)
+        st.sidebar.caption(f"{completed_topics} / {total_topics} Topics Completed")
+    else:
+        st.sidebar.progress(0)
+        st.sidebar.caption("0 / 0 Topics Completed")
+
+    view_options = ["📈 Dashboard", DUE_VIEW] + list(study_data["modules"].keys()) + [PYQ_VIEW]
+    view = st.sidebar.radio("Go to:", view_options, key=f"{course_id}_view")
+
+    if pinned:
+        render_search([course_id], switch_course=False)
+    else:
+        render_search(list(courses), switch_course=True)
+
+    st.sidebar.divider()
+    if get_sqlite_pool() is not None:
+        st.sidebar.text_input("Profile name", key="profile", help="Your progress is saved on the server under this name.")
+    if store.persistent:
+        st.sidebar.success(f"Your progress is saved automatically to the profile **{store.profile}**.")
+    else:
+        st.sidebar.warning("Your progress is saved in this browser session. **Use the 'Save My Progress' button on the Dashboard to download a file** you can load later.")
+
+    with st.sidebar.expander("Photo upload settings"):
+        st.caption("Uploaded photos are turned upright, stripped of metadata, resized and compressed.")
+        st.selectbox("Longest side (pixels)", MAX_DIMENSIONS, index=MAX_DIMENSIONS.index(DEFAULT_SETTINGS["max_dimension"]), key="ingest_max_dimension")
+        st.radio("Format", list(FORMATS), index=list(FORMATS).index(DEFAULT_SETTINGS["format"]), horizontal=True, key="ingest_format")
+        st.radio("Quality", list(QUALITY_TIERS), index=list(QUALITY_TIERS).index(DEFAULT_SETTINGS["quality"]), horizontal=True, key="ingest_quality")
+        st.checkbox("Also keep the original photo", value=DEFAULT_SETTINGS["keep_original"], key="ingest_keep_original")
+
+    if view == "📈 Dashboard":
+        render_dashboard(course, store)
+    elif view in study_data["modules"]:
+        render_module_view(course, store, view)
+    elif view == PYQ_VIEW:
+        render_pyq_practice(course, store)
+    elif view == DUE_VIEW:
+        render_due_today([course_id] if pinned else list(courses), switch_course=not pinned)
+
+
+if __name__ == "__main__":
+    main()
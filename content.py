@@ -0,0 +1,140 @@
+import json
+import os
+import re
+
+from xref import link_pyqs_to_topics
+
+# --- COURSE CONTENT PACKS ---
+# Syllabus content (definitions, PYQ focus, strategy tips and the PYQ bank)
+# lives in one JSON file per course under courses/<course_id>/course.json:
+#     {"code": "CST 303", "title": ..., "icon": ..., "allow_html": ...,
+#      "modules": {module: {topic: {"definition", "pyq_focus", "strategy"}}},
+#      "pyqs": {module: [{"q": ...}, ...]},
+#      "diagrams": {placeholder: "diagrams/<file>.svg"}}
+# A topic can also list interactive labs by id ("labs": ["crc"], see labs/).
+# The apps load each pack once per process and share it between sessions,
+# so it must be treated as read-only. Per-user study data only holds the
+# fields the user edits (see new_study_data).
+
+COURSES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "courses")
+
+
+def course_path(course_id):
+    return os.path.join(COURSES_DIR, course_id, "course.json")
+
+
+def load_course(course_id):
+    """Reads one course content pack from disk."""
+    with open(course_path(course_id), encoding="utf-8") as f:
+        course = json.load(f)
+    course["id"] = course_id
+    prepare_course_text(course)
+    link_pyqs_to_topics(course)
+    return course
+
+
+# --- SYLLABUS TEXT ---
+# The syllabus text was written as indented triple-quoted strings (some
+# lines carry the source indentation, some don't), with "[Image of ...]"
+# placeholders where a diagram belongs. When a pack is loaded, every text
+# field is dedented and tidied once, and each definition
+# is split into blocks the topic view can draw directly: markdown, or a
+# bundled SVG diagram named in the pack's "diagrams" map. A placeholder
+# with no diagram is kept as an italic note.
+
+TEXT_FIELDS = ("definition", "pyq_focus", "strategy")
+
+# Markdown nests lists a few spaces deep; a common indentation of at least
+# this many spaces is left over from the source code.
+SOURCE_INDENT = 8
+
+_IMAGE_PLACEHOLDER = re.compile(r"\[Image of ([^\]]+)\]")
+
+
+def normalize_text(text):
+    """Dedents one piece of syllabus text and strips trailing whitespace and extra blank lines."""
+    lines = [line.rstrip() for line in text.strip("\n").splitlines()]
+    indents = [len(line) - len(line.lstrip(" ")) for line in lines if line]
+    margin = min((indent for indent in indents if indent >= SOURCE_INDENT), default=0)
+    lines = [line[margin:] if line[:margin].isspace() else line for line in lines]
+    return re.sub(r"\n{3,}", "\n\n", "\n".join(lines).strip())
+
+
+def prepare_course_text(course):
+    """Normalizes a loaded pack's text in place and adds "definition_blocks" to every topic."""
+    course_dir = os.path.dirname(course_path(course["id"]))
+    diagrams = {}
+    for topics in course["modules"].values():
+        for topic in topics.values():
+            for field in TEXT_FIELDS:
+                topic[field] = normalize_text(topic[field])
+            topic["definition_blocks"] = split_blocks(topic["definition"], course, course_dir, diagrams)
+    for questions in course["pyqs"].values():
+        for question in questions:
+            question["q"] = normalize_text(question["q"])
+
+
+def split_blocks(text, course, course_dir, diagrams):
+    """
+    Splits text at its image placeholders into a list of
+    {"type": "markdown", "text"} and {"type": "diagram", "svg", "caption"} blocks.
+    ``diagrams`` caches SVG files already read for this pack.
+    """
+    blocks = []
+    pos = 0
+    for match in _IMAGE_PLACEHOLDER.finditer(text):
+        _add_markdown(blocks, text[pos:match.start()])
+        pos = match.end()
+        name = match.group(1).strip()
+        file_name = course.get("diagrams", {}).get(name)
+        if file_name and file_name not in diagrams:
+            diagrams[file_name] = _read_diagram(os.path.join(course_dir, file_name))
+        svg = diagrams.get(file_name)
+        if svg:
+            caption = name[4:] if name.startswith("the ") else name
+            blocks.append({"type": "diagram", "svg": svg, "caption": caption[:1].upper() + caption[1:]})
+        else:
+            blocks.append({"type": "markdown", "text": f"*(Diagram: {name})*"})
+    _add_markdown(blocks, text[pos:])
+    return blocks
+
+
+def _add_markdown(blocks, text):
+    text = text.strip("\n")
+    if text.strip():
+        blocks.append({"type": "markdown", "text": text})
+
+
+def _read_diagram(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def new_study_data(course):
+    """
+    Builds fresh per-user study data for a course: one entry per topic and
+    per PYQ, holding only the fields the user edits.
+    """
+    return {
+        "modules": {
+            module_key: {
+                topic_name: {"done": False, "my_notes": "", "my_links": [], "my_photos_bytes": [], "survey": None, "srs": None}
+                for topic_name in topics
+            }
+            for module_key, topics in course["modules"].items()
+        },
+        "pyqs": {
+            module_key: [{"my_text": "", "my_files": [], "srs": None} for _ in questions]
+            for module_key, questions in course["pyqs"].items()
+        },
+    }
+
+
+def discover_courses():
+    """Returns the ids of all course packs found under courses/, sorted."""
+    if not os.path.isdir(COURSES_DIR):
+        return []
+    return sorted(name for name in os.listdir(COURSES_DIR) if os.path.isfile(course_path(name)))
@@ -0,0 +1,233 @@
+import base64
+import binascii
+import codecs
+import json
+import re
+
+# --- STREAMING JSON READER ---
+# A small recursive-descent JSON parser that reads its input in chunks.
+# Large string values can be handed to a consumer piece by piece instead of
+# being built in memory (the progress loader uses this to write base64 media
+# straight into the media store), so memory stays flat however big the
+# file is. Everything else is parsed into ordinary Python values.
+
+READ_SIZE = 64 * 1024
+
+_STRING_STOP = re.compile(r'["\\]')
+_NON_WHITESPACE = re.compile(r"[^ \t\r\n]")
+_LITERAL_END = re.compile(r"[\s,\]}]")
+
+
+class JsonStreamError(ValueError):
+    """Raised for malformed JSON input."""
+
+
+class JsonStreamReader:
+    """
+    Parses one JSON document from a binary file object.
+
+    ``stream_string(path)`` is called with the path (a tuple of keys and list
+    indexes) of every string value. If it returns a callable, that callable
+    receives an iterator over the decoded pieces of the string and its
+    return value is stored in place of the string.
+    """
+
+    def __init__(self, file, stream_string=None, read_size=READ_SIZE):
+        self._file = file
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._read_size = read_size
+        self._stream_string = stream_string or (lambda path: None)
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def parse(self):
+        value = self._value(())
+        self._skip_ws()
+        if self._peek() != "":
+            raise JsonStreamError("Extra data after the JSON document")
+        return value
+
+    # --- Buffer handling ---
+
+    def _fill(self):
+        """Reads another chunk; returns False at end of input."""
+        if self._eof:
+            return False
+        data = self._file.read(self._read_size)
+        if not data:
+            self._eof = True
+            self._buf = self._buf[self._pos:] + self._decoder.decode(b"", final=True)
+        else:
+            self._buf = self._buf[self._pos:] + self._decoder.decode(data)
+        self._pos = 0
+        return True
+
+    def _peek(self):
+        while self._pos >= len(self._buf):
+            if not self._fill():
+                return ""
+        return self._buf[self._pos]
+
+    def _take(self, n):
+        while len(self._buf) - self._pos < n:
+            if not self._fill():
+                raise JsonStreamError("Unexpected end of input")
+        text = self._buf[self._pos:self._pos + n]
+        self._pos += n
+        return text
+
+    def _skip_ws(self):
+        while True:
+            match = _NON_WHITESPACE.search(self._buf, self._pos)
+            if match is not None:
+                self._pos = match.start()
+                return
+            self._pos = len(self._buf)
+            if not self._fill():
+                return
+
+    def _expect(self, char):
+        self._skip_ws()
+        if self._peek() != char:
+            raise JsonStreamError(f"Expected {char!r} at offset {self._pos}")
+        self._pos += 1
+
+    # --- Values ---
+
+    def _value(self, path):
+        self._skip_ws()
+        char = self._peek()
+        if char == "{":
+            return self._object(path)
+        if char == "[":
+            return self._array(path)
+        if char == '"':
+            consumer = self._stream_string(path)
+            if consumer is not None:
+                self._pos += 1
+                pieces = self._string_pieces()
+                value = consumer(pieces)
+                for _ in pieces:
+                    pass  # Drain whatever the consumer didn't read
+                return value
+            return self._string()
+        if char == "":
+            raise JsonStreamError("Unexpected end of input")
+        return self._literal()
+
+    def _object(self, path):
+        self._pos += 1
+        result = {}
+        self._skip_ws()
+        if self._peek() == "}":
+            self._pos += 1
+            return result
+        while True:
+            self._skip_ws()
+            if self._peek() != '"':
+                raise JsonStreamError(f"Expected a key at offset {self._pos}")
+            key = self._string()
+            self._expect(":")
+            result[key] = self._value(path + (key,))
+            self._skip_ws()
+            char = self._take(1)
+            if char == "}":
+                return result
+            if char != ",":
+                raise JsonStreamError(f"Expected ',' or '}}' in object, got {char!r}")
+
+    def _array(self, path):
+        self._pos += 1
+        result = []
+        self._skip_ws()
+        if self._peek() == "]":
+            self._pos += 1
+            return result
+        while True:
+            result.append(self._value(path + (len(result),)))
+            self._skip_ws()
+            char = self._take(1)
+            if char == "]":
+                return result
+            if char != ",":
+                raise JsonStreamError(f"Expected ',' or ']' in array, got {char!r}")
+
+    def _string(self):
+        self._pos += 1
+        return "".join(self._string_pieces())
+
+    def _string_pieces(self):
+        """Yields the decoded pieces of a string whose opening quote was consumed."""
+        while True:
+            if self._pos >= len(self._buf) and not self._fill():
+                raise JsonStreamError("Unterminated string")
+            match = _STRING_STOP.search(self._buf, self._pos)
+            if match is None:
+                piece = self._buf[self._pos:]
+                self._pos = len(self._buf)
+                if piece:
+                    yield piece
+                continue
+            start, stop = self._pos, match.start()
+            self._pos = stop + 1
+            if stop > start:
+                yield self._buf[start:stop]
+            if match.group() == '"':
+                return
+            yield self._escape()
+
+    def _escape(self):
+        """Decodes one escape sequence (the backslash is already consumed)."""
+        code = self._take(1)
+        if code != "u":
+            return _decode_escape("\\" + code)
+        escape = "\\u" + self._take(4)
+        if "\ud800" <= _decode_escape(escape) <= "\udbff" and self._peek() == "\\":
+            # A surrogate pair spans two \u escapes
+            escape += self._take(6)
+        return _decode_escape(escape)
+
+    def _literal(self):
+        while True:
+            match = _LITERAL_END.search(self._buf, self._pos)
+            if match is not None or not self._fill():
+                break
+        end = match.start() if match is not None else len(self._buf)
+        token = self._buf[self._pos:end]
+        self._pos = end
+        try:
+            return json.loads(token)
+        except ValueError:
+            raise JsonStreamError(f"Invalid value {token[:20]!r}") from None
+
+
+def _decode_escape(escape):
+    try:
+        return json.loads('"' + escape + '"')
+    except ValueError:
+        raise JsonStreamError(f"Invalid escape {escape!r}") from None
+
+
+def iter_b64_decode(pieces):
+    """
+    Decodes an iterator of base64 text pieces into an iterator of bytes.
+    Raises binascii.Error (a ValueError) as soon as the text stops being
+    strict base64: a character outside the alphabet, data after the padding
+    or a truncated last group.
+    """
+    pending = ""
+    padded = False
+    for piece in pieces:
+        pending += piece
+        usable = len(pending) - len(pending) % 4
+        if usable:
+            if padded:
+                raise binascii.Error("Excess data after padding")
+            yield base64.b64decode(pending[:usable], validate=True)
+            padded = pending[usable - 1] == "="
+            pending = pending[usable:]
+    if pending:
+        if padded:
+            raise binascii.Error("Excess data after padding")
+        yield base64.b64decode(pending, validate=True)
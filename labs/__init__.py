@@ -0,0 +1,7 @@
+# --- INTERACTIVE LABS ---
+# Calculators and simulators for the numerical topics. Each lab is a pure
+# engine module here (no Streamlit, so it can be run and timed on its own)
+# plus a view in labs/views.py. A topic opts in through a "labs" list in
+# its course pack:
+#     "Error Detection and Correction": {..., "labs": ["crc"]}
+# and the module view then shows a Lab tab for it (see LABS in views.py).
@@ -0,0 +1,174 @@
+import heapq
+
+import numpy as np
+
+# --- SLIDING WINDOW SIMULATOR ---
+# A discrete-event simulation of Stop-and-Wait, Go-Back-N and Selective
+# Repeat over one link with a fixed transmission time per frame, a fixed
+# propagation delay each way and random loss of frames and ACKs. Events are
+# (time, kind, seq, timer version) tuples in a heap; a cancelled or
+# restarted timer is left in the heap and skipped by its version. Loss draws
+# come from NumPy in blocks, so the loop allocates little more than the
+# event tuples and a million frames simulate in seconds.
+# Sequence numbers are not wrapped (no modulo), and ACKs take no time to
+# transmit. Go-Back-N ACKs are cumulative (the next frame expected);
+# Selective Repeat ACKs name the frame they acknowledge.
+
+PROTOCOLS = ("Stop-and-Wait", "Go-Back-N", "Selective Repeat")
+
+# Kinds, in the order they're handled when due at the same time.
+ACK, FRAME, TIMEOUT = 0, 1, 2
+
+RANDOM_BLOCK = 1 << 16
+
+
+def _coins(rng, probability):
+    """An endless iterator of True (lost) / False, drawn a block at a time."""
+    while True:
+        yield from (rng.random(RANDOM_BLOCK) < probability).tolist()
+
+
+def default_timeout(tx, rtt):
+    """Long enough for the frame, the round trip and a frame time of slack."""
+    return 2 * tx + rtt
+
+
+def simulate(protocol, frames, window=4, loss=0.0, tx=1.0, rtt=4.0, timeout=None, ack_loss=None, seed=None, record=False):
+    """
+    Sends ``frames`` frames and returns the run's statistics. With
+    ``record``, stats["timeline"] lists every transmission as
+    (kind, seq, sent, arrives, lost, retransmission).
+    """
+    if not 0 <= loss < 1 or not 0 <= (loss if ack_loss is None else ack_loss) < 1:
+        raise ValueError("Loss probabilities must be at least 0 and below 1.")
+    if protocol == "Stop-and-Wait":
+        window = 1
+    selective = protocol == "Selective Repeat"
+    prop = rtt / 2
+    timeout = timeout or default_timeout(tx, rtt)
+    rng = np.random.default_rng(seed)
+    frame_lost = _coins(rng, loss)
+    ack_lost = _coins(rng, loss if ack_loss is None else ack_loss)
+
+    events = []
+    push, pop = heapq.heappush, heapq.heappop
+    timeline = [] if record else None
+    version = [0] * (frames if selective else 1)  # Timer generation: per frame for SR, one timer for GBN
+    sent = bytearray(frames)
+    acked = bytearray(frames)      # Sender side (SR)
+    received = bytearray(frames)   # Receiver side (SR)
+    base = next_seq = 0            # Oldest unacknowledged frame, next new frame
+    expected = 0                   # Receiver: next in-order frame (GBN) / window start (SR)
+    link_free = 0.0
+    transmissions = 0
+    now = 0.0
+
+    def transmit(seq, now):
+        nonlocal link_free, transmissions
+        start = link_free if link_free > now else now
+        link_free = start + tx
+        transmissions += 1
+        lost = next(frame_lost)
+        if not lost:
+            push(events, (link_free + prop, FRAME, seq, 0))
+        if selective:
+            version[seq] += 1
+            push(events, (link_free + timeout, TIMEOUT, seq, version[seq]))
+        if timeline is not None:
+            timeline.append(("frame", seq, start, link_free + prop, lost, bool(sent[seq])))
+        sent[seq] = 1
+        return link_free
+
+    def fill(now):
+        nonlocal next_seq
+        while next_seq < frames and next_seq < base + window:
+            done = transmit(next_seq, now)
+            if not selective and next_seq == base:
+                version[0] += 1  # Start the timer for the oldest outstanding frame
+                push(events, (done + timeout, TIMEOUT, 0, version[0]))
+            next_seq += 1
+
+    fill(0.0)
+    while base < frames and events:
+        now, kind, seq, ver = pop(events)
+        if kind == FRAME:
+            if selective:
+                if seq >= expected + window:
+                    continue
+                if seq >= expected and not received[seq]:
+                    received[seq] = 1
+                    while expected < frames and received[expected]:
+                        expected += 1
+                ack = seq
+            else:
+                if seq == expected:
+                    expected += 1
+                ack = expected
+            lost = next(ack_lost)
+            if not lost:
+                push(events, (now + prop, ACK, ack, 0))
+            if timeline is not None:
+                timeline.append(("ack", ack, now, now + prop, lost, False))
+        elif kind == ACK:
+            if selective:
+                if not acked[seq]:
+                    acked[seq] = 1
+                    while base < frames and acked[base]:
+                        base += 1
+            elif seq > base:
+                base = seq
+                version[0] += 1
+                if base < next_seq:
+                    push(events, (now + timeout, TIMEOUT, 0, version[0]))
+            fill(now)
+        elif selective:
+            if ver == version[seq] and not acked[seq]:
+                transmit(seq, now)
+        elif ver == version[0] and base < next_seq:
+            # Go back N: resend every outstanding frame and restart the timer
+            version[0] += 1
+            done = None
+            for resend in range(base, next_seq):
+                end = transmit(resend, now)
+                done = done or end
+            push(events, (done + timeout, TIMEOUT, 0, version[0]))
+
+    stats = {
+        "protocol": protocol,
+        "frames": frames,
+        "transmissions": transmissions,
+        "retransmissions": transmissions - frames,
+        "time": now,
+        "throughput": frames / now if now else 0.0,
+        # Share of the time the link carried frames that were needed
+        "efficiency": frames * tx / now if now else 0.0,
+    }
+    if record:
+        stats["timeline"] = timeline
+    return stats
+
+
+def ideal_efficiency(protocol, window, tx, rtt, loss=0.0):
+    """
+    The textbook efficiency: W / (1 + 2a) capped at 1 with a = prop / tx,
+    scaled by (1 - p) for Selective Repeat and Stop-and-Wait, and by
+    (1 - p) / (1 + (W - 1) p) for Go-Back-N.
+    """
+    if protocol == "Stop-and-Wait":
+        window = 1
+    a = rtt / 2 / tx
+    lossless = min(1.0, window / (1 + 2 * a))
+    if protocol == "Go-Back-N":
+        return lossless * (1 - loss) / (1 + (window - 1) * loss)
+    return lossless * (1 - loss)
+
+
+def sweep(protocols, parameter, values, settings):
+    """
+    Runs simulate for every protocol at every value of one parameter (the
+    rest from ``settings``). Returns {protocol: [efficiency, ...]}.
+    """
+    return {
+        protocol: [simulate(protocol, **dict(settings, **{parameter: value}))["efficiency"] for value in values]
+        for protocol in protocols
+    }
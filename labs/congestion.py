@@ -0,0 +1,166 @@
+import numpy as np
+
+# --- CONGESTION CONTROL ENGINE ---
+# TCP is simulated one round trip at a time, vectorized over independent
+# runs and over the flows sharing a bottleneck. In each round every flow
+# sends its whole window. The bottleneck forwards ``capacity`` segments and
+# queues the rest up to ``buffer``; what doesn't fit is dropped, and a flow
+# loses a segment with a probability that grows with its window. Random
+# loss can be added on top. A loss is seen as three duplicate ACKs when the
+# window is at least 4 segments and as a timeout otherwise:
+# * Tahoe: either kind sets ssthresh = cwnd / 2 (rounded down) and cwnd = 1;
+# * Reno: three duplicate ACKs fast-retransmit and go straight to
+#   congestion avoidance at cwnd = ssthresh = cwnd / 2.
+# The leaky and token buckets are simulated step by step over a traffic
+# trace, vectorized over every rate and bucket size being compared.
+# Everything here is plain functions of plain arguments, so sweeps can run
+# on a process pool and be cached by their parameters.
+
+VARIANTS = ("Tahoe", "Reno")
+TIMEOUT, DUP_ACKS = "timeout", "3 dup ACKs"
+# Smallest window at which a loss still produces three duplicate ACKs.
+FAST_RETRANSMIT_WINDOW = 4
+
+
+def _tcp_rounds(rounds, flows, capacity, buffer, variant, loss, ssthresh, events, runs, seed):
+    """
+    Yields each round's (cwnd, ssthresh, queue, delivered, timeouts,
+    dup_acks) as arrays over runs and flows; only the current round is kept.
+    """
+    rng = np.random.default_rng(seed)
+    cwnd = np.ones((runs, flows))
+    threshold = np.full((runs, flows), float(ssthresh))
+    scripted = dict(events)
+    no_queue = np.zeros(runs)
+    for t in range(rounds):
+        sent = cwnd.sum(axis=1)
+        # Chance that a given segment is lost: random loss, then drop-tail at the bottleneck
+        drop = np.full(runs, loss)
+        if capacity is not None:
+            backlog = np.maximum(sent - capacity, 0)
+            queue = np.minimum(backlog, buffer)
+            overflow = np.maximum(backlog - buffer, 0)
+            drop = 1 - (1 - drop) * (1 - overflow / sent)
+            delivered = np.minimum(sent, capacity)
+        else:
+            queue, delivered = no_queue, sent
+        lost = rng.random((runs, flows)) < 1 - (1 - drop[:, None]) ** cwnd
+        dup_acks = lost & (cwnd >= FAST_RETRANSMIT_WINDOW)
+        timeouts = lost & ~dup_acks
+        if t in scripted:
+            kind = scripted[t]
+            timeouts[:, 0], dup_acks[:, 0] = kind == TIMEOUT, kind == DUP_ACKS
+        yield cwnd, threshold, queue, delivered, timeouts, dup_acks
+
+        halved = np.maximum(np.floor(cwnd / 2), 2)
+        grown = np.where(cwnd < threshold, np.minimum(cwnd * 2, threshold), cwnd + 1)
+        recovered = halved if variant == "Reno" else 1.0
+        threshold = np.where(timeouts | dup_acks, halved, threshold)
+        cwnd = np.where(timeouts, 1.0, np.where(dup_acks, recovered, grown))
+
+
+def tcp_simulate(rounds=30, flows=1, capacity=None, buffer=0, variant="Reno", loss=0.0,
+                 ssthresh=16, events=(), runs=1, seed=None):
+    """
+    Returns arrays over rounds: "cwnd" and "ssthresh" (rounds, runs, flows),
+    "queue" and "delivered" (rounds, runs), and "timeouts" / "dup_acks"
+    (rounds, runs, flows) marking the losses seen in each round. ``events``
+    scripts losses of flow 0 as (round, TIMEOUT or DUP_ACKS), as in the
+    textbook exercises. Without a capacity the path never congests.
+    """
+    shape = (rounds, runs, flows)
+    out = {
+        "cwnd": np.empty(shape), "ssthresh": np.empty(shape),
+        "queue": np.empty((rounds, runs)), "delivered": np.empty((rounds, runs)),
+        "timeouts": np.empty(shape, dtype=bool), "dup_acks": np.empty(shape, dtype=bool),
+    }
+    names = ("cwnd", "ssthresh", "queue", "delivered", "timeouts", "dup_acks")
+    for t, state in enumerate(_tcp_rounds(rounds, flows, capacity, buffer, variant, loss, ssthresh, events, runs, seed)):
+        for name, value in zip(names, state):
+            out[name][t] = value
+    return out
+
+
+def tcp_summary(rounds=200, flows=1, capacity=None, buffer=0, variant="Reno", loss=0.0, ssthresh=16, runs=100, seed=None):
+    """
+    Averages over many runs, for sweeps: utilization, queue, window and loss
+    rates. Keeps running sums instead of the history, so memory doesn't grow
+    with the number of rounds.
+    """
+    totals = dict.fromkeys(("cwnd", "queue", "delivered", "timeouts", "dup_acks"), 0.0)
+    for cwnd, _, queue, delivered, timeouts, dup_acks in _tcp_rounds(rounds, flows, capacity, buffer, variant, loss, ssthresh, (), runs, seed):
+        totals["cwnd"] += cwnd.sum()
+        totals["queue"] += queue.sum()
+        totals["delivered"] += delivered.sum()
+        totals["timeouts"] += np.count_nonzero(timeouts)
+        totals["dup_acks"] += np.count_nonzero(dup_acks)
+    per_run_round = rounds * runs
+    throughput = totals["delivered"] / per_run_round
+    return {
+        "utilization": throughput / capacity if capacity else 1.0,
+        "throughput": throughput,
+        "queue": totals["queue"] / per_run_round,
+        "cwnd": totals["cwnd"] / (per_run_round * flows),
+        "timeouts": totals["timeouts"] / per_run_round,
+        "dup_acks": totals["dup_acks"] / per_run_round,
+    }
+
+
+def tcp_sweep_point(parameter, value, settings):
+    """tcp_summary with one setting replaced; a top-level function so a process pool can run it."""
+    return tcp_summary(**dict(settings, **{parameter: value}))
+
+
+# --- Traffic shaping ---
+
+def burst_time(capacity, rate, peak):
+    """How long a full token bucket lets a host send at its peak rate: C / (M - rho)."""
+    return capacity / (peak - rate) if peak > rate else float("inf")
+
+
+def on_off_traffic(steps, peak, on_fraction=0.3, mean_burst=10, seed=None):
+    """
+    A bursty source: ``peak`` units per step while on, nothing while off,
+    switching state at random so bursts average ``mean_burst`` steps.
+    """
+    rng = np.random.default_rng(seed)
+    on_fraction = min(max(on_fraction, 0.01), 0.99)
+    switch_on = on_fraction / (1 - on_fraction) / mean_burst
+    # The draws come from NumPy in one go; only the on/off chain is walked in Python
+    draws = rng.random(steps)
+    on = np.empty(steps, dtype=bool)
+    state = False
+    for t in range(steps):
+        state = draws[t] >= 1 / mean_burst if state else draws[t] < switch_on
+        on[t] = state
+    return np.where(on, float(peak), 0.0)
+
+
+def shape_traffic(arrivals, kind, rate, bucket, peak=np.inf, queue_limit=np.inf):
+    """
+    Runs a traffic trace through a leaky bucket (``bucket`` = its queue
+    size, drained at ``rate`` per step) or a token bucket (``bucket`` =
+    token capacity, refilled at ``rate`` per step, sending at most ``peak``
+    per step, data waiting in a queue of ``queue_limit``). ``rate`` and
+    ``bucket`` may be arrays of configurations, simulated side by side.
+    Returns (steps, configurations) arrays: output, queue, tokens, dropped.
+    """
+    rate, bucket = np.broadcast_arrays(np.atleast_1d(np.asarray(rate, dtype=float)), np.atleast_1d(np.asarray(bucket, dtype=float)))
+    steps, configs = len(arrivals), len(rate)
+    out = {name: np.zeros((steps, configs)) for name in ("output", "queue", "tokens", "dropped")}
+    queue = np.zeros(configs)
+    tokens = bucket.copy()
+    limit = bucket if kind == "leaky" else np.broadcast_to(queue_limit, configs)
+    for t in range(steps):
+        queue += arrivals[t]
+        if kind == "leaky":
+            sent = np.minimum(queue, rate)
+        else:
+            tokens = np.minimum(bucket, tokens + rate)
+            sent = np.minimum(np.minimum(queue, tokens), peak)
+            tokens -= sent
+        queue -= sent
+        dropped = np.maximum(queue - limit, 0)
+        queue -= dropped
+        out["output"][t], out["queue"][t], out["tokens"][t], out["dropped"][t] = sent, queue, tokens, dropped
+    return out
@@ -0,0 +1,259 @@
+import re
+
+import numpy as np
+
+# --- ERROR DETECTION ENGINE ---
+# CRC, Internet checksum and Hamming code, each twice over:
+# * worked one input at a time on "0"/"1" strings, keeping every step so the
+#   long division or parity checks can be shown as they're done by hand;
+# * in batch on NumPy bit arrays (one codeword per row, uint8 0/1), where
+#   each step of the division is a single XOR over every row at once, so
+#   hundreds of thousands of practice cases take about a second.
+
+_POLY_TERM = re.compile(r"^x(?:\^?(\d+))?$|^1$")
+_SUPERSCRIPTS = str.maketrans("⁰¹²³⁴⁵⁶⁷⁸⁹", "0123456789")
+
+
+def parse_bits(text):
+    """Returns a bit string with spaces removed; raises ValueError if it isn't binary."""
+    bits = "".join(text.split())
+    if not bits or set(bits) - {"0", "1"}:
+        raise ValueError(f"'{text}' is not a bit string.")
+    return bits
+
+
+def parse_generator(text):
+    """
+    Reads a generator given as bits ("1001") or as a polynomial ("x^3 + 1",
+    "x³+1") and returns its bits, highest power first.
+    """
+    text = text.strip()
+    if text and not set(text.replace(" ", "")) - {"0", "1"}:
+        bits = parse_bits(text).lstrip("0")
+    else:
+        powers = set()
+        for term in text.translate(_SUPERSCRIPTS).replace(" ", "").lower().split("+"):
+            match = _POLY_TERM.match(term)
+            if not match:
+                raise ValueError(f"Can't read the term '{term}' of the generator '{text}'.")
+            powers.add(0 if term == "1" else int(match.group(1) or 1))
+        bits = "".join("1" if power in powers else "0" for power in range(max(powers), -1, -1))
+    if len(bits) < 2:
+        raise ValueError("The generator needs a degree of at least 1.")
+    return bits
+
+
+def xor_bits(a, b):
+    return "".join("0" if x == y else "1" for x, y in zip(a, b))
+
+
+# --- CRC ---
+
+def crc_divide(dividend, generator):
+    """
+    Mod-2 long division of a bit string by the generator. Returns
+    (remainder, steps), one step per XOR: {"position", "before", "after"}
+    where before/after are the whole working string around that XOR.
+    """
+    width = len(generator)
+    work = dividend
+    steps = []
+    for position in range(len(dividend) - width + 1):
+        if work[position] == "1":
+            after = work[:position] + xor_bits(work[position:position + width], generator) + work[position + width:]
+            steps.append({"position": position, "before": work, "after": after})
+            work = after
+    return work[len(work) - width + 1:], steps
+
+
+def crc_encode(data, generator):
+    """Returns the worked CRC of data: the augmented dividend, remainder, steps and codeword."""
+    augmented = data + "0" * (len(generator) - 1)
+    remainder, steps = crc_divide(augmented, generator)
+    return {"dividend": augmented, "remainder": remainder, "steps": steps, "codeword": data + remainder}
+
+
+def crc_check(codeword, generator):
+    """Divides a received codeword by the generator; an error is detected if the remainder isn't zero."""
+    remainder, steps = crc_divide(codeword, generator)
+    return {"dividend": codeword, "remainder": remainder, "steps": steps, "error": "1" in remainder}
+
+
+def format_division(worked, generator):
+    """Lays out a worked division the way it's written by hand, one XOR per block."""
+    pad = len(generator) + 3
+    lines = [f"{generator} ) {worked['dividend']}"]
+    for step in worked["steps"]:
+        indent = " " * (pad + step["position"])
+        lines += [indent + generator, indent + "-" * len(generator), " " * pad + step["after"]]
+    lines.append(f"Remainder: {worked['remainder']}")
+    return "\n".join(lines)
+
+
+def random_bits(rng, count, length):
+    return rng.integers(0, 2, size=(count, length), dtype=np.uint8)
+
+
+def bits_array(bits):
+    """Turns a list of equal-length bit strings into a (count, length) uint8 array."""
+    if not bits:
+        return np.zeros((0, 0), dtype=np.uint8)
+    return np.frombuffer("".join(bits).encode("ascii"), dtype=np.uint8).reshape(len(bits), -1) - ord("0")
+
+
+def bit_strings(array):
+    return [(row + ord("0")).tobytes().decode("ascii") for row in array.astype(np.uint8)]
+
+
+def crc_remainders(dividends, generator):
+    """Remainders of every row of a (count, length) bit array divided by the generator."""
+    g = np.frombuffer(generator.encode("ascii"), dtype=np.uint8) - ord("0")
+    width = len(g)
+    work = dividends.copy()
+    for position in range(work.shape[1] - width + 1):
+        # Rows whose leading bit is 1 are XORed with the generator, the rest with zeros
+        work[:, position:position + width] ^= work[:, position:position + 1] * g
+    return work[:, work.shape[1] - width + 1:]
+
+
+def crc_encode_batch(data, generator):
+    """Codewords (data followed by its CRC) for every row of a bit array."""
+    augmented = np.concatenate([data, np.zeros((data.shape[0], len(generator) - 1), dtype=np.uint8)], axis=1)
+    return np.concatenate([data, crc_remainders(augmented, generator)], axis=1)
+
+
+def crc_verify_batch(codewords, generator):
+    """True for every row whose remainder is zero, i.e. no error detected."""
+    return ~crc_remainders(codewords, generator).any(axis=1)
+
+
+def flip_random_bits(rng, codewords, errors):
+    """Copies of the codewords with ``errors`` distinct bits flipped in each row."""
+    count, length = codewords.shape
+    errors = min(errors, length)
+    positions = rng.integers(0, length, size=(count, errors))
+    # Redraw a row's k-th position until it differs from the ones before it
+    for k in range(1, errors):
+        clash = (positions[:, :k] == positions[:, k:k + 1]).any(axis=1)
+        while clash.any():
+            positions[clash, k] = rng.integers(0, length, size=int(clash.sum()))
+            clash = (positions[:, :k] == positions[:, k:k + 1]).any(axis=1)
+    received = codewords.copy()
+    received[np.arange(count)[:, None], positions] ^= 1
+    return received
+
+
+# --- INTERNET CHECKSUM ---
+
+def split_words(bits, word_size):
+    if len(bits) % word_size:
+        raise ValueError(f"{len(bits)} bits don't split into {word_size}-bit words.")
+    return [bits[i:i + word_size] for i in range(0, len(bits), word_size)]
+
+
+def checksum(words, word_size):
+    """
+    One's complement sum of the words (bit strings) with each carry wrapped
+    around, as in the Internet checksum. Returns the running sums and the
+    checksum (the complement of the sum).
+    """
+    mask = (1 << word_size) - 1
+    total = 0
+    steps = []
+    for word in words:
+        raw = total + int(word, 2)
+        total = (raw & mask) + (raw >> word_size)
+        steps.append({"word": word, "sum": format(total, f"0{word_size}b"), "carry": raw > mask})
+    return {"steps": steps, "sum": format(total, f"0{word_size}b"), "checksum": format(~total & mask, f"0{word_size}b")}
+
+
+def checksum_batch(words, word_size):
+    """Checksums of every row of a (count, words) array of word values."""
+    mask = (1 << word_size) - 1
+    total = words.sum(axis=1, dtype=np.uint64)
+    while (total > mask).any():
+        total = (total & mask) + (total >> word_size)
+    return (~total & mask).astype(np.uint64)
+
+
+# --- HAMMING CODE ---
+# Even parity, parity bits at positions 1, 2, 4, 8, ... (1-based) and the
+# data bits in order in the other positions.
+
+def parity_bit_count(data_bits):
+    """The smallest p with 2^p >= m + p + 1."""
+    p = 0
+    while 2 ** p < data_bits + p + 1:
+        p += 1
+    return p
+
+
+def hamming_encode(data):
+    """Returns the codeword and, per parity bit, the positions it checks and its value."""
+    p = parity_bit_count(len(data))
+    length = len(data) + p
+    code = [None] * (length + 1)  # 1-based
+    bits = iter(data)
+    for position in range(1, length + 1):
+        if position & (position - 1):
+            code[position] = next(bits)
+    parities = []
+    for k in range(p):
+        parity = 1 << k
+        covered = [position for position in range(1, length + 1) if position & parity and position != parity]
+        value = str(sum(code[position] == "1" for position in covered) % 2)
+        code[parity] = value
+        parities.append({"position": parity, "checks": covered, "value": value})
+    return {"codeword": "".join(code[1:]), "parities": parities}
+
+
+def hamming_decode(codeword):
+    """Returns the syndrome (the 1-based error position, 0 if none), the corrected codeword and its data bits."""
+    syndrome = 0
+    for position, bit in enumerate(codeword, start=1):
+        if bit == "1":
+            syndrome ^= position
+    corrected = codeword
+    if 0 < syndrome <= len(codeword):
+        corrected = codeword[:syndrome - 1] + ("0" if codeword[syndrome - 1] == "1" else "1") + codeword[syndrome:]
+    data = "".join(bit for position, bit in enumerate(corrected, start=1) if position & (position - 1))
+    return {"syndrome": syndrome, "corrected": corrected, "data": data}
+
+
+def _positions(length):
+    return np.arange(1, length + 1)
+
+
+def hamming_syndromes(codewords):
+    """Syndromes (error positions, 0 if none) of every row of a codeword bit array."""
+    weights = _positions(codewords.shape[1])
+    syndromes = np.zeros(codewords.shape[0], dtype=np.int64)
+    for k in range(int(weights[-1]).bit_length()):
+        # Bit k of the syndrome is the parity of the bits at positions with bit k set
+        checked = ((weights >> k) & 1).astype(bool)
+        syndromes |= (codewords[:, checked].sum(axis=1) & 1).astype(np.int64) << k
+    return syndromes
+
+
+def hamming_encode_batch(data):
+    """Hamming codewords for every row of a data bit array."""
+    count, m = data.shape
+    p = parity_bit_count(m)
+    positions = _positions(m + p)
+    is_data = (positions & (positions - 1)) != 0
+    codewords = np.zeros((count, m + p), dtype=np.uint8)
+    codewords[:, is_data] = data
+    # With the parity bits still zero, the syndrome is exactly the parity bits to set
+    syndromes = hamming_syndromes(codewords)
+    for k in range(p):
+        codewords[:, (1 << k) - 1] = (syndromes >> k) & 1
+    return codewords
+
+
+def hamming_correct_batch(codewords):
+    """Returns (corrected codewords, syndromes); single-bit errors are fixed in place of a copy."""
+    syndromes = hamming_syndromes(codewords)
+    corrected = codewords.copy()
+    rows = np.nonzero((syndromes > 0) & (syndromes <= codewords.shape[1]))[0]
+    corrected[rows, syndromes[rows] - 1] ^= 1
+    return corrected, syndromes
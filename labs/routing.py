@@ -0,0 +1,276 @@
+import time
+
+import numpy as np
+
+# --- ROUTING ENGINE ---
+# A network is an n x n link-cost matrix (inf where there's no link, 0 on
+# the diagonal). Distance vector runs as synchronous rounds in which every
+# router takes its neighbours' latest vectors. Routers with the same number
+# of links are worked together as one array, so a round is a few NumPy
+# operations per distinct degree rather than per router. With split
+# horizon a route isn't advertised back to its next hop at all, so the
+# neighbour's copy only goes away when it times out; with poison reverse
+# it's advertised back as infinity. Link state runs Dijkstra on the matrix.
+
+# RIP's "infinity": a cost this high means unreachable.
+RIP_INFINITY = 16
+# Rounds an unrefreshed route is kept under split horizon before it times out.
+ROUTE_TIMEOUT = 3
+TECHNIQUES = ("None", "Split horizon", "Poison reverse")
+# Table entries worked per block in a round, to bound the memory used.
+BLOCK_SIZE = 4_000_000
+
+
+def parse_links(text):
+    """
+    Reads one link per line, "A B 3" (cost defaults to 1). Returns the
+    router names in order of appearance and a list of (a, b, cost) indexes.
+    """
+    names = []
+    links = []
+    for n, line in enumerate(text.splitlines(), start=1):
+        parts = line.replace(",", " ").split()
+        if not parts:
+            continue
+        if len(parts) not in (2, 3) or parts[0] == parts[1]:
+            raise ValueError(f"Line {n}: write a link as 'A B cost'.")
+        try:
+            cost = float(parts[2]) if len(parts) == 3 else 1.0
+        except ValueError:
+            raise ValueError(f"Line {n}: '{parts[2]}' is not a cost.")
+        if cost <= 0:
+            raise ValueError(f"Line {n}: link costs must be positive.")
+        for name in parts[:2]:
+            if name not in names:
+                names.append(name)
+        links.append((names.index(parts[0]), names.index(parts[1]), cost))
+    return names, links
+
+
+def cost_matrix(n, links):
+    costs = np.full((n, n), np.inf, dtype=np.float32)
+    np.fill_diagonal(costs, 0)
+    for a, b, cost in links:
+        costs[a, b] = costs[b, a] = cost
+    return costs
+
+
+def random_topology(rng, n, degree=3, max_cost=10):
+    """A random connected network of n routers with about ``degree`` links each and integer costs."""
+    costs = np.full((n, n), np.inf, dtype=np.float32)
+    np.fill_diagonal(costs, 0)
+    # A random tree keeps it connected; random extra links bring up the degree
+    a = np.arange(1, n)
+    b = (rng.random(n - 1) * a).astype(np.int64)
+    extra = max(0, n * degree // 2 - (n - 1))
+    a = np.concatenate([a, rng.integers(0, n, extra)])
+    b = np.concatenate([b, rng.integers(0, n, extra)])
+    keep = a != b
+    a, b = a[keep], b[keep]
+    cost = rng.integers(1, max_cost + 1, len(a)).astype(np.float32)
+    costs[a, b] = cost
+    costs[b, a] = cost
+    return costs
+
+
+def router_names(n):
+    """A, B, ... Z for small networks, R1, R2, ... otherwise."""
+    return [chr(ord("A") + i) for i in range(n)] if n <= 26 else [f"R{i + 1}" for i in range(n)]
+
+
+# --- Distance vector ---
+
+def dv_update(neighbor_vectors, delays, own_index):
+    """
+    One router's table update from its neighbours' vectors (the textbook
+    exercise): cost to X = min over neighbours N of delay(N) + N's cost to X.
+    Returns [(cost, neighbour)] per destination; the router itself is (0, None).
+    """
+    table = []
+    for x in range(len(next(iter(neighbor_vectors.values())))):
+        if x == own_index:
+            table.append((0, None))
+            continue
+        table.append(min((delays[neighbor] + vector[x], neighbor) for neighbor, vector in neighbor_vectors.items()))
+    return table
+
+
+class DistanceVector:
+    """
+    Distance vector routing on a cost matrix. ``dist[i, x]`` is router i's
+    cost to x and ``next_hop[i, x]`` the neighbour it sends through (-1 if
+    unreachable).
+    """
+
+    def __init__(self, costs, technique="None", infinity=np.inf):
+        self.n = len(costs)
+        self.technique = technique
+        self.infinity = infinity
+        self.src, self.dst = np.nonzero(np.isfinite(costs) & ~np.eye(self.n, dtype=bool))
+        self.weight = costs[self.src, self.dst].astype(np.float32)
+        self.dist = np.where(costs < infinity, costs, np.inf).astype(np.float32)
+        self.next_hop = np.where(np.isfinite(self.dist), np.arange(self.n), -1).astype(np.int32)
+        self.rounds = 0
+        # Routers with the same number of links are updated together
+        self.starts = starts = np.searchsorted(self.src, np.arange(self.n + 1))
+        degrees = np.diff(starts)
+        self.blocks = []
+        for degree in np.unique(degrees[degrees > 0]):
+            routers = np.nonzero(degrees == degree)[0]
+            edges = starts[routers][:, None] + np.arange(degree)
+            rows = max(1, BLOCK_SIZE // self.n)
+            self.blocks += [(routers[i:i + rows], edges[i:i + rows]) for i in range(0, len(routers), rows)]
+        if technique == "Split horizon":
+            # What each router last heard from each neighbour, and how many rounds ago
+            self.heard = self.dist[self.dst].copy()
+            self.heard[self.next_hop[self.dst] == self.src[:, None]] = np.inf
+            self.age = np.zeros(self.heard.shape, dtype=np.uint8)
+
+    @property
+    def messages(self):
+        """Vectors sent so far: one per link direction per round."""
+        return self.rounds * len(self.src)
+
+    def set_link(self, a, b, cost):
+        """Changes a link's cost (np.inf takes it down); the link must have existed."""
+        for u, v in ((a, b), (b, a)):
+            edge = self.starts[u] + np.searchsorted(self.dst[self.starts[u]:self.starts[u + 1]], v)
+            self.weight[edge] = cost
+
+    def step(self):
+        """Runs one round of updates. Returns True if any table changed."""
+        dist = np.full_like(self.dist, np.inf)
+        next_hop = np.full_like(self.next_hop, -1)
+        self._pending = False
+        for routers, edges in self.blocks:
+            # Keep the best neighbour so far, taking each router's k-th link in turn
+            for k in range(edges.shape[1]):
+                edge = edges[:, k]
+                neighbor = self.dst[edge]
+                candidate = self.weight[edge][:, None] + self._advertised(routers, edge, neighbor)
+                if k == 0:
+                    best = candidate
+                    hop = np.repeat(neighbor[:, None].astype(np.int32), self.n, axis=1)
+                else:
+                    better = candidate < best
+                    best = np.where(better, candidate, best)
+                    hop = np.where(better, neighbor[:, None].astype(np.int32), hop)
+            dist[routers] = best
+            next_hop[routers] = hop
+        unreachable = dist >= self.infinity
+        dist[unreachable] = np.inf
+        next_hop[unreachable] = -1
+        np.fill_diagonal(dist, 0)
+        np.fill_diagonal(next_hop, np.arange(self.n))
+        changed = not (np.array_equal(dist, self.dist) and np.array_equal(next_hop, self.next_hop))
+        self.dist, self.next_hop = dist, next_hop
+        self.rounds += 1
+        return changed or self._pending
+
+    def _advertised(self, routers, edge, neighbor):
+        """The vectors each neighbour sends each router over one link, per the technique."""
+        heard = self.dist[neighbor]
+        if self.technique == "None":
+            return heard
+        routed_back = self.next_hop[neighbor] == routers[:, None]
+        if self.technique == "Poison reverse":
+            heard[routed_back] = np.inf
+            return heard
+        # Split horizon: unadvertised routes keep their last value until they time out
+        age = np.where(routed_back, self.age[edge] + 1, 0).astype(np.uint8)
+        heard = np.where(routed_back, self.heard[edge], heard)
+        heard[age > ROUTE_TIMEOUT] = np.inf
+        self.heard[edge], self.age[edge] = heard, np.minimum(age, ROUTE_TIMEOUT + 1)
+        self._pending = self._pending or bool((np.isfinite(heard) & (age > 0)).any())
+        return heard
+
+    def run(self, max_rounds=100, history=None):
+        """
+        Runs rounds until nothing changes (or max_rounds). Appends a copy of
+        the tables after each round to ``history`` if given. Returns the
+        number of rounds that changed something.
+        """
+        for n in range(max_rounds):
+            if not self.step():
+                return n
+            if history is not None:
+                history.append((self.dist.copy(), self.next_hop.copy()))
+        return max_rounds
+
+
+# --- Link state ---
+
+def dijkstra(costs, source, record=False):
+    """
+    Shortest paths from one router over the cost matrix. Returns (dist,
+    prev, steps); with ``record``, steps holds (node added, dist, prev) after
+    each step, as in the textbook table.
+    """
+    n = len(costs)
+    dist = np.full(n, np.inf)
+    prev = np.full(n, -1)
+    done = np.zeros(n, dtype=bool)
+    dist[source] = 0
+    steps = []
+    for _ in range(n):
+        u = int(np.argmin(np.where(done, np.inf, dist)))
+        if done[u] or not np.isfinite(dist[u]):
+            break
+        done[u] = True
+        through = dist[u] + costs[u]
+        better = (through < dist) & ~done
+        dist[better] = through[better]
+        prev[better] = u
+        if record:
+            steps.append((u, dist.copy(), prev.copy()))
+    return dist, prev, steps
+
+
+def first_hops(prev, source):
+    """The neighbour of ``source`` each shortest path leaves through (-1 if unreachable)."""
+    hops = np.full(len(prev), -1)
+    for v in range(len(prev)):
+        u = v
+        while u != -1 and prev[u] != source and u != source:
+            u = prev[u]
+        hops[v] = source if v == source else u
+    return hops
+
+
+# --- Benchmark ---
+
+def benchmark(costs, technique="None", samples=20, rng=None):
+    """
+    Compares the cost of converging with distance vector and link state on
+    one network. Dijkstra is timed on up to ``samples`` routers and scaled
+    to all of them; its distances also check the distance vector result.
+    """
+    rng = rng or np.random.default_rng()
+    n = len(costs)
+    links = int(np.isfinite(costs).sum() - n)  # Link directions
+
+    start = time.perf_counter()
+    dv = DistanceVector(costs, technique)
+    rounds = dv.run(max_rounds=10 * n)
+    dv_seconds = time.perf_counter() - start
+
+    sources = rng.choice(n, size=min(samples, n), replace=False)
+    start = time.perf_counter()
+    agrees = True
+    for source in sources:
+        dist, _, _ = dijkstra(costs, source)
+        agrees = agrees and np.allclose(dist, dv.dist[source])
+    ls_seconds = (time.perf_counter() - start) * n / len(sources)
+
+    return {
+        "routers": n,
+        "links": links // 2,
+        "dv_rounds": rounds,
+        "dv_messages": rounds * links,
+        "dv_seconds": dv_seconds,
+        # Every router's link state packet is flooded over every link direction once
+        "ls_messages": n * links,
+        "ls_seconds": ls_seconds,
+        "ls_sampled": len(sources),
+        "agrees": agrees,
+    }
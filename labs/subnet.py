@@ -0,0 +1,315 @@
+import csv
+import io
+import itertools
+
+import numpy as np
+
+# --- SUBNETTING ENGINE ---
+# IPv4 addresses are plain 32-bit integers, so every answer is a few bit
+# operations: network = address & mask, broadcast = network | ~mask. One
+# question is worked with Python ints; practice sets and uploaded answer
+# tables are worked on NumPy uint64 arrays, a whole table per operation.
+# Sheet columns are formatted by table lookup and parsed from their bytes
+# in one pass; a column with anything unusual in it is read cell by cell.
+# Host counts follow the textbook rule (2^host bits - 2), so /31 and /32
+# have no usable hosts, and no first or last host: network_info gives None
+# for those and network_table gives -1 (written as a blank cell in sheets).
+
+ANSWER_FIELDS = ("network", "broadcast", "first_host", "last_host", "hosts")
+FULL_MASK = 0xFFFFFFFF
+
+
+def parse_ipv4(text):
+    parts = text.strip().split(".")
+    if len(parts) != 4 or not all(part.isdigit() and int(part) <= 255 for part in parts):
+        raise ValueError(f"'{text.strip()}' is not an IPv4 address.")
+    value = 0
+    for part in parts:
+        value = value << 8 | int(part)
+    return value
+
+
+def format_ipv4(value):
+    value = int(value)
+    return ".".join(str(value >> shift & 0xFF) for shift in (24, 16, 8, 0))
+
+
+def prefix_mask(prefix):
+    return FULL_MASK ^ (FULL_MASK >> prefix)
+
+
+def parse_prefix(text):
+    """Reads a prefix length ("20", "/20") or a dotted mask ("255.255.240.0")."""
+    text = text.strip().lstrip("/")
+    if text.isdigit() and int(text) <= 32:
+        return int(text)
+    mask = parse_ipv4(text)
+    prefix = 32 - (~mask & FULL_MASK).bit_length()
+    if prefix_mask(prefix) != mask:
+        raise ValueError(f"{text} is not a valid subnet mask (its 1 bits must be contiguous).")
+    return prefix
+
+
+def parse_cidr(text):
+    """Reads "a.b.c.d/p" or "a.b.c.d mask"; returns (address, prefix)."""
+    text = text.strip()
+    address, _, prefix = text.partition("/") if "/" in text else text.partition(" ")
+    if not prefix:
+        raise ValueError(f"'{text}' needs a prefix length or mask, e.g. 192.168.1.0/24.")
+    return parse_ipv4(address), parse_prefix(prefix)
+
+
+DEFAULT_PREFIX = {"A": 8, "B": 16, "C": 24}
+
+
+def address_class(address):
+    first = address >> 24
+    for name, limit in (("A", 128), ("B", 192), ("C", 224), ("D", 240)):
+        if first < limit:
+            return name
+    return "E"
+
+
+def usable_hosts(prefix):
+    host_bits = 32 - prefix
+    return 2 ** host_bits - 2 if host_bits >= 2 else 0
+
+
+def network_info(address, prefix):
+    """Everything asked about one address and prefix, as ints and counts."""
+    mask = prefix_mask(prefix)
+    network = address & mask
+    broadcast = network | (~mask & FULL_MASK)
+    hosts = usable_hosts(prefix)
+    return {
+        "address": address,
+        "prefix": prefix,
+        "mask": mask,
+        "wildcard": ~mask & FULL_MASK,
+        "network": network,
+        "broadcast": broadcast,
+        "first_host": network + 1 if hosts else None,
+        "last_host": broadcast - 1 if hosts else None,
+        "hosts": hosts,
+        "class": address_class(address),
+    }
+
+
+def split_subnets(network, prefix, count, limit=None):
+    """
+    Splits a network into at least ``count`` equal subnets by borrowing host
+    bits. Returns the bits borrowed, the new prefix, the number of subnets,
+    the usable hosts in each and the info of the first ``limit`` subnets
+    (all of them by default).
+    """
+    borrowed = max(0, (count - 1).bit_length())
+    new_prefix = prefix + borrowed
+    if new_prefix > 30:
+        raise ValueError(f"A /{prefix} can't be split into {count} subnets with usable hosts.")
+    network &= prefix_mask(prefix)
+    size = 1 << (32 - new_prefix)
+    total = 1 << borrowed
+    shown = total if limit is None else min(limit, total)
+    subnets = [network_info(network + i * size, new_prefix) for i in range(shown)]
+    return {"borrowed": borrowed, "prefix": new_prefix, "count": total, "hosts": usable_hosts(new_prefix), "subnets": subnets}
+
+
+def host_prefix(hosts):
+    """The longest prefix whose subnet still fits ``hosts`` usable addresses."""
+    return 32 - max(2, (hosts + 1).bit_length())
+
+
+def vlsm(network, prefix, requirements):
+    """
+    Allocates one subnet per host requirement, largest first, each aligned
+    to its own size. Returns [(index into requirements, subnet info)] in
+    address order; raises ValueError if they don't fit.
+    """
+    network &= prefix_mask(prefix)
+    end = network + (1 << (32 - prefix))
+    cursor = network
+    allocated = []
+    for i in sorted(range(len(requirements)), key=lambda i: requirements[i], reverse=True):
+        sub_prefix = host_prefix(requirements[i])
+        size = 1 << (32 - sub_prefix)
+        cursor = -(-cursor // size) * size
+        if sub_prefix < prefix or cursor + size > end:
+            raise ValueError(f"The subnets don't fit in /{prefix}: ran out of space at the {requirements[i]}-host subnet.")
+        allocated.append((i, network_info(cursor, sub_prefix)))
+        cursor += size
+    return allocated
+
+
+# --- BATCH ---
+
+def network_table(addresses, prefixes):
+    """
+    Vectorized network_info: the answer columns for arrays of addresses and
+    prefixes. First and last host are int64 columns with -1 where the
+    subnet has no usable hosts (/31, /32); the rest are uint64.
+    """
+    addresses = addresses.astype(np.uint64)
+    host_bits = 32 - prefixes.astype(np.uint64)
+    mask = (FULL_MASK << host_bits) & FULL_MASK
+    network = addresses & mask
+    broadcast = network | (~mask & FULL_MASK)
+    hosts = np.where(host_bits >= 2, (np.uint64(1) << host_bits) - 2, 0)
+    has_hosts = hosts > 0
+    return {
+        "network": network,
+        "broadcast": broadcast,
+        "first_host": np.where(has_hosts, network.astype(np.int64) + 1, -1),
+        "last_host": np.where(has_hosts, broadcast.astype(np.int64) - 1, -1),
+        "hosts": hosts,
+    }
+
+
+def random_problems(rng, count, min_prefix=8, max_prefix=30):
+    """``count`` random (address, prefix) practice questions as arrays."""
+    addresses = rng.integers(1 << 24, 224 << 24, size=count, dtype=np.uint64)  # Class A to C
+    prefixes = rng.integers(min_prefix, max_prefix + 1, size=count)
+    return addresses, prefixes
+
+
+# Strings for every octet and prefix length, so whole columns are formatted by lookup.
+_OCTETS = np.array([str(i) for i in range(256)], dtype=object)
+_PREFIXES = np.array([f"/{i}" for i in range(33)], dtype=object)
+
+
+def format_ipv4_column(values):
+    """format_ipv4 over an array of addresses at once."""
+    values = np.asarray(values, dtype=np.uint64)
+    a, b, c, d = (_OCTETS[(values >> np.uint64(shift)) & np.uint64(0xFF)] for shift in (24, 16, 8, 0))
+    return a + "." + b + "." + c + "." + d
+
+
+# Longest digit run read as a number when a column is parsed as a whole.
+MAX_DIGITS = 10
+
+
+def _digit_runs(cells):
+    """
+    Splits a column into runs of digits, each ended by "." or by the end of
+    its cell, working on the column's bytes at once. Returns every run's
+    value and the byte that ended it, or None if a cell holds anything but
+    digits and dots, an empty run or an overlong one.
+    """
+    try:
+        data = np.frombuffer(("\n".join(cell.strip() for cell in cells) + "\n").encode("ascii"), dtype=np.uint8)
+    except UnicodeEncodeError:
+        return None
+    is_end = (data == ord(".")) | (data == ord("\n"))
+    digits = data - np.uint8(ord("0"))
+    if (~is_end & (digits > 9)).any():
+        return None
+    ends = np.flatnonzero(is_end)
+    lengths = np.diff(ends, prepend=-1) - 1
+    if (lengths < 1).any() or (lengths > MAX_DIGITS).any():
+        return None
+    values = np.zeros(len(ends), dtype=np.int64)
+    for k in range(int(lengths.max())):
+        values += np.where(lengths > k, digits[ends - 1 - k], 0).astype(np.int64) * 10 ** k
+    return values, data[ends]
+
+
+def _parse_ipv4_column(cells):
+    """parse_ipv4 over a column of plain dotted addresses; None if any cell is something else."""
+    runs = _digit_runs(cells)
+    if runs is None or len(runs[0]) != 4 * len(cells):
+        return None
+    octets, enders = runs[0].reshape(-1, 4), runs[1].reshape(-1, 4)
+    if (enders[:, :3] != ord(".")).any() or (enders[:, 3] != ord("\n")).any() or (octets > 255).any():
+        return None
+    return (octets << np.array([24, 16, 8, 0])).sum(axis=1).astype(np.uint64)
+
+
+def _parse_int_column(cells):
+    """A column of plain whole numbers as an array; None if any cell is something else."""
+    runs = _digit_runs(cells)
+    if runs is None or len(runs[0]) != len(cells):
+        return None
+    return runs[0]
+
+
+def problems_csv(addresses, prefixes, with_answers=False):
+    """An answer sheet: one row per question, with the answer columns empty or filled in."""
+    columns = [format_ipv4_column(addresses), _PREFIXES[np.asarray(prefixes, dtype=np.int64)]]
+    if with_answers:
+        table = network_table(addresses, prefixes)
+        columns += [table[field].astype(str) if field == "hosts" else _address_answers(table[field]) for field in ANSWER_FIELDS]
+    else:
+        columns += [[""] * len(addresses)] * len(ANSWER_FIELDS)
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(("address", "prefix") + ANSWER_FIELDS)
+    writer.writerows(zip(*columns))
+    return out.getvalue()
+
+
+def _address_answers(values):
+    """An address answer column for a sheet, blank where there's no such host (-1)."""
+    values = np.asarray(values, dtype=np.int64)
+    return np.where(values < 0, "", format_ipv4_column(np.maximum(values, 0)))
+
+
+def check_answer_sheet(text):
+    """
+    Marks a filled-in answer sheet (see problems_csv). Returns the computed
+    answers and, per answer column present, a boolean array of which rows
+    are right. A first or last host of a /31 or /32 is right when left
+    blank (or "-"). Raises ValueError naming the first unreadable row. Columns
+    of plain values are read as whole arrays; a column with anything else
+    in it is read cell by cell.
+    """
+    try:
+        table = [row for row in csv.reader(io.StringIO(text)) if row]
+    except csv.Error as e:
+        raise ValueError(f"The answer sheet isn't a readable CSV file ({e}).")
+    if len(table) < 2:
+        raise ValueError("The answer sheet has no rows.")
+    header, rows = table[0], table[1:]
+    missing = {"address", "prefix"} - set(header)
+    if missing:
+        raise ValueError(f"The answer sheet needs the columns {', '.join(sorted(missing))}.")
+    # Short rows are padded with blank cells (the padding row makes every column as long as the header)
+    columns = itertools.zip_longest(*rows, [""] * len(header), fillvalue="")
+    cells = {name: column[:-1] for name, column in zip(header, columns)}
+    addresses = _parse_ipv4_column(cells["address"])
+    if addresses is None:
+        addresses = np.array([_read_cell(n, parse_ipv4, cell) for n, cell in enumerate(cells["address"], start=2)], dtype=np.uint64)
+    prefixes = _parse_int_column([cell.strip().lstrip("/") for cell in cells["prefix"]])
+    if prefixes is None or (prefixes > 32).any():
+        prefixes = np.array([_read_cell(n, parse_prefix, cell) for n, cell in enumerate(cells["prefix"], start=2)])
+    prefixes = prefixes.astype(np.uint64)
+    columns = [field for field in ANSWER_FIELDS if field in cells]
+    answers = {field: _read_answers(field, cells[field]) for field in columns}
+    expected = network_table(addresses, prefixes)
+    marks = {field: answers[field] == expected[field].astype(np.int64) for field in columns}
+    return {"addresses": addresses, "prefixes": prefixes, "answers": answers, "expected": expected, "marks": marks}
+
+
+def _read_answers(field, cells):
+    """An answer column as ints, -1 where the cell is blank or unreadable."""
+    answers = np.full(len(cells), -1, dtype=np.int64)
+    filled = [i for i, cell in enumerate(cells) if cell.strip()]
+    if filled:
+        given = [cells[i] for i in filled]
+        values = _parse_int_column(given) if field == "hosts" else _parse_ipv4_column(given)
+        answers[filled] = values if values is not None else [_read_answer(field, cell) for cell in given]
+    return answers
+
+
+def _read_cell(n, parse, text):
+    try:
+        return parse(text)
+    except ValueError as e:
+        raise ValueError(f"Row {n}: {e}")
+
+
+def _read_answer(field, text):
+    """An answer cell as an int, or -1 if it's blank or unreadable (always marked wrong)."""
+    text = (text or "").strip().replace(",", "")
+    try:
+        return int(text) if field == "hosts" else parse_ipv4(text)
+    except ValueError:
+        return -1
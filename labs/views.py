@@ -0,0 +1,908 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import streamlit as st
+
+from labs import arq, congestion, crc, routing, subnet
+
+# --- LAB VIEWS ---
+# The Streamlit side of each lab. A view takes a key prefix for its widgets
+# (the topic's key) and is drawn inside a fragment by the module view, so
+# working a lab only reruns the lab.
+
+# Practice batches are capped so one click can't tie up the server: by
+# cases, and by cells (cases x bits or words per case) in the largest array.
+MAX_BATCH = 1_000_000
+MAX_BATCH_CELLS = 16_000_000
+# Batch CRC takes generators up to CRC-32's.
+MAX_BATCH_GENERATOR = 33
+PREVIEW_ROWS = 20
+
+
+def _flip(bits, position):
+    """Flips the bit at a 1-based position (0 leaves the bits unchanged)."""
+    if not 0 < position <= len(bits):
+        return bits
+    return bits[:position - 1] + ("0" if bits[position - 1] == "1" else "1") + bits[position:]
+
+
+def _batch_count(count, width, unit="bits"):
+    """The number of cases that fits the cell cap at ``width`` cells a case; says so if that's fewer than asked."""
+    fits = max(1, MAX_BATCH_CELLS // width)
+    if count > fits:
+        st.caption(f"Capped at {fits:,} cases of {width} {unit} each.")
+    return min(count, fits)
+
+
+def _timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+# --- CRC, checksum and Hamming ---
+
+def render_crc_lab(key):
+    mode = st.radio("Method", ["CRC", "Checksum", "Hamming code"], horizontal=True, key=f"{key}_crc_mode")
+    if mode == "CRC":
+        _render_crc(key)
+    elif mode == "Checksum":
+        _render_checksum(key)
+    else:
+        _render_hamming(key)
+
+
+def _render_crc(key):
+    col1, col2 = st.columns(2)
+    data_text = col1.text_input("Data bits", "10011101", key=f"{key}_crc_data")
+    generator_text = col2.text_input("Generator (bits or polynomial)", "x^3 + 1", key=f"{key}_crc_gen")
+    try:
+        data = crc.parse_bits(data_text)
+        generator = crc.parse_generator(generator_text)
+    except ValueError as e:
+        st.error(str(e))
+        return
+
+    worked = crc.crc_encode(data, generator)
+    st.markdown(f"Generator **{generator}** (degree {len(generator) - 1}), so {len(generator) - 1} zeros are appended to the data.")
+    st.code(crc.format_division(worked, generator), language=None)
+    st.success(f"Transmitted: **{data}**`{worked['remainder']}` = {worked['codeword']}")
+
+    flip = st.number_input(
+        "Invert bit (from the left, 0 for none)", min_value=0, max_value=len(worked["codeword"]), value=0, key=f"{key}_crc_flip"
+    )
+    received = _flip(worked["codeword"], flip)
+    check = crc.crc_check(received, generator)
+    with st.expander(f"Receiver divides {received}", expanded=bool(flip)):
+        st.code(crc.format_division(check, generator), language=None)
+    if check["error"]:
+        st.warning(f"Remainder {check['remainder']} is not zero: the error is detected.")
+    else:
+        st.info("Remainder is zero: the frame is accepted." + (" This error goes undetected!" if flip else ""))
+
+    st.subheader("Batch practice")
+    col1, col2, col3 = st.columns(3)
+    count = col1.number_input("Cases", min_value=1, max_value=MAX_BATCH, value=10_000, step=1_000, key=f"{key}_crc_count")
+    length = col2.number_input("Data bits per case", min_value=1, max_value=64, value=min(len(data), 64), key=f"{key}_crc_length")
+    errors = col3.number_input("Bits inverted in transit", min_value=0, max_value=8, value=1, key=f"{key}_crc_errors")
+    if st.button("Generate and check", key=f"{key}_crc_run"):
+        if len(generator) > MAX_BATCH_GENERATOR:
+            st.error(f"Batch practice takes generators of up to {MAX_BATCH_GENERATOR} bits.")
+            return
+        count = _batch_count(count, length + len(generator) - 1)
+        rng = np.random.default_rng()
+        batch = crc.random_bits(rng, count, length)
+        codewords, encode_time = _timed(crc.crc_encode_batch, batch, generator)
+        received = crc.flip_random_bits(rng, codewords, errors)
+        accepted, check_time = _timed(crc.crc_verify_batch, received, generator)
+        detected = ~accepted if errors else accepted
+        st.metric(
+            "Errors detected" if errors else "Frames accepted",
+            f"{detected.mean():.2%}",
+            help=f"Encoded in {encode_time * 1000:.0f} ms, checked in {check_time * 1000:.0f} ms.",
+        )
+        preview = slice(0, PREVIEW_ROWS)
+        st.dataframe({
+            "Data": crc.bit_strings(batch[preview]),
+            "Transmitted": crc.bit_strings(codewords[preview]),
+            "Received": crc.bit_strings(received[preview]),
+            "Remainder": crc.bit_strings(crc.crc_remainders(received[preview], generator)),
+            "Accepted": accepted[preview],
+        })
+
+    st.subheader("Check your own codewords")
+    lines = st.text_area("One received codeword per line", key=f"{key}_crc_own").split()
+    if lines:
+        try:
+            lines = [crc.parse_bits(line) for line in lines]
+        except ValueError as e:
+            st.error(str(e))
+            return
+        if min(map(len, lines)) < len(generator):
+            st.error(f"Codewords can't be shorter than the generator ({len(generator)} bits).")
+            return
+        by_length = {}
+        for i, line in enumerate(lines):
+            by_length.setdefault(len(line), []).append(i)
+        remainders = [None] * len(lines)
+        for indexes in by_length.values():
+            rows = crc.bits_array([lines[i] for i in indexes])
+            for i, remainder in zip(indexes, crc.bit_strings(crc.crc_remainders(rows, generator))):
+                remainders[i] = remainder
+        st.dataframe({
+            "Codeword": lines,
+            "Remainder": remainders,
+            "Accepted": ["1" not in remainder for remainder in remainders],
+        })
+
+
+def _render_checksum(key):
+    col1, col2 = st.columns(2)
+    words_text = col1.text_area("Data bits (split into words)", "10011001 11100010 00100100 10000100", key=f"{key}_sum_data")
+    word_size = col2.selectbox("Word size (bits)", [4, 8, 16], index=1, key=f"{key}_sum_size")
+    try:
+        words = crc.split_words(crc.parse_bits(words_text), word_size)
+    except ValueError as e:
+        st.error(str(e))
+        return
+
+    worked = crc.checksum(words, word_size)
+    st.dataframe({
+        "Word": [step["word"] for step in worked["steps"]],
+        "Carry wrapped": [step["carry"] for step in worked["steps"]],
+        "Running sum": [step["sum"] for step in worked["steps"]],
+    })
+    st.success(f"Sum {worked['sum']}, so the checksum (its complement) is **{worked['checksum']}**.")
+    receiver = crc.checksum(words + [worked["checksum"]], word_size)
+    st.info(f"The receiver adds all words and the checksum: {receiver['sum']}. Complemented, that is {receiver['checksum']}, so the data is accepted.")
+
+    st.subheader("Batch practice")
+    col1, col2 = st.columns(2)
+    count = col1.number_input("Cases", min_value=1, max_value=MAX_BATCH, value=10_000, step=1_000, key=f"{key}_sum_count")
+    word_count = col2.number_input("Words per case", min_value=1, max_value=64, value=min(len(words), 64), key=f"{key}_sum_words")
+    if st.button("Generate", key=f"{key}_sum_run"):
+        count = _batch_count(count, word_count, "words")
+        values = np.random.default_rng().integers(0, 1 << word_size, size=(count, word_count), dtype=np.uint16)
+        sums, elapsed = _timed(crc.checksum_batch, values, word_size)
+        st.caption(f"{count:,} checksums in {elapsed * 1000:.0f} ms.")
+        st.dataframe({
+            "Words": [" ".join(format(int(v), f"0{word_size}b") for v in row) for row in values[:PREVIEW_ROWS]],
+            "Checksum": [format(int(v), f"0{word_size}b") for v in sums[:PREVIEW_ROWS]],
+        })
+
+
+def _render_hamming(key):
+    data_text = st.text_input("Data bits", "1011", key=f"{key}_ham_data")
+    try:
+        data = crc.parse_bits(data_text)
+    except ValueError as e:
+        st.error(str(e))
+        return
+
+    worked = crc.hamming_encode(data)
+    p = len(worked["parities"])
+    st.markdown(f"{len(data)} data bits need **p = {p}** parity bits (2^{p} ≥ {len(data)} + {p} + 1).")
+    st.dataframe({
+        "Parity bit": [f"P{parity['position']}" for parity in worked["parities"]],
+        "Checks positions": [", ".join(map(str, parity["checks"])) for parity in worked["parities"]],
+        "Value (even parity)": [parity["value"] for parity in worked["parities"]],
+    })
+    st.success(f"Codeword: **{worked['codeword']}**")
+
+    flip = st.number_input(
+        "Invert bit (position from the left, 0 for none)", min_value=0, max_value=len(worked["codeword"]), value=0, key=f"{key}_ham_flip"
+    )
+    decoded = crc.hamming_decode(_flip(worked["codeword"], flip))
+    if decoded["syndrome"]:
+        st.warning(f"Syndrome {decoded['syndrome']:0{p}b} = {decoded['syndrome']}: bit {decoded['syndrome']} is corrected, giving {decoded['corrected']} (data {decoded['data']}).")
+    else:
+        st.info("Syndrome 0: no error.")
+
+    st.subheader("Batch practice")
+    col1, col2, col3 = st.columns(3)
+    count = col1.number_input("Cases", min_value=1, max_value=MAX_BATCH, value=10_000, step=1_000, key=f"{key}_ham_count")
+    length = col2.number_input("Data bits per case", min_value=1, max_value=57, value=min(len(data), 57), key=f"{key}_ham_length")
+    errors = col3.number_input("Bits inverted in transit", min_value=0, max_value=3, value=1, key=f"{key}_ham_errors")
+    if st.button("Generate and correct", key=f"{key}_ham_run"):
+        count = _batch_count(count, length + crc.parity_bit_count(length))
+        rng = np.random.default_rng()
+        batch = crc.random_bits(rng, count, length)
+        codewords, encode_time = _timed(crc.hamming_encode_batch, batch)
+        received = crc.flip_random_bits(rng, codewords, errors)
+        (corrected, syndromes), correct_time = _timed(crc.hamming_correct_batch, received)
+        recovered = (corrected == codewords).all(axis=1)
+        st.metric(
+            "Codewords recovered",
+            f"{recovered.mean():.2%}",
+            help=f"Encoded in {encode_time * 1000:.0f} ms, corrected in {correct_time * 1000:.0f} ms. A single inverted bit is always corrected; two or more are not.",
+        )
+        preview = slice(0, PREVIEW_ROWS)
+        st.dataframe({
+            "Data": crc.bit_strings(batch[preview]),
+            "Codeword": crc.bit_strings(codewords[preview]),
+            "Received": crc.bit_strings(received[preview]),
+            "Syndrome": syndromes[preview],
+            "Recovered": recovered[preview],
+        })
+
+
+# --- Subnetting ---
+
+# Subnet tables longer than this are cut short.
+MAX_SUBNET_ROWS = 256
+
+
+def _subnet_rows(infos):
+    return {
+        "Subnet": [f"{subnet.format_ipv4(info['network'])}/{info['prefix']}" for info in infos],
+        "First host": [subnet.format_ipv4(info["first_host"]) if info["hosts"] else "-" for info in infos],
+        "Last host": [subnet.format_ipv4(info["last_host"]) if info["hosts"] else "-" for info in infos],
+        "Broadcast": [subnet.format_ipv4(info["broadcast"]) for info in infos],
+        "Usable hosts": [info["hosts"] for info in infos],
+    }
+
+
+def _dotted_binary(value):
+    return ".".join(format(value >> shift & 0xFF, "08b") for shift in (24, 16, 8, 0))
+
+
+def render_subnet_lab(key):
+    mode = st.radio(
+        "Question", ["Address & mask", "Split into subnets", "VLSM", "Practice sheet"], horizontal=True, key=f"{key}_subnet_mode"
+    )
+    try:
+        if mode == "Address & mask":
+            _render_address(key)
+        elif mode == "Split into subnets":
+            _render_split(key)
+        elif mode == "VLSM":
+            _render_vlsm(key)
+        else:
+            _render_practice_sheet(key)
+    except ValueError as e:
+        st.error(str(e))
+
+
+def _render_address(key):
+    col1, col2 = st.columns(2)
+    address = subnet.parse_ipv4(col1.text_input("IP address", "195.1.1.77", key=f"{key}_subnet_address"))
+    prefix = subnet.parse_prefix(col2.text_input("Mask or prefix length", "255.255.255.192", key=f"{key}_subnet_mask"))
+    info = subnet.network_info(address, prefix)
+    st.code("\n".join([
+        f"Address    {_dotted_binary(address)}",
+        f"Mask  /{prefix:<3} {_dotted_binary(info['mask'])}",
+        f"AND        {_dotted_binary(info['network'])}",
+    ]), language=None)
+    st.dataframe({
+        "": ["Mask", "Wildcard", "Network", "Broadcast", "First host", "Last host", "Usable hosts", "Class"],
+        "Answer": [
+            f"{subnet.format_ipv4(info['mask'])} (/{prefix})",
+            subnet.format_ipv4(info["wildcard"]),
+            subnet.format_ipv4(info["network"]),
+            subnet.format_ipv4(info["broadcast"]),
+            subnet.format_ipv4(info["first_host"]) if info["hosts"] else "-",
+            subnet.format_ipv4(info["last_host"]) if info["hosts"] else "-",
+            f"2^{32 - prefix} - 2 = {info['hosts']:,}" if info["hosts"] else "0",
+            info["class"],
+        ],
+    }, hide_index=True)
+
+
+def _render_split(key):
+    col1, col2 = st.columns(2)
+    network = subnet.parse_ipv4(col1.text_input("Network", "195.1.1.0", key=f"{key}_split_network"))
+    count = col2.number_input("Subnets needed", min_value=1, max_value=1 << 20, value=10, key=f"{key}_split_count")
+    default = subnet.DEFAULT_PREFIX.get(subnet.address_class(network))
+    mask_text = st.text_input(
+        "Mask or prefix length (blank for the classful default)", "", key=f"{key}_split_mask"
+    )
+    if mask_text.strip():
+        prefix = subnet.parse_prefix(mask_text)
+    elif default is None:
+        raise ValueError("Class D and E addresses have no default mask; enter one.")
+    else:
+        prefix = default
+    split = subnet.split_subnets(network, prefix, count, limit=MAX_SUBNET_ROWS)
+    st.success(
+        f"Borrow **{split['borrowed']}** host bits (2^{split['borrowed']} = {split['count']:,} ≥ {count:,}): "
+        f"the new mask is **{subnet.format_ipv4(subnet.prefix_mask(split['prefix']))}** (/{split['prefix']}), "
+        f"with {split['hosts']:,} usable hosts per subnet."
+    )
+    st.dataframe(_subnet_rows(split["subnets"]))
+    if split["count"] > MAX_SUBNET_ROWS:
+        st.caption(f"The first {MAX_SUBNET_ROWS} of {split['count']:,} subnets.")
+
+
+def _render_vlsm(key):
+    col1, col2 = st.columns(2)
+    network, prefix = subnet.parse_cidr(col1.text_input("Network", "192.168.1.0/24", key=f"{key}_vlsm_network"))
+    requirements_text = col2.text_input("Hosts needed per subnet", "60, 30, 12, 2", key=f"{key}_vlsm_hosts")
+    try:
+        requirements = [int(part) for part in requirements_text.replace(",", " ").split()]
+    except ValueError:
+        raise ValueError("List the host counts as whole numbers, e.g. 60, 30, 12, 2.")
+    if not requirements:
+        return
+    allocated = subnet.vlsm(network, prefix, requirements)
+    rows = _subnet_rows([info for _, info in allocated])
+    st.dataframe({"Hosts needed": [requirements[i] for i, _ in allocated], **rows})
+    used = sum(1 << (32 - info["prefix"]) for _, info in allocated)
+    st.caption(f"{used:,} of {1 << (32 - prefix):,} addresses allocated.")
+
+
+def _expected_answer(field, value):
+    if field == "hosts":
+        return str(int(value))
+    return "-" if value < 0 else subnet.format_ipv4(value)
+
+
+def _render_practice_sheet(key):
+    st.write("Generate a sheet of random questions, fill in the answers in a spreadsheet, and upload it to have it marked.")
+    col1, col2 = st.columns(2)
+    count = col1.number_input("Questions", min_value=1, max_value=100_000, value=200, step=100, key=f"{key}_sheet_count")
+    min_prefix, max_prefix = col2.slider("Prefix lengths", 8, 30, (16, 30), key=f"{key}_sheet_prefixes")
+    sheet_key = f"{key}_subnet_sheet"
+    if st.button("New practice sheet", key=f"{key}_sheet_new"):
+        addresses, prefixes = subnet.random_problems(np.random.default_rng(), count, min_prefix, max_prefix)
+        st.session_state[sheet_key] = (subnet.problems_csv(addresses, prefixes), subnet.problems_csv(addresses, prefixes, with_answers=True))
+    if sheet_key in st.session_state:
+        questions, answers = st.session_state[sheet_key]
+        col1, col2 = st.columns(2)
+        col1.download_button("Download questions (.csv)", questions, file_name="subnetting_practice.csv", mime="text/csv", key=f"{key}_sheet_download")
+        col2.download_button("Download answer key (.csv)", answers, file_name="subnetting_answers.csv", mime="text/csv", key=f"{key}_sheet_answers")
+
+    uploaded = st.file_uploader("Upload your filled-in sheet", type=["csv"], key=f"{key}_sheet_upload")
+    if uploaded is None:
+        return
+    result, elapsed = _timed(subnet.check_answer_sheet, uploaded.getvalue().decode("utf-8-sig"))
+    marks = result["marks"]
+    if not marks:
+        raise ValueError(f"The sheet has none of the answer columns: {', '.join(subnet.ANSWER_FIELDS)}.")
+    all_right = np.logical_and.reduce(list(marks.values()))
+    st.metric("Questions fully right", f"{int(all_right.sum()):,} / {len(all_right):,}", help=f"Marked in {elapsed * 1000:.0f} ms.")
+    columns = st.columns(len(marks))
+    for column, (field, right) in zip(columns, marks.items()):
+        column.metric(field.replace("_", " ").capitalize(), f"{right.mean():.0%}")
+    wrong = np.nonzero(~all_right)[0][:PREVIEW_ROWS]
+    if len(wrong):
+        st.write("Questions to look at again, with the right answers:")
+        expected = result["expected"]
+        table = {
+            "Question": [f"{subnet.format_ipv4(result['addresses'][i])}/{int(result['prefixes'][i])}" for i in wrong],
+        }
+        for field in marks:
+            table[field.replace("_", " ").capitalize()] = [
+                ("" if marks[field][i] else "✗ ") + _expected_answer(field, expected[field][i])
+                for i in wrong
+            ]
+        st.dataframe(table)
+
+
+# --- Routing ---
+
+ROUTING_PRESETS = {
+    "Chain (count-to-infinity)": ("A B 1\nB C 1\nC D 1", ("A", "B")),
+    "Triangle with a tail": ("A B 1\nB C 1\nA C 1\nC D 1", ("C", "D")),
+    "Six routers": ("A B 2\nA C 5\nB C 3\nB D 4\nC E 1\nD E 2\nD F 6\nE F 3", ("D", "F")),
+}
+MAX_DV_ROUNDS = 100
+MAX_BENCHMARK_ROUTERS = 3000
+
+
+def _cost(value):
+    return "∞" if not np.isfinite(value) else f"{value:g}"
+
+
+def _route_table(names, dist, next_hop):
+    """Rows are routers, columns destinations, cells "cost via next hop"."""
+    table = {"Router": names}
+    for x, name in enumerate(names):
+        table[name] = [
+            "-" if i == x else f"{_cost(dist[i, x])}" + (f" via {names[next_hop[i, x]]}" if next_hop[i, x] >= 0 else "")
+            for i in range(len(names))
+        ]
+    return table
+
+
+def render_routing_lab(key):
+    mode = st.radio(
+        "Simulation", ["Router update", "Distance vector", "Link state", "Benchmark"], horizontal=True, key=f"{key}_routing_mode"
+    )
+    try:
+        if mode == "Router update":
+            _render_router_update(key)
+        elif mode == "Distance vector":
+            _render_distance_vector(key)
+        elif mode == "Link state":
+            _render_link_state(key)
+        else:
+            _render_routing_benchmark(key)
+    except ValueError as e:
+        st.error(str(e))
+
+
+def _topology(key, default):
+    names, links = routing.parse_links(st.text_area("Links, one per line: A B cost", default, key=key))
+    if len(names) < 2:
+        raise ValueError("Add at least one link.")
+    return names, links, routing.cost_matrix(len(names), links)
+
+
+def _render_router_update(key):
+    st.write("A router's new table from the vectors its neighbours just sent and the measured delay to each of them.")
+    col1, col2 = st.columns(2)
+    destinations = col1.text_input("Routers (in vector order)", "A B C D E F", key=f"{key}_dvu_names").split()
+    own = col2.text_input("This router", "C", key=f"{key}_dvu_own").strip()
+    vectors_text = st.text_area(
+        "Vectors received (Neighbour: costs)", "B: 5 0 8 12 6 2\nD: 16 12 6 0 9 10\nE: 7 6 3 9 0 4", key=f"{key}_dvu_vectors"
+    )
+    delays_text = st.text_input("Measured delays (Neighbour delay, ...)", "B 6, D 3, E 5", key=f"{key}_dvu_delays")
+    if own not in destinations:
+        raise ValueError(f"{own} isn't in the list of routers.")
+    vectors = {}
+    for line in vectors_text.splitlines():
+        if not line.strip():
+            continue
+        neighbor, _, costs = line.partition(":")
+        try:
+            vectors[neighbor.strip()] = [float(cost) for cost in costs.replace(",", " ").split()]
+        except ValueError:
+            raise ValueError(f"Can't read the vector '{line.strip()}'.")
+        if len(vectors[neighbor.strip()]) != len(destinations):
+            raise ValueError(f"{neighbor.strip()}'s vector needs {len(destinations)} costs.")
+    delays = {}
+    for part in delays_text.split(","):
+        if part.strip():
+            neighbor, _, delay = part.strip().partition(" ")
+            try:
+                delays[neighbor] = float(delay)
+            except ValueError:
+                raise ValueError(f"Can't read the delay '{part.strip()}'.")
+    if not vectors or set(vectors) != set(delays):
+        raise ValueError("Give one vector and one delay for each neighbour.")
+
+    table = routing.dv_update(vectors, delays, destinations.index(own))
+    rows = {"To": destinations}
+    for neighbor, vector in vectors.items():
+        rows[f"via {neighbor}"] = [
+            "-" if x == destinations.index(own) else f"{delays[neighbor]:g} + {vector[x]:g} = {delays[neighbor] + vector[x]:g}"
+            for x in range(len(destinations))
+        ]
+    rows["New cost"] = [f"{cost:g}" for cost, _ in table]
+    rows["Next hop"] = [neighbor or "-" for _, neighbor in table]
+    st.dataframe(rows, hide_index=True)
+
+
+def _render_distance_vector(key):
+    preset = st.selectbox("Network", list(ROUTING_PRESETS), key=f"{key}_dv_preset")
+    default_links, default_failure = ROUTING_PRESETS[preset]
+    names, links, costs = _topology(f"{key}_dv_links_{list(ROUTING_PRESETS).index(preset)}", default_links)
+    col1, col2 = st.columns(2)
+    technique = col1.radio("Loop prevention", routing.TECHNIQUES, horizontal=True, key=f"{key}_dv_technique")
+    infinity = col2.number_input("Infinity (RIP uses 16)", min_value=2, max_value=1000, value=routing.RIP_INFINITY, key=f"{key}_dv_infinity")
+
+    dv = routing.DistanceVector(costs, technique, infinity)
+    history = [(dv.dist.copy(), dv.next_hop.copy())]
+    rounds = dv.run(MAX_DV_ROUNDS, history)
+    st.success(f"Converged after {rounds} rounds of exchanging vectors.")
+    shown = st.slider("After round", 0, rounds, rounds, key=f"{key}_dv_round") if rounds else 0
+    st.dataframe(_route_table(names, *history[shown]), hide_index=True)
+
+    st.subheader("Take a link down")
+    labels = [f"{names[a]} - {names[b]}" for a, b, _ in links]
+    default = f"{default_failure[0]} - {default_failure[1]}"
+    failed = st.selectbox(
+        "Link", ["(none)"] + labels, index=labels.index(default) + 1 if default in labels else 0, key=f"{key}_dv_failed_{preset}"
+    )
+    if failed == "(none)":
+        return
+    a, b, _ = links[labels.index(failed)]
+    destination = st.selectbox("Watch the routes to", names, index=a, key=f"{key}_dv_watch_{preset}")
+    dv.set_link(a, b, np.inf)
+    after = [(dv.dist.copy(), dv.next_hop.copy())]
+    rounds = dv.run(MAX_DV_ROUNDS, after)
+    x = names.index(destination)
+    st.line_chart(
+        {name: [float(dist[i, x]) if np.isfinite(dist[i, x]) else np.nan for dist, _ in after] for i, name in enumerate(names) if i != x},
+        x_label="Round",
+        y_label=f"Cost to {destination}",
+    )
+    if rounds == MAX_DV_ROUNDS:
+        st.warning(f"Still changing after {MAX_DV_ROUNDS} rounds.")
+    else:
+        st.info(f"Settled {rounds} rounds after the link went down. A line that stops has reached infinity (unreachable).")
+    st.dataframe(_route_table(names, *after[-1]), hide_index=True)
+
+
+def _render_link_state(key):
+    preset = st.selectbox("Network", list(ROUTING_PRESETS), index=2, key=f"{key}_ls_preset")
+    names, _, costs = _topology(f"{key}_ls_links_{list(ROUTING_PRESETS).index(preset)}", ROUTING_PRESETS[preset][0])
+    source = names.index(st.selectbox("Router running Dijkstra", names, key=f"{key}_ls_source_{preset}"))
+    dist, prev, steps = routing.dijkstra(costs, source, record=True)
+    st.write("Each step adds the closest router not yet in N' and updates the costs through it: D(v), p(v).")
+    done = []
+    rows = {"Step": [], "N'": []}
+    for name in names:
+        if name != names[source]:
+            rows[name] = []
+    for n, (added, step_dist, step_prev) in enumerate(steps):
+        done.append(names[added])
+        rows["Step"].append(n)
+        rows["N'"].append("".join(done) if all(len(name) == 1 for name in done) else ", ".join(done))
+        for v, name in enumerate(names):
+            if v != source:
+                rows[name].append(
+                    "" if name in done[:-1] else f"{_cost(step_dist[v])}, {names[step_prev[v]]}" if step_prev[v] >= 0 else "∞"
+                )
+    st.dataframe(rows, hide_index=True)
+    hops = routing.first_hops(prev, source)
+    st.dataframe({
+        "Destination": [name for v, name in enumerate(names) if v != source],
+        "Cost": [_cost(dist[v]) for v in range(len(names)) if v != source],
+        "Next hop": [names[hops[v]] if hops[v] >= 0 else "-" for v in range(len(names)) if v != source],
+    }, hide_index=True)
+
+
+def _render_routing_benchmark(key):
+    st.write("Builds a random connected network and converges it with both algorithms.")
+    col1, col2, col3 = st.columns(3)
+    n = col1.number_input("Routers", min_value=10, max_value=MAX_BENCHMARK_ROUTERS, value=500, step=100, key=f"{key}_bench_routers")
+    degree = col2.slider("Links per router", 2, 8, 3, key=f"{key}_bench_degree")
+    technique = col3.selectbox("Loop prevention", routing.TECHNIQUES, key=f"{key}_bench_technique")
+    runs_key = f"{key}_bench_runs"
+    if st.button("Run", key=f"{key}_bench_run"):
+        rng = np.random.default_rng()
+        with st.spinner("Converging..."):
+            result = routing.benchmark(routing.random_topology(rng, n, degree), technique, rng=rng)
+        st.session_state.setdefault(runs_key, []).append(dict(result, technique=technique))
+    runs = st.session_state.get(runs_key)
+    if not runs:
+        return
+    latest = runs[-1]
+    col1, col2 = st.columns(2)
+    col1.metric("Distance vector", f"{latest['dv_seconds']:.2f} s", help="Time taken to compute every router's updates, all rounds.")
+    col1.caption(f"{latest['dv_rounds']} rounds, {latest['dv_messages']:,} vectors sent")
+    col2.metric("Link state", f"{latest['ls_seconds']:.2f} s", help=f"Dijkstra timed on {latest['ls_sampled']} routers and scaled to all of them.")
+    col2.caption(f"{latest['ls_messages']:,} link state packets forwarded while flooding")
+    if not latest["agrees"]:
+        st.error("The distance vector tables don't match Dijkstra's shortest paths.")
+    st.dataframe({
+        "Routers": [run["routers"] for run in runs],
+        "Links": [run["links"] for run in runs],
+        "Loop prevention": [run["technique"] for run in runs],
+        "DV rounds": [run["dv_rounds"] for run in runs],
+        "DV vectors": [run["dv_messages"] for run in runs],
+        "DV time (s)": [round(run["dv_seconds"], 3) for run in runs],
+        "LS packets": [run["ls_messages"] for run in runs],
+        "LS time (s)": [round(run["ls_seconds"], 3) for run in runs],
+    })
+    st.button("Clear runs", key=f"{key}_bench_clear", on_click=st.session_state.pop, args=(runs_key, None))
+
+
+# --- Sliding window ---
+
+# Timelines are drawn for runs up to this many frames.
+MAX_TIMELINE_FRAMES = 40
+# Frames simulated for one sweep (frames per point x points x protocols).
+MAX_ARQ_SWEEP_FRAMES = 2_000_000
+SWEEPS = {
+    "Frame loss rate": ("loss", [0.0, 0.02, 0.05, 0.1, 0.15, 0.2, 0.3]),
+    "Window size": ("window", [1, 2, 4, 8, 16, 32]),
+    "Round-trip time": ("rtt", [1.0, 2.0, 4.0, 8.0, 16.0, 32.0]),
+}
+
+
+def _timeline_chart(timeline):
+    """A sender/receiver ladder diagram as a Vega-Lite spec, time running down."""
+    rows = []
+    for kind, seq, sent, arrives, lost, resent in timeline:
+        start, end = (0, 1) if kind == "frame" else (1, 0)
+        if lost:
+            # A lost transmission stops halfway across
+            arrives, end = (sent + arrives) / 2, 0.5
+        label = f"{'F' if kind == 'frame' else 'ACK '}{seq}"
+        rows.append({
+            "x": start, "x2": end, "y": sent, "y2": arrives, "label": label,
+            "what": "Lost" if lost else "Retransmitted frame" if resent else "Frame" if kind == "frame" else "ACK",
+        })
+    return {
+        "data": {"values": rows},
+        "encoding": {
+            "y": {"field": "y", "type": "quantitative", "scale": {"reverse": True}, "title": "Time"},
+            "color": {"field": "what", "type": "nominal", "title": None},
+        },
+        "layer": [
+            {
+                "mark": {"type": "rule", "strokeWidth": 2},
+                "encoding": {
+                    "x": {"field": "x", "type": "quantitative", "axis": {"values": [0, 1], "labelExpr": "datum.value ? 'Receiver' : 'Sender'"}, "title": None},
+                    "x2": {"field": "x2"},
+                    "y2": {"field": "y2"},
+                    "tooltip": [{"field": "label"}, {"field": "what"}, {"field": "y", "title": "Sent"}, {"field": "y2", "title": "Arrives"}],
+                },
+            },
+            {
+                "mark": {"type": "text", "align": "left", "dx": 4, "fontSize": 10},
+                "encoding": {"x": {"field": "x", "type": "quantitative"}, "text": {"field": "label"}},
+                "transform": [{"filter": "datum.x == 0"}],
+            },
+        ],
+        "height": max(300, 12 * len(rows)),
+    }
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _arq_run(protocol, frames, window, loss, ack_loss, tx, rtt, timeout, seed):
+    """One run and the time it took, cached by its parameters."""
+    return _timed(arq.simulate, protocol, frames, window, loss, tx, rtt, timeout, ack_loss, seed, frames <= MAX_TIMELINE_FRAMES)
+
+
+def render_arq_lab(key):
+    protocol = st.radio("Protocol", arq.PROTOCOLS, index=1, horizontal=True, key=f"{key}_arq_protocol")
+    col1, col2 = st.columns(2)
+    window = col1.number_input("Window size", min_value=1, max_value=128, value=4, key=f"{key}_arq_window", disabled=protocol == "Stop-and-Wait")
+    frames = col2.number_input("Frames", min_value=1, max_value=100_000, value=12, key=f"{key}_arq_frames")
+    col1, col2 = st.columns(2)
+    loss = col1.slider("Frame loss rate", 0.0, 0.5, 0.1, 0.01, key=f"{key}_arq_loss")
+    ack_loss = col2.slider("ACK loss rate", 0.0, 0.5, 0.1, 0.01, key=f"{key}_arq_ack_loss")
+    col1, col2, col3 = st.columns(3)
+    tx = col1.number_input("Frame transmission time", min_value=0.1, value=1.0, key=f"{key}_arq_tx")
+    rtt = col2.number_input("Round-trip propagation time", min_value=0.0, value=4.0, key=f"{key}_arq_rtt")
+    timeout = col3.number_input(
+        "Timeout (0 for automatic)", min_value=0.0, value=0.0, key=f"{key}_arq_timeout",
+        help=f"Automatic is 2 x transmission time + round trip = {arq.default_timeout(tx, rtt):g}.",
+    )
+    seed = st.number_input("Random seed", min_value=0, value=1, key=f"{key}_arq_seed")
+    settings = {"window": window, "loss": loss, "ack_loss": ack_loss, "tx": tx, "rtt": rtt, "timeout": timeout or None, "seed": seed}
+
+    stats, elapsed = _arq_run(protocol, frames, **settings)
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Time to deliver all", f"{stats['time']:g}", help=f"Simulated in {elapsed * 1000:.0f} ms.")
+    col2.metric("Transmissions", f"{stats['transmissions']:,}", f"{stats['retransmissions']:,} retransmitted", delta_color="inverse")
+    col3.metric(
+        "Efficiency", f"{stats['efficiency']:.1%}",
+        help=f"Textbook estimate {arq.ideal_efficiency(protocol, window, tx, rtt, loss):.1%} (it ignores lost ACKs and the time spent waiting for timeouts).",
+    )
+    if "timeline" in stats:
+        st.vega_lite_chart(_timeline_chart(stats["timeline"]), width="stretch")
+    else:
+        st.caption(f"Timelines are drawn for up to {MAX_TIMELINE_FRAMES} frames.")
+
+    st.subheader("Efficiency curves")
+    col1, col2 = st.columns(2)
+    varied = col1.selectbox("Vary", list(SWEEPS), key=f"{key}_arq_sweep")
+    sweep_frames = col2.number_input("Frames per point", min_value=100, max_value=500_000, value=20_000, step=10_000, key=f"{key}_arq_sweep_frames")
+    sweep_key = f"{key}_arq_sweep_result"
+    if st.button("Run all three protocols", key=f"{key}_arq_sweep_run"):
+        parameter, values = SWEEPS[varied]
+        points = len(values) * len(arq.PROTOCOLS)
+        if sweep_frames * points > MAX_ARQ_SWEEP_FRAMES:
+            sweep_frames = MAX_ARQ_SWEEP_FRAMES // points
+            st.caption(f"Capped at {sweep_frames:,} frames per point ({MAX_ARQ_SWEEP_FRAMES:,} frames in all).")
+        sweep_settings = dict(settings, frames=sweep_frames)
+        with st.spinner("Simulating..."):
+            curves, elapsed = _timed(arq.sweep, arq.PROTOCOLS, parameter, values, sweep_settings)
+        st.session_state[sweep_key] = (varied, values, curves, elapsed, points * sweep_frames)
+    if sweep_key in st.session_state:
+        varied, values, curves, elapsed, total = st.session_state[sweep_key]
+        st.line_chart({"x": values, **curves}, x="x", x_label=varied, y_label="Efficiency")
+        st.caption(f"{total:,} frames simulated in {elapsed:.1f} s. The other settings are as above.")
+
+
+# --- Congestion control ---
+
+# Worker processes shared by every session for congestion control sweeps.
+SWEEP_WORKERS = min(4, os.cpu_count() or 1)
+# Charts show at most this many steps of a traffic trace.
+MAX_CHART_STEPS = 300
+MAX_SHAPING_STEPS = 200_000
+# Flow-rounds (runs x flows x rounds) simulated for one sweep point.
+MAX_SWEEP_CELLS = 5_000_000
+TCP_SWEEPS = {
+    "Router buffer": ("buffer", [0, 5, 10, 20, 40, 80]),
+    "Flows sharing the link": ("flows", [1, 2, 4, 8, 16, 32]),
+    "Random loss rate": ("loss", [0.0, 0.001, 0.005, 0.01, 0.02, 0.05]),
+}
+
+
+@st.cache_resource
+def get_sweep_pool():
+    """Returns the process-wide pool that runs congestion control sweeps."""
+    return ProcessPoolExecutor(max_workers=SWEEP_WORKERS)
+
+
+# Results are cached by their parameters, so going back to a setting is instant.
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _tcp_run(rounds, flows, capacity, buffer, variant, loss, ssthresh, events, seed):
+    return congestion.tcp_simulate(rounds, flows, capacity, buffer, variant, loss, ssthresh, events, seed=seed)
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _shaping_run(steps, peak_in, on_fraction, mean_burst, seed, kind, rate, buckets, peak_out):
+    arrivals = congestion.on_off_traffic(steps, peak_in, on_fraction, mean_burst, seed)
+    return arrivals, congestion.shape_traffic(arrivals, kind, rate, buckets, peak_out)
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _tcp_sweep(parameter, values, settings):
+    """Every variant at every value, one task per point on the sweep pool. ``settings`` is a tuple of items."""
+    pool = get_sweep_pool()
+    futures = {
+        variant: [pool.submit(congestion.tcp_sweep_point, parameter, value, dict(settings, variant=variant)) for value in values]
+        for variant in congestion.VARIANTS
+    }
+    return {variant: [future.result() for future in points] for variant, points in futures.items()}
+
+
+def _round_list(text, rounds):
+    """Reads "8, 14" as 0-based round indexes; rounds are numbered from 1 on screen."""
+    found = []
+    for part in text.replace(",", " ").split():
+        if not part.isdigit() or not 1 <= int(part) <= rounds:
+            raise ValueError(f"'{part}' is not a round between 1 and {rounds}.")
+        found.append(int(part) - 1)
+    return found
+
+
+def render_congestion_lab(key):
+    mode = st.radio("Simulate", ["TCP congestion window", "Leaky & token bucket", "Sweep"], horizontal=True, key=f"{key}_congestion_mode")
+    try:
+        if mode == "TCP congestion window":
+            _render_tcp_window(key)
+        elif mode == "Leaky & token bucket":
+            _render_shaping(key)
+        else:
+            _render_tcp_sweep(key)
+    except ValueError as e:
+        st.error(str(e))
+
+
+def _render_tcp_window(key):
+    st.caption(
+        "One round per RTT: slow start doubles cwnd up to ssthresh, then congestion avoidance adds 1 (AIMD). "
+        "On a loss ssthresh becomes cwnd / 2; a timeout restarts at cwnd = 1, while Reno's fast retransmit "
+        "on 3 duplicate ACKs carries on from cwnd = ssthresh."
+    )
+    col1, col2, col3 = st.columns(3)
+    variant = col1.radio("Variant", congestion.VARIANTS, index=1, horizontal=True, key=f"{key}_tcp_variant")
+    rounds = col2.number_input("Rounds (RTTs)", min_value=2, max_value=2000, value=26, key=f"{key}_tcp_rounds")
+    ssthresh = col3.number_input("Initial ssthresh (segments)", min_value=2, max_value=1024, value=16, key=f"{key}_tcp_ssthresh")
+    col1, col2 = st.columns(2)
+    timeouts = _round_list(col1.text_input("Timeouts in rounds", "9", key=f"{key}_tcp_timeouts"), rounds)
+    dup_acks = _round_list(col2.text_input("3 duplicate ACKs in rounds", "17", key=f"{key}_tcp_dup_acks"), rounds)
+    with st.expander("Bottleneck link and random loss"):
+        col1, col2, col3 = st.columns(3)
+        capacity = col1.number_input("Link capacity (segments per RTT, 0 for none)", min_value=0, max_value=10_000, value=0, key=f"{key}_tcp_capacity")
+        buffer = col2.number_input("Router buffer (segments)", min_value=0, max_value=10_000, value=10, key=f"{key}_tcp_buffer")
+        flows = col3.number_input("Flows sharing the link", min_value=1, max_value=16, value=1, key=f"{key}_tcp_flows")
+        col1, col2 = st.columns(2)
+        loss = col1.slider("Random loss rate per segment", 0.0, 0.1, 0.0, 0.001, format="%.3f", key=f"{key}_tcp_loss")
+        seed = col2.number_input("Random seed", min_value=0, value=1, key=f"{key}_tcp_seed")
+    events = tuple(sorted([(t, congestion.TIMEOUT) for t in timeouts] + [(t, congestion.DUP_ACKS) for t in dup_acks]))
+
+    result = _tcp_run(rounds, flows, capacity or None, buffer, variant, loss, ssthresh, events, seed)
+    cwnd, threshold = result["cwnd"][:, 0], result["ssthresh"][:, 0]
+    x = list(range(1, rounds + 1))
+    if flows == 1:
+        st.line_chart({"Round": x, "cwnd": cwnd[:, 0], "ssthresh": threshold[:, 0]}, x="Round", y_label="Segments")
+    else:
+        st.line_chart({"Round": x, **{f"Flow {i + 1}": cwnd[:, i] for i in range(flows)}}, x="Round", y_label="cwnd (segments)")
+    if capacity:
+        st.area_chart({"Round": x, "Queue": result["queue"][:, 0]}, x="Round", y_label="Segments queued at the router", height=200)
+        st.caption(f"Average link use {result['delivered'].mean() / capacity:.1%}, average queue {result['queue'].mean():.1f} segments.")
+
+    with st.expander("Round by round (flow 1)"):
+        rows = []
+        for t in range(rounds):
+            event = congestion.TIMEOUT if result["timeouts"][t, 0, 0] else congestion.DUP_ACKS if result["dup_acks"][t, 0, 0] else ""
+            rows.append({
+                "Round": t + 1, "cwnd": f"{cwnd[t, 0]:g}", "ssthresh": f"{threshold[t, 0]:g}",
+                "Phase": "Slow start" if cwnd[t, 0] < threshold[t, 0] else "Congestion avoidance", "Loss": event,
+            })
+        st.dataframe(rows, hide_index=True)
+
+
+def _render_shaping(key):
+    st.markdown("**Token bucket burst length**")
+    col1, col2, col3 = st.columns(3)
+    capacity = col1.number_input("Bucket capacity C (Mb)", min_value=0.0, value=8.0, key=f"{key}_burst_capacity")
+    rate = col2.number_input("Token rate ρ (Mbps)", min_value=0.0, value=1.0, key=f"{key}_burst_rate")
+    peak = col3.number_input("Maximum output rate M (Mbps)", min_value=0.0, value=6.0, key=f"{key}_burst_peak")
+    if peak > rate:
+        st.latex(rf"S = \frac{{C}}{{M - \rho}} = \frac{{{capacity:g}}}{{{peak:g} - {rate:g}}} = {congestion.burst_time(capacity, rate, peak):.4g}\ \text{{s}}")
+    else:
+        st.caption("With M no faster than ρ the host can send at full rate indefinitely.")
+
+    st.markdown("**Shaping a bursty source**")
+    kind = st.radio("Bucket", ["Leaky bucket", "Token bucket"], horizontal=True, key=f"{key}_shape_kind")
+    token = kind == "Token bucket"
+    col1, col2, col3 = st.columns(3)
+    peak_in = col1.number_input("Input rate while bursting (per step)", min_value=0.1, value=5.0, key=f"{key}_shape_peak_in")
+    on_fraction = col2.slider("Share of time bursting", 0.05, 0.95, 0.3, 0.05, key=f"{key}_shape_on")
+    mean_burst = col3.number_input("Average burst (steps)", min_value=1, max_value=1000, value=10, key=f"{key}_shape_burst")
+    col1, col2, col3 = st.columns(3)
+    rate = col1.number_input("Token rate (per step)" if token else "Output rate (per step)", min_value=0.1, value=2.0, key=f"{key}_shape_rate")
+    buckets = col2.text_input(
+        "Token capacities" if token else "Bucket sizes", "5, 20, 50", key=f"{key}_shape_buckets",
+        help="Several sizes are simulated side by side.",
+    )
+    peak_out = col3.number_input("Maximum output rate (per step)", min_value=0.1, value=4.0, key=f"{key}_shape_peak_out", disabled=not token)
+    col1, col2 = st.columns(2)
+    steps = col1.number_input("Steps", min_value=10, max_value=MAX_SHAPING_STEPS, value=MAX_CHART_STEPS, key=f"{key}_shape_steps")
+    seed = col2.number_input("Random seed", min_value=0, value=1, key=f"{key}_shape_seed")
+    try:
+        sizes = tuple(float(size) for size in buckets.replace(",", " ").split())
+    except ValueError:
+        raise ValueError("Write the bucket sizes as numbers, e.g. 5, 20, 50.")
+    if not sizes or min(sizes) < 0:
+        raise ValueError("Give at least one bucket size of 0 or more.")
+
+    (arrivals, shaped), elapsed = _timed(
+        _shaping_run, steps, peak_in, on_fraction, mean_burst, seed, "token" if token else "leaky", rate, sizes, peak_out if token else np.inf,
+    )
+    shown = min(steps, MAX_CHART_STEPS)
+    x = list(range(shown))
+    names = [f"{'Tokens' if token else 'Bucket'} {size:g}" for size in sizes]
+    st.line_chart(
+        {"Step": x, "Input": arrivals[:shown], **{name: shaped["output"][:shown, i] for i, name in enumerate(names)}},
+        x="Step", y_label="Sent per step",
+    )
+    st.line_chart({"Step": x, **{name: shaped["queue"][:shown, i] for i, name in enumerate(names)}}, x="Step", y_label="Queue occupancy")
+    if token:
+        st.line_chart({"Step": x, **{name: shaped["tokens"][:shown, i] for i, name in enumerate(names)}}, x="Step", y_label="Tokens in the bucket", height=200)
+    total = arrivals.sum()
+    st.dataframe([
+        {
+            "Bucket": name,
+            "Sent": f"{shaped['output'][:, i].sum():,.0f} of {total:,.0f}",
+            "Dropped": f"{shaped['dropped'][:, i].sum() / total:.1%}" if total else "-",
+            "Largest output burst": f"{shaped['output'][:, i].max():g}",
+            "Largest queue": f"{shaped['queue'][:, i].max():g}",
+        }
+        for i, name in enumerate(names)
+    ], hide_index=True)
+    caption = f"{steps:,} steps in {elapsed * 1000:.0f} ms"
+    st.caption(caption + (f", first {shown} charted." if shown < steps else "."))
+
+
+def _render_tcp_sweep(key):
+    st.caption("Averages over many independent runs of Tahoe and Reno sharing a drop-tail bottleneck, one point per worker process.")
+    col1, col2 = st.columns(2)
+    varied = col1.selectbox("Vary", list(TCP_SWEEPS), key=f"{key}_tcp_sweep")
+    runs = col2.number_input("Runs per point", min_value=10, max_value=10_000, value=200, step=100, key=f"{key}_tcp_sweep_runs")
+    col1, col2, col3, col4 = st.columns(4)
+    capacity = col1.number_input("Link capacity (segments per RTT)", min_value=1, max_value=10_000, value=40, key=f"{key}_tcp_sweep_capacity")
+    buffer = col2.number_input("Router buffer", min_value=0, max_value=10_000, value=20, key=f"{key}_tcp_sweep_buffer")
+    flows = col3.number_input("Flows", min_value=1, max_value=64, value=4, key=f"{key}_tcp_sweep_flows")
+    rounds = col4.number_input("Rounds per run", min_value=10, max_value=2000, value=300, key=f"{key}_tcp_sweep_rounds")
+    sweep_key = f"{key}_tcp_sweep_result"
+    if st.button("Run Tahoe and Reno", key=f"{key}_tcp_sweep_run"):
+        parameter, values = TCP_SWEEPS[varied]
+        most_flows = max(values) if parameter == "flows" else flows
+        if runs * most_flows * rounds > MAX_SWEEP_CELLS:
+            runs = max(1, MAX_SWEEP_CELLS // (most_flows * rounds))
+            st.caption(f"Capped at {runs:,} runs per point ({MAX_SWEEP_CELLS:,} flow-rounds).")
+        settings = (("buffer", buffer), ("capacity", capacity), ("flows", flows), ("loss", 0.0), ("rounds", rounds), ("runs", runs), ("seed", 1))
+        with st.spinner("Simulating..."):
+            curves, elapsed = _timed(_tcp_sweep, parameter, tuple(values), settings)
+        st.session_state[sweep_key] = (varied, values, curves, elapsed)
+    if sweep_key in st.session_state:
+        varied, values, curves, elapsed = st.session_state[sweep_key]
+        col1, col2 = st.columns(2)
+        for col, metric, label in ((col1, "utilization", "Link use"), (col2, "queue", "Average queue (segments)")):
+            with col:
+                st.line_chart({"x": values, **{variant: [point[metric] for point in curves[variant]] for variant in curves}}, x="x", x_label=varied, y_label=label)
+        st.caption(f"{len(values) * len(curves)} points in {elapsed:.2f} s (worker processes: {SWEEP_WORKERS}); repeated settings come from the cache.")
+
+
+# Lab id (as used in a topic's "labs" list) -> (tab label, view).
+LABS = {
+    "crc": ("CRC, checksum & Hamming", render_crc_lab),
+    "subnet": ("Subnet calculator", render_subnet_lab),
+    "routing": ("Routing simulator", render_routing_lab),
+    "arq": ("Sliding window simulator", render_arq_lab),
+    "congestion": ("Congestion control simulator", render_congestion_lab),
+}
@@ -0,0 +1,132 @@
+import io
+import os
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # Without Pillow, uploads are stored as they are
+    Image = None
+
+# --- UPLOAD INGEST ---
+# Photos of handwritten notes usually come straight from a phone camera:
+# several megabytes, rotated by an EXIF tag and carrying location metadata.
+# Before an upload reaches the media store, images are
+# * turned upright (the EXIF orientation is applied to the pixels),
+# * stripped of EXIF and other metadata,
+# * downscaled so the longest side is at most max_dimension pixels,
+# * re-encoded as WebP or JPEG at the chosen quality tier.
+# PDFs and files Pillow can't read are stored unchanged. The untouched
+# original can be kept as well, as a second entry next to the processed one.
+
+FORMATS = {
+    "WebP": ("WEBP", ".webp", "image/webp"),
+    "JPEG": ("JPEG", ".jpg", "image/jpeg"),
+}
+
+QUALITY_TIERS = {
+    "High": 90,
+    "Balanced": 80,
+    "Small": 65,
+}
+
+MAX_DIMENSIONS = (1280, 1600, 2048, 3072)
+
+DEFAULT_SETTINGS = {
+    "max_dimension": 2048,
+    "format": "WebP",
+    "quality": "Balanced",
+    "keep_original": False,
+}
+
+
+def ingest_upload(store, file, settings=DEFAULT_SETTINGS):
+    """
+    Stores an uploaded file in the media store, normalizing it first if it's
+    an image. Returns the list of media references to attach (the processed
+    file, then the original if settings["keep_original"] is set).
+    """
+    name = getattr(file, "name", "file")
+    file.seek(0)
+    processed = normalize_image(file, settings)
+    if processed is None:
+        return [store.put_file(file, name)]
+    data, new_name, mime = processed
+    refs = [store.put(data, new_name, mime)]
+    if settings["keep_original"]:
+        stem, ext = os.path.splitext(name)
+        refs.append(store.put_file(file, f"{stem} (original){ext}"))
+    return refs
+
+
+def normalize_image(file, settings):
+    """
+    Re-encodes an image file according to the ingest settings. Returns
+    (bytes, file name, mime type), or None if the file isn't an image.
+    """
+    if Image is None:
+        return None
+    pil_format, ext, mime = FORMATS[settings["format"]]
+    max_dimension = settings["max_dimension"]
+    try:
+        with Image.open(file) as image:
+            image.draft("RGB", (max_dimension, max_dimension))  # Lets JPEGs decode at a reduced scale
+            image = ImageOps.exif_transpose(image)
+            image.thumbnail((max_dimension, max_dimension), Image.LANCZOS)
+            image = _convert_for(image, pil_format)
+            out = io.BytesIO()
+            # Nothing is passed for exif or icc_profile, so no metadata is written.
+            image.save(out, pil_format, quality=QUALITY_TIERS[settings["quality"]], optimize=pil_format == "JPEG")
+    except (OSError, ValueError, Image.DecompressionBombError):
+        return None
+    finally:
+        file.seek(0)
+    stem, _ = os.path.splitext(getattr(file, "name", "file"))
+    return out.getvalue(), stem + ext, mime
+
+
+def _convert_for(image, pil_format):
+    has_alpha = "A" in image.getbands() or "transparency" in image.info
+    if pil_format == "WEBP":
+        return image.convert("RGBA" if has_alpha else "RGB") if image.mode not in ("RGB", "RGBA") else image
+    if not has_alpha:
+        return image.convert("RGB") if image.mode != "RGB" else image
+    # JPEG has no alpha channel, so transparent areas become white
+    image = image.convert("RGBA")
+    background = Image.new("RGB", image.size, (255, 255, 255))
+    background.paste(image, mask=image.getchannel("A"))
+    return background
+
+
+# --- BACKGROUND INGEST ---
+# Processing a batch of phone photos takes seconds, so uploads are handed to
+# a small shared thread pool instead of being processed inside the script
+# run. The UI lists each IngestJob as a placeholder with its progress, and
+# every script run attaches the references of the jobs that have finished.
+
+class IngestJob:
+    """One upload being processed on a worker thread."""
+
+    def __init__(self, name):
+        self.name = name
+        self.status = "Queued"
+        self.progress = 0.0
+        self.future = None
+
+    def run(self, store, file, settings):
+        self.status, self.progress = "Compressing", 0.2
+        refs = ingest_upload(store, file, settings)
+        self.status, self.progress = "Making previews", 0.7
+        for ref in refs:
+            if ref["mime"].startswith("image/"):
+                store.thumbnail(ref["hash"])  # Made once here so later reruns only read it
+        self.status, self.progress = "Done", 1.0
+        return refs
+
+    def done(self):
+        return self.future.done()
+
+
+def submit_ingest(pool, store, file, settings=DEFAULT_SETTINGS):
+    """Queues an uploaded file for ingest on the pool and returns its job."""
+    job = IngestJob(getattr(file, "name", "file"))
+    job.future = pool.submit(job.run, store, file, dict(settings))
+    return job
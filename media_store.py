@@ -0,0 +1,204 @@
+import hashlib
+import io
+import mimetypes
+import os
+import tempfile
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # Pillow ships with Streamlit, but thumbnails are optional
+    Image = None
+
+try:
+    import fitz  # PyMuPDF, only needed for PDF first-page previews
+except ImportError:
+    fitz = None
+
+# --- CONTENT-ADDRESSED MEDIA STORE ---
+# Uploaded photos and PDFs live here as raw bytes, one file per SHA-256 hash.
+# The study data only keeps a small reference to each file:
+#     {"name": "notes.jpg", "hash": "<sha256>", "size": 12345, "mime": "image/jpeg"}
+# Uploading the same diagram to several topics stores it once.
+# Images also get a small WebP thumbnail, made once per hash and size under
+# thumbs/, which is what the app shows until the user opens the full image.
+# PDFs get a first-page preview the same way when PyMuPDF is installed.
+
+DEFAULT_MEDIA_DIR = os.environ.get(
+    "STUDY_MEDIA_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".media"),
+)
+
+CHUNK_SIZE = 1024 * 1024
+THUMB_SIZE = 320
+
+
+def guess_mime(file_name):
+    """Guesses a MIME type from a file name, falling back to raw bytes."""
+    mime, _ = mimetypes.guess_type(file_name)
+    return mime or "application/octet-stream"
+
+
+def is_media_ref(entry):
+    """True if a saved media entry is a store reference (not a legacy b64 blob)."""
+    return isinstance(entry, dict) and "hash" in entry
+
+
+class MediaStore:
+    """Stores media blobs on local disk, keyed by their SHA-256 hash."""
+
+    def __init__(self, root=DEFAULT_MEDIA_DIR):
+        self.root = root
+        self.objects_dir = os.path.join(root, "objects")
+        self.thumbs_dir = os.path.join(root, "thumbs")
+        os.makedirs(self.objects_dir, exist_ok=True)
+
+    def path(self, file_hash):
+        """Returns the on-disk path of a blob (objects/ab/abcdef...)."""
+        return os.path.join(self.objects_dir, file_hash[:2], file_hash)
+
+    def exists(self, file_hash):
+        return os.path.exists(self.path(file_hash))
+
+    def put(self, data, name, mime=None):
+        """Stores raw bytes and returns a media reference for them."""
+        file_hash = hashlib.sha256(data).hexdigest()
+        if not self.exists(file_hash):
+            self._write_atomic(self.path(file_hash), [data])
+        return self._make_ref(name, file_hash, len(data), mime)
+
+    def put_stream(self, chunks, name, mime=None):
+        """
+        Stores bytes from an iterable of chunks without holding the whole
+        file in memory, hashing as it goes.
+        """
+        os.makedirs(self.objects_dir, exist_ok=True)
+        digest = hashlib.sha256()
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=self.objects_dir, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as out:
+                for chunk in chunks:
+                    digest.update(chunk)
+                    size += len(chunk)
+                    out.write(chunk)
+            file_hash = digest.hexdigest()
+            if self.exists(file_hash):
+                os.remove(tmp_path)
+            else:
+                os.makedirs(os.path.dirname(self.path(file_hash)), exist_ok=True)
+                os.replace(tmp_path, self.path(file_hash))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return self._make_ref(name, file_hash, size, mime)
+
+    def put_file(self, file, name=None, mime=None):
+        """Stores a Streamlit UploadedFile (or any binary file object)."""
+        name = name or getattr(file, "name", "file")
+        mime = mime or getattr(file, "type", None)
+        file.seek(0)
+        return self.put_stream(iter(lambda: file.read(CHUNK_SIZE), b""), name, mime)
+
+    def get(self, file_hash):
+        """Returns the raw bytes of a stored blob."""
+        with open(self.path(file_hash), "rb") as f:
+            return f.read()
+
+    def open(self, file_hash):
+        """Opens a stored blob for streaming reads."""
+        return open(self.path(file_hash), "rb")
+
+    def thumb_path(self, file_hash, size=THUMB_SIZE):
+        """Returns the on-disk path of a thumbnail (thumbs/ab/abcdef..._320.webp)."""
+        return os.path.join(self.thumbs_dir, file_hash[:2], f"{file_hash}_{size}.webp")
+
+    def thumbnail(self, file_hash, size=THUMB_SIZE):
+        """
+        Returns the path of an image's thumbnail (or a PDF's first page),
+        making it on first use. Returns None if the blob can't be rendered.
+        """
+        target = self.thumb_path(file_hash, size)
+        if os.path.exists(target):
+            return target
+        if Image is None or not self.exists(file_hash):
+            return None
+        try:
+            with self._open_image(file_hash, size) as image:
+                image = ImageOps.exif_transpose(image)
+                image.thumbnail((size, size))
+                if image.mode not in ("RGB", "RGBA"):
+                    image = image.convert("RGBA" if "A" in image.getbands() or "transparency" in image.info else "RGB")
+                buffer = io.BytesIO()
+                image.save(buffer, "WEBP", quality=80)
+        except (OSError, ValueError, RuntimeError, Image.DecompressionBombError):
+            return None  # PyMuPDF reports broken PDFs as RuntimeError
+        self._write_atomic(target, [buffer.getvalue()])
+        return target
+
+    def _open_image(self, file_hash, size):
+        with open(self.path(file_hash), "rb") as f:
+            is_pdf = f.read(5) == b"%PDF-"
+        if not is_pdf:
+            image = Image.open(self.path(file_hash))
+            image.draft("RGB", (size, size))  # Lets JPEGs decode at a reduced scale
+            return image
+        if fitz is None:
+            raise OSError("PDF previews need PyMuPDF")
+        with fitz.open(self.path(file_hash)) as doc:
+            page = doc[0]
+            zoom = size / max(page.rect.width, page.rect.height)
+            pixmap = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom))
+            return Image.frombytes("RGB", (pixmap.width, pixmap.height), pixmap.samples)
+
+    def publish(self, file_hash, directory, suffix=""):
+        """
+        Makes a blob available as <directory>/<hash><suffix> (a hard link
+        where possible, else a copy) and returns that file name. Published
+        names never change content, so browsers can cache them.
+        """
+        name = file_hash + suffix
+        target = os.path.join(directory, name)
+        if not os.path.exists(target):
+            os.makedirs(directory, exist_ok=True)
+            try:
+                os.link(self.path(file_hash), target)
+            except FileExistsError:
+                pass
+            except OSError:  # e.g. the media store is on another filesystem
+                with self.open(file_hash) as f:
+                    self._write_atomic(target, iter(lambda: f.read(CHUNK_SIZE), b""))
+        return name
+
+    def _write_atomic(self, target, chunks):
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(target), suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as out:
+                for chunk in chunks:
+                    out.write(chunk)
+            os.replace(tmp_path, target)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @staticmethod
+    def _make_ref(name, file_hash, size, mime):
+        return {
+            "name": name,
+            "hash": file_hash,
+            "size": size,
+            "mime": mime or guess_mime(name),
+        }
+
+
+def iter_media_lists(study_data):
+    """Yields every media list in the study data (topic media and PYQ files)."""
+    for topics in study_data.get("modules", {}).values():
+        for topic_data in topics.values():
+            yield topic_data.get("my_photos_bytes", [])
+    for questions in study_data.get("pyqs", {}).values():
+        for q_data in questions:
+            yield q_data.get("my_files", [])
+
@@ -0,0 +1,429 @@
+import base64
+import binascii
+import json
+import os
+import re
+import tempfile
+import threading
+import zipfile
+
+from json_stream import JsonStreamReader, iter_b64_decode
+from media_store import guess_mime, is_media_ref, iter_media_lists
+from srs import valid_card
+
+# --- PROGRESS FILE EXPORT ---
+# Progress can be saved in two formats:
+# * JSON: one document with every media reference carrying its bytes inline
+#   as base64, so it can be loaded on another machine.
+# * ZIP: a small progress.json manifest with only the user's own fields
+#   (done flags, notes, links, survey, PYQ answers) plus each media file
+#   stored once, raw, under media/<sha256>.
+# Both are produced piece by piece: media bytes are streamed from the media
+# store in chunks and never held as one big string.
+
+class ProgressFormatError(ValueError):
+    """Raised when an uploaded progress file can't be read."""
+
+
+# Fields the user edits; everything else in a topic or PYQ is syllabus content.
+# "updated" maps each edited field to the time (epoch seconds) of its last
+# change and is used to resolve conflicts when merging two progress files.
+USER_TOPIC_FIELDS = ("done", "my_notes", "my_links", "my_photos_bytes", "survey", "srs", "updated")
+USER_PYQ_FIELDS = ("my_text", "my_files", "srs", "updated")
+
+MANIFEST_NAME = "progress.json"
+MEDIA_PREFIX = "media/"
+
+# Already-compressed media gains nothing from deflate.
+STORED_MIME_TYPES = ("image/jpeg", "image/png", "image/webp", "image/gif")
+
+# Must be a multiple of 3 so base64 chunks concatenate into one valid string.
+B64_READ_SIZE = 3 * 256 * 1024
+
+
+def iter_progress_json(study_data, store):
+    """Yields the progress file as a sequence of JSON text chunks."""
+    yield from _iter_json(study_data, store)
+
+
+def _iter_json(value, store):
+    if is_media_ref(value):
+        yield from _iter_media_ref(value, store)
+    elif isinstance(value, dict):
+        yield "{"
+        for i, (key, item) in enumerate(value.items()):
+            yield (", " if i else "") + json.dumps(key) + ": "
+            yield from _iter_json(item, store)
+        yield "}"
+    elif isinstance(value, list):
+        yield "["
+        for i, item in enumerate(value):
+            if i:
+                yield ", "
+            yield from _iter_json(item, store)
+        yield "]"
+    else:
+        yield json.dumps(value)
+
+
+def _iter_media_ref(ref, store):
+    """Writes a media reference with its bytes inlined as a "b64" field."""
+    fields = {key: item for key, item in ref.items() if key != "b64"}
+    yield json.dumps(fields)[:-1]
+    if not store.exists(ref["hash"]):
+        yield "}"
+        return
+    yield ', "b64": "'
+    with store.open(ref["hash"]) as f:
+        for chunk in iter(lambda: f.read(B64_READ_SIZE), b""):
+            yield base64.b64encode(chunk).decode("ascii")
+    yield '"}'
+
+
+def write_progress_json(study_data, store, out):
+    """Writes the progress file to a binary file object, chunk by chunk."""
+    for chunk in iter_progress_json(study_data, store):
+        out.write(chunk.encode("utf-8"))
+
+
+def export_progress_json(study_data, store):
+    """
+    Builds the progress file into a temporary file on disk and returns its
+    path. The caller owns the file and should remove it when done.
+    """
+    fd, path = tempfile.mkstemp(prefix="progress_", suffix=".json")
+    with os.fdopen(fd, "wb") as out:
+        write_progress_json(study_data, store, out)
+    return path
+
+
+
+def user_fields_only(study_data):
+    """Returns a copy of the study data without any syllabus content."""
+    return {
+        "modules": {
+            mod: {
+                topic_name: {field: topic_data[field] for field in USER_TOPIC_FIELDS if field in topic_data}
+                for topic_name, topic_data in topics.items()
+            }
+            for mod, topics in study_data["modules"].items()
+        },
+        "pyqs": {
+            mod: [{field: q_data[field] for field in USER_PYQ_FIELDS if field in q_data} for q_data in questions]
+            for mod, questions in study_data["pyqs"].items()
+        },
+    }
+
+
+def write_progress_zip(study_data, store, out):
+    """Writes the compact progress archive (manifest + raw media) to a binary file object."""
+    manifest = user_fields_only(study_data)
+    with zipfile.ZipFile(out, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr(MANIFEST_NAME, json.dumps(manifest, separators=(",", ":")))
+        written = set()
+        for media_list in iter_media_lists(manifest):
+            for ref in media_list:
+                if not is_media_ref(ref) or ref["hash"] in written or not store.exists(ref["hash"]):
+                    continue
+                compress = zipfile.ZIP_STORED if ref.get("mime") in STORED_MIME_TYPES else zipfile.ZIP_DEFLATED
+                zf.write(store.path(ref["hash"]), MEDIA_PREFIX + ref["hash"], compress_type=compress)
+                written.add(ref["hash"])
+
+
+def export_progress_zip(study_data, store):
+    """Builds the compact progress archive into a temporary file and returns its path."""
+    fd, path = tempfile.mkstemp(prefix="progress_", suffix=".zip")
+    with os.fdopen(fd, "wb") as out:
+        write_progress_zip(study_data, store, out)
+    return path
+
+
+# --- PROGRESS FILE IMPORT ---
+# Uploads are read incrementally: JSON files go through a streaming parser
+# that writes each base64 media payload straight into the media store, and
+# zip archives have their media copied member by member. Every topic and
+# PYQ entry is then checked against the schema of the app's own initial
+# data; bad entries are skipped with a warning instead of being loaded.
+
+_SHA256_HEX = re.compile(r"^[0-9a-f]{64}$")
+
+
+def load_progress(file, store, template):
+    """
+    Reads an uploaded progress file in either format. Returns new study
+    data (the template, i.e. fresh syllabus content, with the user's valid
+    saved fields applied) and a list of warnings about skipped entries.
+    """
+    file.seek(0)
+    is_zip = zipfile.is_zipfile(file)
+    file.seek(0)
+    loaded = _load_zip(file, store) if is_zip else _load_json(file, store)
+    return validate_progress(loaded, store, template)
+
+
+def _load_json(file, store):
+    def stream_string(path):
+        if _is_media_b64_path(path):
+            return store_b64
+        return None
+
+    def store_b64(pieces):
+        # A damaged payload only loses its own entry; validation reports it
+        try:
+            return store.put_stream(iter_b64_decode(pieces), "upload")
+        except binascii.Error as e:
+            return {"error": str(e)}
+
+    try:
+        return JsonStreamReader(file, stream_string).parse()
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ProgressFormatError(f"Not a valid progress file: {e}") from e
+
+
+def _is_media_b64_path(path):
+    """True for modules/<mod>/<topic>/my_photos_bytes/<i>/b64 and pyqs/<mod>/<i>/my_files/<j>/b64."""
+    if len(path) != 6 or path[5] != "b64" or not isinstance(path[4], int):
+        return False
+    if path[0] == "modules":
+        return path[3] == "my_photos_bytes"
+    return path[0] == "pyqs" and isinstance(path[2], int) and path[3] == "my_files"
+
+
+def _load_zip(file, store):
+    try:
+        with zipfile.ZipFile(file) as zf:
+            if MANIFEST_NAME not in zf.namelist():
+                raise ProgressFormatError(f"Archive has no {MANIFEST_NAME}.")
+            for member in zf.namelist():
+                if member.startswith(MEDIA_PREFIX):
+                    _restore_zip_media(zf, member, store)
+            return json.loads(zf.read(MANIFEST_NAME))
+    except ProgressFormatError:
+        raise
+    except (zipfile.BadZipFile, ValueError, KeyError) as e:
+        raise ProgressFormatError(f"Not a valid progress archive: {e}") from e
+
+
+def _restore_zip_media(zf, member, store):
+    # Blobs are stored under their real hash, so a damaged member won't match
+    # the reference in the manifest and is reported when that is validated.
+    if not store.exists(member[len(MEDIA_PREFIX):]):
+        with zf.open(member) as f:
+            store.put_stream(iter(lambda: f.read(B64_READ_SIZE), b""), member)
+
+
+def validate_progress(loaded, store, template):
+    """
+    Checks loaded study data against the template's schema and copies each
+    valid user field onto the template, in place. Topics are matched by
+    module and topic name, PYQs by position. Returns (template, warnings).
+    """
+    if not isinstance(loaded, dict) or not isinstance(loaded.get("modules"), dict) or not isinstance(loaded.get("pyqs"), dict):
+        raise ProgressFormatError("This does not appear to be a valid progress file.")
+    warnings = []
+
+    for mod, topics in loaded["modules"].items():
+        if mod not in template["modules"] or not isinstance(topics, dict):
+            warnings.append(f"Skipped unknown module '{mod}'.")
+            continue
+        for topic_name, saved in topics.items():
+            if topic_name not in template["modules"][mod] or not isinstance(saved, dict):
+                warnings.append(f"Skipped unknown topic '{mod} / {topic_name}'.")
+                continue
+            _apply_fields(template["modules"][mod][topic_name], saved, USER_TOPIC_FIELDS, store, warnings, f"{mod} / {topic_name}")
+
+    for mod, questions in loaded["pyqs"].items():
+        if mod not in template["pyqs"] or not isinstance(questions, list):
+            warnings.append(f"Skipped PYQs for unknown module '{mod}'.")
+            continue
+        for i, saved in enumerate(questions[:len(template["pyqs"][mod])]):
+            if not isinstance(saved, dict):
+                warnings.append(f"Skipped malformed answer for {mod} Q{i + 1}.")
+                continue
+            _apply_fields(template["pyqs"][mod][i], saved, USER_PYQ_FIELDS, store, warnings, f"{mod} Q{i + 1}")
+
+    return template, warnings
+
+
+def _apply_fields(target, saved, fields, store, warnings, where):
+    for field in fields:
+        if field not in saved:
+            continue
+        value = saved[field]
+        if field in ("my_photos_bytes", "my_files"):
+            value = _valid_media_list(value, store, warnings, where)
+        elif not _FIELD_CHECKS[field](value):
+            warnings.append(f"{where}: ignored invalid '{field}'.")
+            continue
+        target[field] = value
+
+
+_FIELD_CHECKS = {
+    "done": lambda v: isinstance(v, bool),
+    "my_notes": lambda v: isinstance(v, str),
+    "my_text": lambda v: isinstance(v, str),
+    "survey": lambda v: v is None or isinstance(v, str),
+    "my_links": lambda v: isinstance(v, list) and all(isinstance(link, str) for link in v),
+    "srs": valid_card,
+    "updated": lambda v: isinstance(v, dict) and all(
+        isinstance(ts, (int, float)) and not isinstance(ts, bool) for ts in v.values()
+    ),
+}
+
+
+def _valid_media_list(entries, store, warnings, where):
+    if not isinstance(entries, list):
+        warnings.append(f"{where}: ignored invalid media list.")
+        return []
+    valid = []
+    for entry in entries:
+        ref = _valid_media_ref(entry, store)
+        if ref is None:
+            name = entry.get("name") if isinstance(entry, dict) else None
+            stored = entry.get("b64") if isinstance(entry, dict) else None
+            if isinstance(stored, dict) and "error" in stored:
+                warnings.append(f"{where}: skipped damaged file {name or '(unnamed)'} (its data isn't valid base64: {stored['error']}).")
+            else:
+                warnings.append(f"{where}: skipped missing or damaged file {name or '(unnamed)'}.")
+        else:
+            valid.append(ref)
+    return valid
+
+
+def _valid_media_ref(entry, store):
+    """Normalizes one saved media entry to a store reference, or None if unusable."""
+    if not isinstance(entry, dict) or not isinstance(entry.get("name"), str):
+        return None
+    stored = entry.get("b64")
+    if isinstance(stored, dict):
+        # Inline payload already streamed into the store by the JSON reader
+        if "error" in stored or entry.get("hash", stored["hash"]) != stored["hash"]:
+            return None
+        file_hash, size = stored["hash"], stored["size"]
+    else:
+        file_hash, size = entry.get("hash"), entry.get("size")
+    if not isinstance(file_hash, str) or not _SHA256_HEX.match(file_hash) or not store.exists(file_hash):
+        return None
+    if not isinstance(size, int):
+        size = os.path.getsize(store.path(file_hash))
+    mime = entry.get("mime") if isinstance(entry.get("mime"), str) else guess_mime(entry["name"])
+    return {"name": entry["name"], "hash": file_hash, "size": size, "mime": mime}
+
+
+# --- MERGING ---
+# Instead of replacing the current progress, a loaded file can be merged into
+# it (e.g. a student who studies on two devices). Per topic and per PYQ:
+# * single values (done, notes, survey, review card, typed answer) take the side that was
+#   edited most recently, according to the "updated" timestamps;
+# * links and media are unioned (media by hash), keeping the current order.
+# Entries whose user fields are identical on both sides are skipped.
+
+_LIST_FIELDS = ("my_links", "my_photos_bytes", "my_files")
+
+
+def merge_progress(current, loaded):
+    """
+    Merges loaded study data into the current study data, in place. Both
+    must have the same syllabus layout (as returned by load_progress).
+    Returns the changed entries as ("topic", module, topic_name) and
+    ("pyq", module, index) tuples.
+    """
+    changed = []
+    for mod, topics in current["modules"].items():
+        for topic_name, topic_data in topics.items():
+            saved = loaded["modules"][mod][topic_name]
+            if _merge_entry(topic_data, saved, USER_TOPIC_FIELDS):
+                changed.append(("topic", mod, topic_name))
+    for mod, questions in current["pyqs"].items():
+        for i, q_data in enumerate(questions):
+            if _merge_entry(q_data, loaded["pyqs"][mod][i], USER_PYQ_FIELDS):
+                changed.append(("pyq", mod, i))
+    return changed
+
+
+def _merge_entry(current, saved, fields):
+    """Merges one topic or PYQ entry; returns True if anything changed."""
+    if all(current.get(field) == saved.get(field) for field in fields):
+        return False
+    ours, theirs = current.get("updated") or {}, saved.get("updated") or {}
+    merged_times = dict(ours)
+    changed = False
+    for field in fields:
+        if field == "updated" or field not in saved:
+            continue
+        if field in _LIST_FIELDS:
+            value = _union(current.get(field, []), saved[field], key=_media_key if field != "my_links" else None)
+        elif _newer(theirs.get(field, 0), ours.get(field, 0), current.get(field)):
+            value = saved[field]
+        else:
+            continue
+        if value != current.get(field):
+            current[field] = value
+            changed = True
+        if field in theirs:
+            merged_times[field] = max(ours.get(field, 0), theirs[field])
+    if changed:
+        current["updated"] = merged_times
+    return changed
+
+
+def _newer(their_time, our_time, our_value):
+    """Loaded value wins if edited later, or on a tie if ours was never set."""
+    if their_time != our_time:
+        return their_time > our_time
+    return our_value in (None, "", False)
+
+
+def _union(ours, theirs, key=None):
+    key = key or (lambda item: item)
+    seen = {key(item) for item in ours}
+    result = list(ours)
+    for item in theirs:
+        if key(item) not in seen:
+            result.append(item)
+            seen.add(key(item))
+    return result
+
+
+def _media_key(ref):
+    return ref["hash"]
+
+
+class ExportCache:
+    """
+    Remembers the last exported file for each format together with the
+    study data version it was built from, so unchanged state is never
+    serialized twice.
+    """
+
+    def __init__(self):
+        self._files = {}
+        self._lock = threading.Lock()
+
+    def get(self, fmt, version, build):
+        """Returns the path of an export for this version, building it if needed."""
+        with self._lock:
+            cached = self._files.get(fmt)
+            if cached and cached[0] == version and os.path.exists(cached[1]):
+                return cached[1]
+            if cached:
+                _remove_quietly(cached[1])
+            path = build()
+            self._files[fmt] = (version, path)
+            return path
+
+    def clear(self):
+        with self._lock:
+            for _, path in self._files.values():
+                _remove_quietly(path)
+            self._files.clear()
+
+    def __del__(self):
+        self.clear()
+
+
+def _remove_quietly(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
@@ -0,0 +1,126 @@
+import heapq
+import math
+import re
+
+# --- FULL-TEXT SEARCH ---
+# An in-memory inverted index ranked with BM25. Two kinds of index are kept:
+# * one per process over every course pack's syllabus text (topic name,
+#   definition, PYQ focus, strategy and the PYQ questions), built once;
+# * one per study store over the user's own notes and typed PYQ answers,
+#   updated one document at a time as they are edited.
+# Queries are answered from the postings of the query terms only, so a
+# search costs milliseconds however many documents are indexed.
+
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+_WORD = re.compile(r"\w+")
+
+STOPWORDS = frozenset("""
+a an and are as at be by for from has have in is it its of on or that the this
+to was were what which with how why when where do does can will you your
+""".split())
+
+
+def tokenize(text):
+    """Splits text into lowercase search terms, dropping stopwords."""
+    return [word for word in _WORD.findall(text.lower()) if word not in STOPWORDS]
+
+
+class SearchIndex:
+    """A BM25-ranked inverted index whose documents can be added, replaced and removed."""
+
+    def __init__(self):
+        self.postings = {}   # term -> {doc_id: term frequency}
+        self.lengths = {}    # doc_id -> number of terms
+        self.doc_terms = {}  # doc_id -> its distinct terms, for removal
+        self.total_length = 0
+
+    def set_document(self, doc_id, text):
+        """Indexes (or re-indexes) one document; empty text removes it."""
+        self.remove(doc_id)
+        terms = tokenize(text or "")
+        if not terms:
+            return
+        counts = {}
+        for term in terms:
+            counts[term] = counts.get(term, 0) + 1
+        for term, count in counts.items():
+            self.postings.setdefault(term, {})[doc_id] = count
+        self.lengths[doc_id] = len(terms)
+        self.doc_terms[doc_id] = tuple(counts)
+        self.total_length += len(terms)
+
+    def remove(self, doc_id):
+        length = self.lengths.pop(doc_id, None)
+        if length is None:
+            return
+        self.total_length -= length
+        for term in self.doc_terms.pop(doc_id):
+            docs = self.postings[term]
+            del docs[doc_id]
+            if not docs:
+                del self.postings[term]
+
+    def search(self, query, limit=10, where=None):
+        """
+        Returns up to ``limit`` (score, doc_id) pairs, best first. ``where``
+        optionally filters the document ids considered.
+        """
+        if not self.lengths:
+            return []
+        count = len(self.lengths)
+        average = self.total_length / count
+        scores = {}
+        for term in set(tokenize(query)):
+            docs = self.postings.get(term)
+            if not docs:
+                continue
+            idf = math.log(1 + (count - len(docs) + 0.5) / (len(docs) + 0.5))
+            for doc_id, freq in docs.items():
+                if where is not None and not where(doc_id):
+                    continue
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self.lengths[doc_id] / average)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * freq * (BM25_K1 + 1) / (freq + norm)
+        return heapq.nlargest(limit, ((score, doc_id) for doc_id, score in scores.items()), key=lambda hit: hit[0])
+
+
+def build_content_index(courses):
+    """
+    Indexes the syllabus text of every course pack. Document ids are
+    (course_id, "topic", module, topic) and (course_id, "pyq", module, index).
+    """
+    index = SearchIndex()
+    for course_id, course in courses.items():
+        for module_key, topics in course["modules"].items():
+            for topic_name, topic in topics.items():
+                text = "\n".join([topic_name, topic["definition"], topic["pyq_focus"], topic["strategy"]])
+                index.set_document((course_id, "topic", module_key, topic_name), text)
+        for module_key, questions in course["pyqs"].items():
+            for i, question in enumerate(questions):
+                index.set_document((course_id, "pyq", module_key, i), question["q"])
+    return index
+
+
+def index_study_text(index, study_data):
+    """
+    Indexes a user's notes and typed PYQ answers. Document ids are
+    ("topic", module, topic) and ("pyq", module, index).
+    """
+    for module_key, topics in study_data["modules"].items():
+        for topic_name, topic_data in topics.items():
+            index.set_document(("topic", module_key, topic_name), topic_data.get("my_notes"))
+    for module_key, questions in study_data["pyqs"].items():
+        for i, q_data in enumerate(questions):
+            index.set_document(("pyq", module_key, i), q_data.get("my_text"))
+
+
+def snippet(text, query, width=120):
+    """Returns a short excerpt of text around the first query term it contains."""
+    text = " ".join(text.split())
+    lowered = text.lower()
+    positions = [lowered.find(term) for term in tokenize(query)]
+    start = min((pos for pos in positions if pos >= 0), default=0)
+    start = max(0, start - width // 3)
+    excerpt = text[start:start + width]
+    return ("…" if start else "") + excerpt + ("…" if start + width < len(text) else "")
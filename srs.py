@@ -0,0 +1,147 @@
+import heapq
+
+from aggregates import confidence_level
+
+# --- SPACED REPETITION ---
+# Topics and PYQs are scheduled for review with SM-2. Each item's card is
+# kept in its "srs" field:
+#     {"reps": 2, "interval": 6.0, "ease": 2.5, "due": <epoch seconds>, "last": <epoch seconds>}
+# A review is a confidence answer: the topic self-assessment, or the grade
+# buttons in the Due Today view. Items that were never reviewed are still
+# scheduled: a topic a day after it was marked done, a PYQ a day after it
+# was answered. Every study store keeps a ReviewQueue (a heap ordered by due
+# time) that is updated per item, so finding what's due never scans the
+# whole syllabus.
+
+DAY = 24 * 60 * 60
+
+# SM-2 grades (0-5) for the self-assessment confidence levels.
+CONFIDENCE_GRADES = {
+    "Not Confident": 1,
+    "Somewhat Confident": 3,
+    "Very Confident": 5,
+}
+
+
+def new_card():
+    return {"reps": 0, "interval": 0.0, "ease": 2.5, "due": 0.0, "last": 0.0}
+
+
+def survey_grade(survey):
+    """Returns the SM-2 grade for a saved survey answer, or None if unanswered."""
+    return CONFIDENCE_GRADES.get(confidence_level(survey))
+
+
+def review(card, grade, now):
+    """Returns the card rescheduled after a review with an SM-2 grade (0-5)."""
+    card = dict(card or new_card())
+    if grade < 3:
+        card["reps"] = 0
+        card["interval"] = 1.0
+    else:
+        card["reps"] += 1
+        if card["reps"] == 1:
+            card["interval"] = 1.0
+        elif card["reps"] == 2:
+            card["interval"] = 6.0
+        else:
+            card["interval"] = round(card["interval"] * card["ease"], 1)
+    card["ease"] = round(max(1.3, card["ease"] + 0.1 - (5 - grade) * (0.08 + (5 - grade) * 0.02)), 2)
+    card["last"] = now
+    card["due"] = now + card["interval"] * DAY
+    return card
+
+
+def valid_card(card):
+    return card is None or (
+        isinstance(card, dict)
+        and all(isinstance(card.get(key), (int, float)) and not isinstance(card.get(key), bool) for key in new_card())
+    )
+
+
+def topic_due(topic_data):
+    """When a topic is next due, or None if it isn't scheduled (not done yet)."""
+    if not topic_data.get("done"):
+        return None
+    if topic_data.get("srs"):
+        return topic_data["srs"]["due"]
+    return (topic_data.get("updated") or {}).get("done", 0) + DAY
+
+
+def pyq_due(q_data):
+    """When a PYQ is next due, or None if it hasn't been answered."""
+    if q_data.get("srs"):
+        return q_data["srs"]["due"]
+    if not q_data.get("my_text") and not q_data.get("my_files"):
+        return None
+    updated = q_data.get("updated") or {}
+    return max(updated.get("my_text", 0), updated.get("my_files", 0)) + DAY
+
+
+class ReviewQueue:
+    """
+    The scheduled items of one user's study data, in a heap ordered by due
+    time. Items are ("topic", module, topic) or ("pyq", module, index).
+    Rescheduling pushes a new entry and leaves the old one to be skipped.
+    """
+
+    def __init__(self, study_data):
+        self.rebuild(study_data)
+
+    def rebuild(self, study_data):
+        self._due = {}
+        self._heap = []
+        for module_key, topics in study_data["modules"].items():
+            for topic_name, topic_data in topics.items():
+                self.update_topic(module_key, topic_name, topic_data)
+        for module_key, questions in study_data["pyqs"].items():
+            for i, q_data in enumerate(questions):
+                self.update_pyq(module_key, i, q_data)
+
+    def update_topic(self, module_key, topic_name, topic_data):
+        self._schedule(("topic", module_key, topic_name), topic_due(topic_data))
+
+    def update_pyq(self, module_key, index, q_data):
+        self._schedule(("pyq", module_key, index), pyq_due(q_data))
+
+    def _schedule(self, item, due):
+        if self._due.get(item) == due:
+            return
+        if due is None:
+            self._due.pop(item, None)
+        else:
+            self._due[item] = due
+            heapq.heappush(self._heap, (due, item))
+        if len(self._heap) > 2 * len(self._due) + 64:
+            # Drop the stale entries once they outnumber the live ones
+            self._heap = [(due, item) for item, due in self._due.items()]
+            heapq.heapify(self._heap)
+
+    def __len__(self):
+        return len(self._due)
+
+    def peek(self):
+        """Returns the (due, item) pair due soonest, or None."""
+        heap = self._heap
+        while heap and self._due.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+        return heap[0] if heap else None
+
+    def iter_due(self, until):
+        """
+        Yields (due, item) pairs due at or before ``until``, soonest first,
+        without changing the heap: O(log k) per item yielded.
+        """
+        heap = self._heap
+        frontier = [(heap[0], 0)] if heap else []
+        seen = set()
+        while frontier:
+            (due, item), i = heapq.heappop(frontier)
+            if due > until:
+                return
+            if self._due.get(item) == due and item not in seen:
+                seen.add(item)
+                yield due, item
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (heap[child], child))
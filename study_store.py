@@ -0,0 +1,273 @@
+import itertools
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+from aggregates import ProgressIndex
+from progress_io import USER_PYQ_FIELDS, USER_TOPIC_FIELDS, merge_progress
+from search import SearchIndex, index_study_text
+from srs import ReviewQueue
+
+# --- STUDY STORE ---
+# Every read and write of a user's study data goes through a StudyStore.
+# * SessionStudyStore keeps the data only in the browser session (progress
+#   is lost when the tab closes unless it is saved to a file).
+# * SQLiteStudyStore also writes each change to a SQLite database, one row
+#   per edited field, keyed by profile and course. Ticking "Mark as Done"
+#   updates a single row instead of round-tripping the whole state.
+# Each store keeps a version number that changes on every change, so
+# anything derived from the whole state can be cached against it. Versions
+# come from one process-wide counter, so a store that replaces another
+# (entering a profile, switching profiles) never reuses its versions. Each
+# store also keeps a ProgressIndex of the done/confidence counts, a search
+# index of the user's notes and answers and a ReviewQueue of what's due
+# for review, all updated per topic or question.
+
+DEFAULT_DB_PATH = os.environ.get("STUDY_DB")
+
+_versions = itertools.count(1)
+
+# Values a topic or PYQ starts with; fields still at these values aren't stored.
+FIELD_DEFAULTS = {
+    "done": False,
+    "my_notes": "",
+    "my_links": [],
+    "my_photos_bytes": [],
+    "survey": None,
+    "srs": None,
+    "my_text": "",
+    "my_files": [],
+}
+
+
+class StudyStore:
+    """One user's study data for one course, plus the API to change it."""
+
+    def __init__(self, study_data):
+        self.data = study_data
+        self.version = next(_versions)
+        self.index = ProgressIndex(study_data)
+        self.text_index = SearchIndex()
+        index_study_text(self.text_index, study_data)
+        self.reviews = ReviewQueue(study_data)
+
+    def mark_dirty(self):
+        """Gives the data a new version after a change."""
+        self.version = next(_versions)
+
+    def set_topic_field(self, module_key, topic_name, field, value):
+        """Writes one topic field. Returns True if the value changed."""
+        topic_data = self.data["modules"][module_key][topic_name]
+        if topic_data.get(field) == value:
+            return False
+        topic_data[field] = value
+        stamp = topic_data.setdefault("updated", {})[field] = time.time()
+        if field in ("done", "survey"):
+            self.index.update_topic(module_key, topic_name, topic_data)
+        if field in ("done", "srs"):
+            self.reviews.update_topic(module_key, topic_name, topic_data)
+        elif field == "my_notes":
+            self.text_index.set_document(("topic", module_key, topic_name), value)
+        self._write_field("topic", module_key, topic_name, field, value, stamp)
+        self.mark_dirty()
+        return True
+
+    def set_pyq_field(self, module_key, index, field, value):
+        """Writes one PYQ answer field. Returns True if the value changed."""
+        q_data = self.data["pyqs"][module_key][index]
+        if q_data.get(field) == value:
+            return False
+        q_data[field] = value
+        stamp = q_data.setdefault("updated", {})[field] = time.time()
+        if field == "my_text":
+            self.text_index.set_document(("pyq", module_key, index), value)
+        if field in ("my_text", "my_files", "srs"):
+            self.reviews.update_pyq(module_key, index, q_data)
+        self._write_field("pyq", module_key, str(index), field, value, stamp)
+        self.mark_dirty()
+        return True
+
+    def replace(self, study_data):
+        """Replaces all of the user's data (e.g. when loading a file)."""
+        self.data = study_data
+        self.index.rebuild(study_data)
+        self.text_index = SearchIndex()
+        index_study_text(self.text_index, study_data)
+        self.reviews.rebuild(study_data)
+        self._write_all()
+        self.mark_dirty()
+
+    def merge(self, loaded):
+        """Merges loaded study data in; returns the changed entries."""
+        changed = merge_progress(self.data, loaded)
+        for kind, module_key, item in changed:
+            if kind == "topic":
+                topic_data = self.data["modules"][module_key][item]
+                self.index.update_topic(module_key, item, topic_data)
+                self.text_index.set_document(("topic", module_key, item), topic_data.get("my_notes"))
+                self.reviews.update_topic(module_key, item, topic_data)
+            else:
+                q_data = self.data["pyqs"][module_key][item]
+                self.text_index.set_document(("pyq", module_key, item), q_data.get("my_text"))
+                self.reviews.update_pyq(module_key, item, q_data)
+            self._write_entry(kind, module_key, item)
+        if changed:
+            self.mark_dirty()
+        return changed
+
+    # --- Persistence hooks (no-ops for the in-session store) ---
+
+    def _write_field(self, kind, module_key, item, field, value, stamp):
+        pass
+
+    def _write_entry(self, kind, module_key, item):
+        pass
+
+    def _write_all(self):
+        pass
+
+
+class SessionStudyStore(StudyStore):
+    """Keeps study data in the browser session only."""
+
+    persistent = False
+
+
+class SQLiteStudyStore(StudyStore):
+    """Keeps study data in the session and writes every change to SQLite."""
+
+    persistent = True
+
+    def __init__(self, pool, profile, course, template):
+        self.pool = pool
+        self.profile = profile
+        self.course = course
+        super().__init__(self._load(template))
+
+    def _load(self, template):
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                "SELECT kind, module, item, field, value, updated FROM study_fields WHERE profile = ? AND course = ?",
+                (self.profile, self.course),
+            ).fetchall()
+        for kind, module_key, item, field, value, stamp in rows:
+            entry = self._entry(template, kind, module_key, item)
+            if entry is None:
+                continue  # The syllabus no longer has this topic or question
+            entry[field] = json.loads(value)
+            entry.setdefault("updated", {})[field] = stamp
+        return template
+
+    @staticmethod
+    def _entry(study_data, kind, module_key, item):
+        if kind == "topic":
+            return study_data["modules"].get(module_key, {}).get(item)
+        questions = study_data["pyqs"].get(module_key, [])
+        index = int(item)
+        return questions[index] if index < len(questions) else None
+
+    def _write_field(self, kind, module_key, item, field, value, stamp):
+        with self.pool.connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO study_fields VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (self.profile, self.course, kind, module_key, item, field, json.dumps(value), stamp),
+            )
+
+    def _entry_rows(self, kind, module_key, item):
+        entry = self._entry(self.data, kind, module_key, str(item))
+        fields = USER_TOPIC_FIELDS if kind == "topic" else USER_PYQ_FIELDS
+        updated = entry.get("updated") or {}
+        for field in fields:
+            if field in FIELD_DEFAULTS and entry.get(field, FIELD_DEFAULTS[field]) != FIELD_DEFAULTS[field]:
+                yield (self.profile, self.course, kind, module_key, str(item), field,
+                       json.dumps(entry[field]), updated.get(field, 0))
+
+    def _write_entry(self, kind, module_key, item):
+        with self.pool.connection() as conn:
+            conn.execute(
+                "DELETE FROM study_fields WHERE profile = ? AND course = ? AND kind = ? AND module = ? AND item = ?",
+                (self.profile, self.course, kind, module_key, str(item)),
+            )
+            conn.executemany(
+                "INSERT INTO study_fields VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                list(self._entry_rows(kind, module_key, item)),
+            )
+
+    def _write_all(self):
+        rows = []
+        for module_key, topics in self.data["modules"].items():
+            for topic_name in topics:
+                rows.extend(self._entry_rows("topic", module_key, topic_name))
+        for module_key, questions in self.data["pyqs"].items():
+            for i in range(len(questions)):
+                rows.extend(self._entry_rows("pyq", module_key, i))
+        with self.pool.connection() as conn:
+            conn.execute(
+                "DELETE FROM study_fields WHERE profile = ? AND course = ?",
+                (self.profile, self.course),
+            )
+            conn.executemany("INSERT INTO study_fields VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+
+# --- CONNECTION POOL ---
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS study_fields (
+    profile TEXT NOT NULL,
+    course  TEXT NOT NULL,
+    kind    TEXT NOT NULL,   -- "topic" or "pyq"
+    module  TEXT NOT NULL,
+    item    TEXT NOT NULL,   -- topic name, or PYQ position
+    field   TEXT NOT NULL,
+    value   TEXT NOT NULL,   -- JSON
+    updated REAL NOT NULL,
+    PRIMARY KEY (profile, course, kind, module, item, field)
+)
+"""
+
+
+class SQLitePool:
+    """
+    A small pool of SQLite connections shared by every Streamlit session in
+    the process. Each connection is used by one thread at a time.
+    """
+
+    def __init__(self, path, size=4):
+        self.path = path
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._created = 0
+        self._size = size
+        with self.connection() as conn:
+            conn.execute(SCHEMA)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @contextmanager
+    def connection(self):
+        """Borrows a connection; commits on success and rolls back on error."""
+        conn = self._acquire()
+        try:
+            with conn:
+                yield conn
+        finally:
+            self._idle.put(conn)
+
+    def _acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._created < self._size:
+                self._created += 1
+                return self._connect()
+        return self._idle.get()
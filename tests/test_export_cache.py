@@ -0,0 +1,38 @@
+import json
+
+import pytest
+import streamlit as st
+
+import app
+from study_store import SQLiteStudyStore
+
+
+@pytest.fixture
+def course(tmp_path, monkeypatch):
+    """The CN course with a fresh database and an empty session."""
+    monkeypatch.setattr(app, "DEFAULT_DB_PATH", str(tmp_path / "study.db"))
+    app.get_sqlite_pool.clear()
+    st.session_state.clear()
+    yield app.get_courses()["cst303"]
+    st.session_state.clear()
+    app.get_sqlite_pool.clear()
+
+
+def test_export_after_entering_a_profile_includes_the_profiles_data(course):
+    module_key, topics = next(iter(course["modules"].items()))
+    first, second = list(topics)[:2]
+    # "alice" already has notes saved on the server
+    saved = SQLiteStudyStore(app.get_sqlite_pool(), "alice", course["code"], app.get_initial_data(course))
+    saved.set_topic_field(module_key, second, "my_notes", "alice's notes")
+
+    session_store = app.get_store(course)
+    session_store.set_topic_field(module_key, first, "done", True)
+    before = json.loads(app.progress_download(course, session_store)())
+    assert before["modules"][module_key][second]["my_notes"] == ""
+
+    st.session_state["profile"] = "alice"
+    store = app.get_store(course)
+    assert store is not session_store
+    after = json.loads(app.progress_download(course, store)())
+    assert after["modules"][module_key][first]["done"] is True
+    assert after["modules"][module_key][second]["my_notes"] == "alice's notes"
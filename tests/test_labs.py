@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from labs import crc, routing, subnet
+
+
+def test_crc_textbook_codeword():
+    generator = crc.parse_generator("x^3 + 1")
+    worked = crc.crc_encode("10011101", generator)
+    assert generator == "1001"
+    assert worked["remainder"] == "100"
+    assert worked["codeword"] == "10011101100"
+    assert not crc.crc_check("10011101100", generator)["error"]
+    assert crc.crc_check("10011111100", generator)["error"]
+    batch = crc.crc_encode_batch(crc.bits_array(["10011101"]), generator)
+    assert crc.bit_strings(batch) == ["10011101100"]
+
+
+def test_hamming_corrects_a_single_bit():
+    assert crc.hamming_encode("1011")["codeword"] == "0110011"
+    decoded = crc.hamming_decode("0110111")
+    assert decoded["syndrome"] == 5
+    assert decoded["corrected"] == "0110011" and decoded["data"] == "1011"
+
+
+def test_class_c_split_into_ten_subnets():
+    split = subnet.split_subnets(subnet.parse_ipv4("195.1.1.0"), 24, 10)
+    assert (split["borrowed"], split["prefix"], split["count"], split["hosts"]) == (4, 28, 16, 14)
+    assert subnet.format_ipv4(subnet.prefix_mask(28)) == "255.255.255.240"
+    second = split["subnets"][1]
+    assert [subnet.format_ipv4(second[field]) for field in ("network", "first_host", "last_host", "broadcast")] == [
+        "195.1.1.16", "195.1.1.17", "195.1.1.30", "195.1.1.31",
+    ]
+    assert len(subnet.split_subnets(subnet.parse_ipv4("10.0.0.0"), 8, 1 << 20, limit=5)["subnets"]) == 5
+
+
+def test_batch_answers_have_no_hosts_for_31_and_32():
+    table = subnet.network_table(np.array([subnet.parse_ipv4("10.0.0.5")] * 3, dtype=np.uint64), np.array([30, 31, 32]))
+    assert table["first_host"].tolist() == [subnet.parse_ipv4("10.0.0.5"), -1, -1]
+    assert table["hosts"].tolist() == [2, 0, 0]
+
+
+def chain_after_a_b_fails(technique):
+    """The A-B-C-D chain, converged, then A-B taken down; returns the tables after each round."""
+    names, links = routing.parse_links("A B 1\nB C 1\nC D 1")
+    dv = routing.DistanceVector(routing.cost_matrix(len(names), links), technique, infinity=routing.RIP_INFINITY)
+    dv.run()
+    assert dv.dist[3, 0] == 3
+    dv.set_link(0, 1, np.inf)
+    history = []
+    rounds = dv.run(history=history)
+    assert not np.isfinite(dv.dist[1:, 0]).any()
+    return rounds, [dist[2, 0] for dist, _ in history]
+
+
+def test_distance_vector_counts_to_infinity():
+    rounds, c_to_a = chain_after_a_b_fails("None")
+    # B and C keep learning the dead route from each other, two hops more each time
+    assert c_to_a[:5] == [2, 4, 4, 6, 6]
+    assert rounds >= routing.RIP_INFINITY - 2
+
+
+@pytest.mark.parametrize("technique", ["Split horizon", "Poison reverse"])
+def test_split_horizon_converges_quickly(technique):
+    rounds, _ = chain_after_a_b_fails(technique)
+    assert rounds <= routing.ROUTE_TIMEOUT
@@ -0,0 +1,115 @@
+import io
+import json
+import os
+import zipfile
+
+import pytest
+
+from content import load_course, new_study_data
+from json_stream import iter_b64_decode
+from media_store import MediaStore
+from progress_io import MEDIA_PREFIX, export_progress_json, export_progress_zip, load_progress, write_progress_json, write_progress_zip
+
+PNG = b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 40
+
+
+@pytest.fixture
+def course():
+    return load_course("cst303")
+
+
+@pytest.fixture
+def store(tmp_path):
+    return MediaStore(str(tmp_path / "media"))
+
+
+def first_topic(study_data):
+    module_key, topics = next(iter(study_data["modules"].items()))
+    return module_key, next(iter(topics))
+
+
+def saved_json(course, store):
+    """A JSON progress file with two photos on the first topic, as a dict."""
+    study_data = new_study_data(course)
+    module_key, topic = first_topic(study_data)
+    study_data["modules"][module_key][topic]["my_photos_bytes"] = [
+        store.put(PNG, "board.png", "image/png"),
+        store.put(b"second photo", "notes.png", "image/png"),
+    ]
+    out = io.BytesIO()
+    write_progress_json(study_data, store, out)
+    return json.loads(out.getvalue())
+
+
+@pytest.mark.parametrize("payload", ["iVBORw0KGgo=garbage", "!!!", "iVBORw0KGgo"])
+def test_corrupt_media_payload_skips_only_that_file(course, store, tmp_path, payload):
+    saved = saved_json(course, store)
+    module_key, topic = first_topic(saved)
+    saved["modules"][module_key][topic]["my_photos_bytes"][0]["b64"] = payload
+    saved["modules"][module_key][topic]["my_notes"] = "kept"
+
+    fresh = MediaStore(str(tmp_path / "other"))
+    loaded, warnings = load_progress(io.BytesIO(json.dumps(saved).encode()), fresh, new_study_data(course))
+
+    entry = loaded["modules"][module_key][topic]
+    assert [ref["name"] for ref in entry["my_photos_bytes"]] == ["notes.png"]
+    assert entry["my_notes"] == "kept"
+    assert len(warnings) == 1 and "board.png" in warnings[0]
+
+
+def test_b64_decode_rejects_data_after_padding_across_pieces():
+    with pytest.raises(ValueError):
+        list(iter_b64_decode(["iVBORw0KGgo=", "garb"]))
+    assert b"".join(iter_b64_decode(["iVBO", "Rw0KGg", "o="])) == PNG[:8]
+
+
+def saved_study_data(course, store):
+    study_data = new_study_data(course)
+    module_key, topic = first_topic(study_data)
+    entry = study_data["modules"][module_key][topic]
+    entry.update(done=True, my_notes="notes", my_links=["https://example.com"])
+    entry["my_photos_bytes"] = [store.put(PNG, "board.png", "image/png")]
+    pyq_module, questions = next(iter(study_data["pyqs"].items()))
+    questions[0]["my_text"] = "answer"
+    questions[0]["my_files"] = [store.put(b"%PDF-1.4 solution", "solution.pdf", "application/pdf")]
+    return study_data
+
+
+@pytest.mark.parametrize("export", [export_progress_json, export_progress_zip])
+def test_round_trip_restores_fields_and_media(course, store, tmp_path, export):
+    study_data = saved_study_data(course, store)
+    path = export(study_data, store)
+    fresh = MediaStore(str(tmp_path / "other"))
+    with open(path, "rb") as f:
+        loaded, warnings = load_progress(f, fresh, new_study_data(course))
+    os.remove(path)
+
+    assert warnings == []
+    module_key, topic = first_topic(study_data)
+    assert loaded["modules"][module_key][topic] == study_data["modules"][module_key][topic]
+    pyq_module = next(iter(study_data["pyqs"]))
+    assert loaded["pyqs"][pyq_module][0] == study_data["pyqs"][pyq_module][0]
+    photo = loaded["modules"][module_key][topic]["my_photos_bytes"][0]
+    with open(fresh.path(photo["hash"]), "rb") as f:
+        assert f.read() == PNG
+
+
+def test_zip_with_a_damaged_member_skips_only_that_file(course, store, tmp_path):
+    study_data = saved_study_data(course, store)
+    module_key, topic = first_topic(study_data)
+    photo = study_data["modules"][module_key][topic]["my_photos_bytes"][0]
+    out = io.BytesIO()
+    write_progress_zip(study_data, store, out)
+    damaged = io.BytesIO()
+    with zipfile.ZipFile(out) as source, zipfile.ZipFile(damaged, "w") as target:
+        for member in source.namelist():
+            data = source.read(member)
+            target.writestr(member, data[:-10] if member == MEDIA_PREFIX + photo["hash"] else data)
+
+    loaded, warnings = load_progress(damaged, MediaStore(str(tmp_path / "other")), new_study_data(course))
+
+    entry = loaded["modules"][module_key][topic]
+    assert entry["my_photos_bytes"] == [] and entry["my_notes"] == "notes"
+    pyq_module = next(iter(study_data["pyqs"]))
+    assert [ref["name"] for ref in loaded["pyqs"][pyq_module][0]["my_files"]] == ["solution.pdf"]
+    assert len(warnings) == 1 and "board.png" in warnings[0]
@@ -0,0 +1,40 @@
+from concurrent.futures import Future
+
+import pytest
+import streamlit as st
+
+import app
+from media_ingest import IngestJob
+
+
+@pytest.fixture
+def course():
+    st.session_state.clear()
+    yield app.get_courses()["cst303"]
+    st.session_state.clear()
+
+
+def finished_job(name, refs=None, error=None):
+    job = IngestJob(name)
+    job.future = Future()
+    if error is None:
+        job.future.set_result(refs)
+    else:
+        job.future.set_exception(error)
+    return job
+
+
+def test_finished_uploads_are_attached_without_their_placeholder(course):
+    store = app.get_store(course)
+    module_key, topics = next(iter(course["modules"].items()))
+    topic = next(iter(topics))
+    ref = {"hash": "ab" * 32, "name": "board.png", "mime": "image/png", "size": 3}
+    queued = IngestJob("slow.png")
+    queued.future = Future()
+    jobs = app.pending_uploads(course, "topic", module_key, topic)
+    jobs.extend([finished_job("board.png", [ref]), queued, finished_job("bad.png", error=ValueError("not an image"))])
+
+    app.attach_finished_uploads(course, store)
+
+    assert store.data["modules"][module_key][topic]["my_photos_bytes"] == [ref]
+    assert jobs == [queued]
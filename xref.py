@@ -0,0 +1,92 @@
+import math
+
+from search import tokenize
+
+# --- TOPIC <-> PYQ CROSS-REFERENCES ---
+# Links each PYQ to the topics it exercises by TF-IDF cosine similarity
+# between the question and each topic's text (name, definition, PYQ focus
+# and strategy; the PYQ focus usually quotes past questions). Computed once
+# per course when the pack is loaded, so the views only read the lists:
+# * course["pyqs"][module][i]["related_topics"]: [{"module", "topic", "score"}]
+# * course["modules"][module][topic]["related_pyqs"]: [{"module", "index", "score"}]
+# A PYQ can point at topics in other modules.
+
+TOPICS_PER_PYQ = 3
+MIN_SIMILARITY = 0.08
+# Topics after the best match are kept only if they score at least this
+# fraction of it.
+RELATIVE_CUTOFF = 0.6
+
+
+def terms(text):
+    """Search terms worth matching on: single letters and numbers in examples only add noise."""
+    return [term for term in tokenize(text) if len(term) >= 3 and not term.isdigit()]
+
+
+def tfidf_vectors(documents):
+    """Returns one L2-normalized {term: weight} vector per token list."""
+    document_frequency = {}
+    for document in documents:
+        for term in set(document):
+            document_frequency[term] = document_frequency.get(term, 0) + 1
+    count = len(documents)
+    vectors = []
+    for document in documents:
+        counts = {}
+        for term in document:
+            counts[term] = counts.get(term, 0) + 1
+        vector = {
+            term: (1 + math.log(freq)) * math.log(1 + count / document_frequency[term])
+            for term, freq in counts.items()
+        }
+        norm = math.sqrt(sum(weight * weight for weight in vector.values())) or 1.0
+        vectors.append({term: weight / norm for term, weight in vector.items()})
+    return vectors
+
+
+def cosine(a, b):
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(weight * b.get(term, 0.0) for term, weight in a.items())
+
+
+def link_pyqs_to_topics(course):
+    """Adds "related_topics" to every PYQ and "related_pyqs" to every topic of a loaded course."""
+    topic_keys = []
+    documents = []
+    for module_key, topics in course["modules"].items():
+        for topic_name, topic in topics.items():
+            topic["related_pyqs"] = []
+            topic_keys.append((module_key, topic_name))
+            # The name is repeated so it counts for more than any one sentence
+            documents.append(terms(" ".join([topic_name, topic_name, topic["definition"], topic["pyq_focus"], topic["strategy"]])))
+    pyq_keys = []
+    for module_key, questions in course["pyqs"].items():
+        for i, question in enumerate(questions):
+            pyq_keys.append((module_key, i))
+            documents.append(terms(question["q"]))
+
+    vectors = tfidf_vectors(documents)
+    topic_vectors, pyq_vectors = vectors[:len(topic_keys)], vectors[len(topic_keys):]
+    for (module_key, i), pyq_vector in zip(pyq_keys, pyq_vectors):
+        scored = sorted(
+            ((cosine(pyq_vector, topic_vector), key) for key, topic_vector in zip(topic_keys, topic_vectors)),
+            key=lambda pair: pair[0],
+            reverse=True,
+        )
+        best = scored[0][0] if scored else 0.0
+        related = [
+            (score, key) for score, key in scored[:TOPICS_PER_PYQ]
+            if score >= MIN_SIMILARITY and score >= RELATIVE_CUTOFF * best
+        ]
+        course["pyqs"][module_key][i]["related_topics"] = [
+            {"module": topic_module, "topic": topic_name, "score": round(score, 3)}
+            for score, (topic_module, topic_name) in related
+        ]
+        for score, (topic_module, topic_name) in related:
+            course["modules"][topic_module][topic_name]["related_pyqs"].append(
+                {"module": module_key, "index": i, "score": round(score, 3)}
+            )
+    for topics in course["modules"].values():
+        for topic in topics.values():
+            topic["related_pyqs"].sort(key=lambda link: link["score"], reverse=True)